@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose: Measures sorting, dict insertion and bisection of BaseTS timestamps against plain ints
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+import bisect
+import random
+import timeit
+from typing import Any, Callable, Dict, List, Sequence
+
+from tsx import TS, iTS, iTSms, iTSus, iTSns
+
+N = 200_000
+N_SEARCHES = 50_000
+
+
+def _best(fn: Callable[[], Any], repeat: int = 3) -> float:
+    """Returns the best run time of fn, in milliseconds"""
+    return min(timeit.repeat(fn, number=1, repeat=repeat)) * 1e3
+
+
+def _sort_mixed(stamps_ms: Sequence[iTSms], stamps_ns: Sequence[iTSns]) -> float:
+    mixed = [ts for pair in zip(stamps_ms, stamps_ns) for ts in pair]
+    return _best(lambda: sorted(mixed))
+
+
+def main() -> None:
+    rnd = random.Random(42)
+    base_ns = 1_700_000_000 * 1_000_000_000
+    values_ns = [base_ns + rnd.randrange(10 ** 15) for _ in range(N)]
+    columns: Dict[str, List[Any]] = {
+        "int": values_ns,
+        "iTS": [iTS(v // 1_000_000_000) for v in values_ns],
+        "iTSms": [iTSms(v // 1_000_000) for v in values_ns],
+        "iTSus": [iTSus(v // 1_000) for v in values_ns],
+        "iTSns": [iTSns(v) for v in values_ns],
+        "TS": [TS(v // 1_000 / 1_000_000) for v in values_ns],
+    }
+    print(f"{N} timestamps, {N_SEARCHES} bisections; best of 3 in ms")
+    print(f"{'class':<8}{'sort':>10}{'dict insert':>14}{'dict lookup':>14}{'bisect':>10}")
+    for name, stamps in columns.items():
+        ordered = sorted(stamps)
+        queries = rnd.sample(stamps, N_SEARCHES)
+        sort_ms = _best(lambda: sorted(stamps))
+        insert_ms = _best(lambda: {ts: i for i, ts in enumerate(stamps)})
+        table = {ts: i for i, ts in enumerate(stamps)}
+        lookup_ms = _best(lambda: [table[ts] for ts in queries])
+        bisect_ms = _best(lambda: [bisect.bisect_left(ordered, ts) for ts in queries])
+        print(f"{name:<8}{sort_ms:>10.1f}{insert_ms:>14.1f}{lookup_ms:>14.1f}{bisect_ms:>10.1f}")
+    print(f"{'iTSms+iTSns sort (mixed classes)':<36}{_sort_mixed(columns['iTSms'][:N // 2], columns['iTSns'][:N // 2]):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose: Compares the speed and the memory per instance of TSInterval and nsInterval
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from tsx import TSInterval, iTSms, iTSns
+from tsx.ts import nsInterval
+
+N_INSTANCES = 100_000
+
+
+def _bench(stmt: str, namespace: Dict[str, Any], number: int = 200_000) -> float:
+    """Returns the best time per call, in nanoseconds"""
+    return min(timeit.repeat(stmt, globals=namespace, number=number, repeat=5)) / number * 1e9
+
+
+def _bytes_per_instance(factory: Callable[[int], object]) -> float:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory(i) for i in range(N_INSTANCES)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # the list holding the objects is not part of the instances
+    size -= objects.__sizeof__()
+    return size / N_INSTANCES
+
+
+def main() -> None:
+    a_ts, b_ts = TSInterval(iTSms(1_000), iTSms(5_000)), TSInterval(iTSms(3_000), iTSms(9_000))
+    a_ns, b_ns = nsInterval.from_interval(a_ts), nsInterval.from_interval(b_ts)
+    namespace = {"a_ts": a_ts, "b_ts": b_ts, "a_ns": a_ns, "b_ns": b_ns, "t": iTSms(2_000), "t_ns": 2_000_000_000,
+                 "TSInterval": TSInterval, "nsInterval": nsInterval, "iTSms": iTSms, "s": iTSms(1_000), "e": iTSms(5_000)}
+    cases = [
+        ("construct", "TSInterval(s, e)", "nsInterval(s, e)"),
+        ("contains(BaseTS)", "a_ts.contains(t)", "a_ns.contains(t)"),
+        ("contains(int ns)", None, "a_ns.contains(t_ns)"),
+        ("overlaps", "a_ts.overlaps(b_ts)", "a_ns.overlaps(b_ns)"),
+        ("intersection", "a_ts.intersection(b_ts)", "a_ns.intersection(b_ns)"),
+        ("__eq__", "a_ts == b_ts", "a_ns == b_ns"),
+        ("__lt__", "a_ts < b_ts", "a_ns < b_ns"),
+        ("__hash__", "hash(a_ts)", "hash(a_ns)"),
+        ("duration", "a_ts.duration", "a_ns.duration"),
+    ]
+    print(f"{'method':<20}{'TSInterval ns':>16}{'nsInterval ns':>16}{'speedup':>10}")
+    for name, ts_stmt, ns_stmt in cases:
+        ns_time = _bench(ns_stmt, namespace)
+        if ts_stmt is None:
+            print(f"{name:<20}{'-':>16}{ns_time:>16.0f}{'-':>10}")
+            continue
+        ts_time = _bench(ts_stmt, namespace)
+        print(f"{name:<20}{ts_time:>16.0f}{ns_time:>16.0f}{ts_time / ns_time:>9.1f}x")
+
+    sorting = [TSInterval(iTSns((i * 7919) % N_INSTANCES), iTSns((i * 7919) % N_INSTANCES + 10)) for i in range(N_INSTANCES)]
+    sorting_ns = [nsInterval.from_interval(interval) for interval in sorting]
+    ts_time = min(timeit.repeat(lambda: sorted(sorting), number=1, repeat=3))
+    ns_time = min(timeit.repeat(lambda: sorted(sorting_ns), number=1, repeat=3))
+    print(f"{'sort 100k':<20}{ts_time * 1e3:>14.1f}ms{ns_time * 1e3:>14.1f}ms{ts_time / ns_time:>9.1f}x")
+
+    ts_bytes = _bytes_per_instance(lambda i: TSInterval(iTSms(i), iTSms(i + 1_000)))
+    ns_bytes = _bytes_per_instance(lambda i: nsInterval(iTSms(i), iTSms(i + 1_000)))
+    print(f"{'bytes per instance':<20}{ts_bytes:>16.0f}{ns_bytes:>16.0f}{ts_bytes / ns_bytes:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
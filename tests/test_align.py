@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose:
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+import unittest
+from datetime import timedelta
+from unittest import TestCase
+
+import numpy as np
+
+from tsx import iTS, iTSms, iTSns, TSInterval
+from tsx.align import asof_join, make_grid, reindex, time_weighted_mean
+from tsx.ts import dTS
+
+MS = 1_000_000
+
+
+class TestAsofJoin(TestCase):
+    def setUp(self):
+        self.quotes = np.array([10, 20, 20, 30], dtype=np.int64) * MS
+        self.trades = np.array([5, 10, 15, 20, 25, 35], dtype=np.int64) * MS
+
+    def test_backward(self):
+        idx = asof_join(self.trades, self.quotes)
+        np.testing.assert_array_equal(idx, [-1, 0, 0, 2, 2, 3])
+        self.assertEqual(idx.dtype, np.int64)
+
+    def test_forward(self):
+        idx = asof_join(self.trades, self.quotes, direction="forward")
+        np.testing.assert_array_equal(idx, [0, 0, 1, 1, 3, -1])
+
+    def test_nearest(self):
+        idx = asof_join(self.trades, self.quotes, direction="nearest")
+        np.testing.assert_array_equal(idx, [0, 0, 0, 2, 2, 3])
+
+    def test_exact_matches_excluded(self):
+        idx = asof_join(self.trades, self.quotes, allow_exact_matches=False)
+        np.testing.assert_array_equal(idx, [-1, -1, 0, 0, 2, 3])
+        idx = asof_join(self.trades, self.quotes, direction="forward", allow_exact_matches=False)
+        np.testing.assert_array_equal(idx, [0, 1, 1, 3, 3, -1])
+
+    def test_tolerance(self):
+        for tolerance in (dTS("3ms"), timedelta(milliseconds=3), 3 * MS):
+            idx = asof_join(self.trades, self.quotes, tolerance=tolerance)
+            np.testing.assert_array_equal(idx, [-1, 0, -1, 2, -1, -1])
+
+    def test_mixed_precisions(self):
+        trades = [iTSms(int(ts) // MS) for ts in self.trades]
+        quotes = [iTSns(int(ts)) for ts in self.quotes]
+        np.testing.assert_array_equal(asof_join(trades, quotes), asof_join(self.trades, self.quotes))
+        np.testing.assert_array_equal(asof_join(self.trades // MS, self.quotes, left_prec="ms"), asof_join(self.trades, self.quotes))
+
+    def test_unsorted_right_maps_back_to_original_positions(self):
+        quotes = self.quotes[[3, 0, 2, 1]]
+        idx = asof_join(self.trades, quotes)
+        np.testing.assert_array_equal(quotes[idx[idx >= 0]], self.quotes[[0, 0, 2, 2, 3]])
+
+    def test_empty_right(self):
+        idx = asof_join(self.trades, np.empty(0, dtype=np.int64), direction="nearest", tolerance=dTS("1s"))
+        np.testing.assert_array_equal(idx, [-1] * 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+class TestReindex(TestCase):
+    def setUp(self):
+        self.ts = np.array([100, 250, 400], dtype=np.int64) * MS
+        self.values = np.array([1.0, 4.0, 10.0])
+        self.interval = TSInterval(iTSms(0), iTSms(500))
+        self.grid = make_grid(self.interval, dTS("100ms"))
+
+    def test_make_grid(self):
+        np.testing.assert_array_equal(self.grid, np.arange(0, 500, 100) * MS)
+        np.testing.assert_array_equal(make_grid(self.interval, timedelta(milliseconds=100)), self.grid)
+        with self.assertRaises(ValueError):
+            make_grid(self.interval, 0)
+
+    def test_ffill(self):
+        res = reindex(self.ts, self.values, self.grid)
+        np.testing.assert_array_equal(res, [np.nan, 1.0, 1.0, 4.0, 10.0])
+
+    def test_ffill_with_limit(self):
+        res = reindex(self.ts, self.values, self.grid, limit=dTS("60ms"))
+        np.testing.assert_array_equal(res, [np.nan, 1.0, np.nan, 4.0, 10.0])
+
+    def test_bfill(self):
+        res = reindex(self.ts, self.values, self.grid, method="bfill")
+        np.testing.assert_array_equal(res, [1.0, 1.0, 4.0, 10.0, 10.0])
+
+    def test_nearest(self):
+        res = reindex(self.ts, self.values, self.grid, method="nearest")
+        np.testing.assert_array_equal(res, [1.0, 1.0, 4.0, 4.0, 10.0])
+
+    def test_linear(self):
+        res = reindex(self.ts, self.values, self.grid, method="linear")
+        np.testing.assert_allclose(res, [np.nan, 1.0, 3.0, 6.0, 10.0])
+        res = reindex(self.ts, self.values, self.grid, method="linear", limit=dTS("60ms"))
+        np.testing.assert_allclose(res, [np.nan, 1.0, np.nan, np.nan, 10.0])
+
+    def test_int_values_with_int_fill_value_keep_dtype(self):
+        res = reindex([iTSms(0), iTSms(300)], np.array([1, 2]), self.grid, method="bfill", fill_value=-1)
+        self.assertEqual(res.dtype, np.int64)
+        np.testing.assert_array_equal(res, [1, 2, 2, 2, -1])
+
+
+class TestTimeWeightedMean(TestCase):
+    def setUp(self):
+        # value 2 during [0, 10s), 4 during [10s, 40s), 1 from 40s on
+        self.ts = np.array([0, 10, 40], dtype=np.int64) * 1_000_000_000
+        self.values = np.array([2.0, 4.0, 1.0])
+
+    def test_windows_as_intervals(self):
+        windows = [TSInterval(iTS(0), iTS(40)), TSInterval(iTS(5), iTS(15)), TSInterval(iTS(30), iTS(60)), TSInterval(iTS(50), iTS(60))]
+        res = time_weighted_mean(self.ts, self.values, windows)
+        np.testing.assert_allclose(res, [(20 + 120) / 40, (10 + 20) / 10, (40 + 20) / 30, 1.0])
+
+    def test_windows_as_arrays(self):
+        starts = np.array([0, 5]) * 1_000_000_000
+        ends = np.array([40, 15]) * 1_000_000_000
+        by_pair = time_weighted_mean(self.ts, self.values, (starts, ends))
+        by_2d = time_weighted_mean(self.ts, self.values, np.stack((starts, ends), axis=1))
+        np.testing.assert_allclose(by_pair, [3.5, 3.0])
+        np.testing.assert_allclose(by_2d, by_pair)
+
+    def test_window_before_first_sample(self):
+        windows = [TSInterval(iTS(-20), iTS(-10)), TSInterval(iTS(-10), iTS(10))]
+        res = time_weighted_mean(self.ts, self.values, windows)
+        self.assertTrue(np.isnan(res[0]))
+        self.assertEqual(res[1], 2.0)
+
+    def test_unsorted_and_mixed_precision_samples(self):
+        ts = [iTSms(40_000), iTS(0), iTSns(10 * 1_000_000_000)]
+        res = time_weighted_mean(ts, [1.0, 2.0, 4.0], [TSInterval(iTS(0), iTS(40))])
+        np.testing.assert_allclose(res, [3.5])
+
+    def test_precision_with_large_offset(self):
+        n = 1_000_000
+        ts = 1_700_000_000 * 1_000_000_000 + np.arange(n, dtype=np.int64) * 1_000_000_000
+        values = np.full(n, 1e6 + 0.123)
+        values[::2] += 1.0
+        # 1us windows inside one sample, and windows spanning whole samples at the end of the series
+        starts = np.array([ts[-10] + 5, ts[-11] + 5, ts[-4]])
+        ends = np.array([ts[-10] + 1005, ts[-11] + 1005, ts[-2]])
+        res = time_weighted_mean(ts, values, (starts, ends))
+        self.assertEqual(res[0], values[-10])
+        self.assertEqual(res[1], values[-11])
+        self.assertAlmostEqual(res[2], 1e6 + 0.623, places=6)
+
+    def test_no_samples(self):
+        res = time_weighted_mean(np.empty(0, dtype=np.int64), np.empty(0), [TSInterval(iTS(0), iTS(1))])
+        self.assertTrue(np.isnan(res[0]))
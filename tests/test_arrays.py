@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose:
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+import unittest
+from datetime import datetime, date, timezone, timedelta
+from unittest import TestCase
+
+import numpy as np
+
+from tsx import TS, iTS, iTSms, iTSus, iTSns
+from tsx.arrays import unique, dedupe, round_to_prec, to_ns_array, convert
+
+SCALAR_CONVERSIONS = {"s": "as_sec", "ms": "as_msec", "us": "as_usec", "ns": "as_nsec"}
+
+
+class TestRoundToPrec(TestCase):
+    def test_matches_scalar_conversions(self):
+        rng = np.random.default_rng(11)
+        base = 1_700_000_000_000_000_000
+        samples = {
+            "ns": base + rng.integers(-10 ** 12, 10 ** 12, size=500),
+            "us": base // 1_000 + rng.integers(-10 ** 9, 10 ** 9, size=500),
+            "ms": base // 1_000_000 + rng.integers(-10 ** 6, 10 ** 6, size=500),
+            "s": base // 1_000_000_000 + rng.integers(-10 ** 3, 10 ** 3, size=500),
+        }
+        # include exact halves, which are where the rounding rules differ
+        samples["ns"][:3] = [base + 500, base + 500_000, base + 1_500_000]
+        samples["us"][:2] = [base // 1_000 + 500, base // 1_000 + 1_500]
+        samples["ms"][:2] = [base // 1_000_000 + 500, base // 1_000_000 + 1_500]
+        classes = {"s": iTS, "ms": iTSms, "us": iTSus, "ns": iTSns}
+        for from_prec, values in samples.items():
+            for to_prec, method in SCALAR_CONVERSIONS.items():
+                with self.subTest(from_prec=from_prec, to_prec=to_prec):
+                    expected = [int(getattr(classes[from_prec](int(v)), method)()) for v in values]
+                    np.testing.assert_array_equal(round_to_prec(values, from_prec, to_prec), expected)
+
+    def test_invalid_precision(self):
+        with self.assertRaises(ValueError):
+            round_to_prec(np.arange(3), "ns", "min")
+
+
+class TestConvert(TestCase):
+    CLASSES = {"s": iTS, "ms": iTSms, "us": iTSus, "ns": iTSns}
+
+    def test_matches_scalar_rounding(self):
+        values = np.array([0, 1, 499, 500, 501, 999, 1_000, 1_500, 2_500, -1, -500, -1_500, -2_500, 1_234_567_891, -987_654_321],
+                          dtype=np.int64)
+        for from_prec, cls in self.CLASSES.items():
+            for to_prec, method in SCALAR_CONVERSIONS.items():
+                for rounding in ("half_up", "half_even", "floor", "ceil"):
+                    with self.subTest(from_prec=from_prec, to_prec=to_prec, rounding=rounding):
+                        res = convert(values, from_prec, to_prec, rounding)
+                        expected = [int(getattr(cls(int(v)), method)(rounding)) for v in values]
+                        self.assertEqual(res.tolist(), expected)
+
+    def test_modes(self):
+        values = np.array([1_500, 2_500, -1_500, 1_001], dtype=np.int64)
+        self.assertEqual(convert(values, "us", "ms").tolist(), [2, 3, -1, 1])
+        self.assertEqual(convert(values, "us", "ms", "half_even").tolist(), [2, 2, -2, 1])
+        self.assertEqual(convert(values, "us", "ms", "floor").tolist(), [1, 2, -2, 1])
+        self.assertEqual(convert(values, "us", "ms", "ceil").tolist(), [2, 3, -1, 2])
+
+    def test_legacy_rounding(self):
+        values = np.array([1_500_500, 123_500], dtype=np.int64)
+        np.testing.assert_array_equal(convert(values, "ns", "us", None), round_to_prec(values, "ns", "us"))
+
+    def test_overflow(self):
+        big = np.array([np.iinfo(np.int64).max // 1_000 + 1], dtype=np.int64)
+        with self.assertRaises(OverflowError):
+            convert(big, "ms", "us")
+        with self.assertRaises(OverflowError):
+            convert(-big, "s", "ns")
+        self.assertEqual(convert(big - 1, "ms", "us")[0], (int(big[0]) - 1) * 1_000)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            convert([1], "ns", "ms", "up")
+        for from_prec, to_prec in (("s", "ns"), ("ms", "ms")):
+            with self.assertRaises(ValueError):
+                convert([1], from_prec, to_prec, "bogus")
+        for cls in self.CLASSES.values():
+            for method in SCALAR_CONVERSIONS.values():
+                with self.subTest(cls=cls.__name__, method=method), self.assertRaises(ValueError):
+                    getattr(cls(1), method)("bogus")
+        with self.assertRaises(ValueError):
+            convert([1], "ns", "min")
+
+
+class TestUnique(TestCase):
+    def test_sorted_input(self):
+        ts = np.array([1_000_000, 1_000_400, 1_000_600, 2_000_000, 2_000_001], dtype=np.int64)
+        values, index, inverse, counts = unique(ts, prec="ms", return_index=True, return_inverse=True, return_counts=True)
+        np.testing.assert_array_equal(values, [1, 2])
+        np.testing.assert_array_equal(index, [0, 3])
+        np.testing.assert_array_equal(inverse, [0, 0, 0, 1, 1])
+        np.testing.assert_array_equal(counts, [3, 2])
+
+    def test_unsorted_input_matches_numpy(self):
+        rng = np.random.default_rng(5)
+        ts = rng.integers(0, 10 ** 10, size=1000)
+        values, inverse, counts = unique(ts, prec="s", return_inverse=True, return_counts=True)
+        expected = np.unique(round_to_prec(ts, "ns", "s"), return_inverse=True, return_counts=True)
+        for actual, exp in zip((values, inverse, counts), expected):
+            np.testing.assert_array_equal(actual, exp)
+
+    def test_sequence_of_its_uses_its_precision(self):
+        ts = [iTSus(1_000_400), iTSus(1_000_600), iTSus(1_000_100)]
+        np.testing.assert_array_equal(unique(ts, prec="ms"), [1_000, 1_001])
+        np.testing.assert_array_equal(unique([iTSus(5), iTSns(5_000)], prec="us"), [5])
+
+
+class TestDedupe(TestCase):
+    def test_raw_ints(self):
+        ts = [1_000_000, 1_400_000, 2_000_000, 1_100_000, 999_999_999]
+        self.assertEqual(list(dedupe(ts, prec="ms")), [1, 2, 1000])
+
+    def test_its_elements(self):
+        ts = [iTSns(1_500), iTSns(1_501), iTSus(2), iTSms(1), iTSus(1_000)]
+        self.assertEqual(list(dedupe(ts, prec="us")), [1, 2, 1_000])
+
+    def test_is_lazy(self):
+        it = dedupe(iter(range(0, 10 ** 18, 10 ** 6)), prec="ms")
+        self.assertEqual(next(it), 0)
+        self.assertEqual(next(it), 1)
+
+
+class TestToNsArray(TestCase):
+    def test_each_element_matches_its_constructor(self):
+        seq = [
+            iTS(1_700_000_000), iTSms(1_700_000_000_123), iTSus(1_700_000_000_123_456), iTSns(1_700_000_000_123_456_789),
+            TS(1_700_000_000.123456),
+            "2023-11-14T22:13:20.123456789Z", "2023-11-14", "2023-11-14T22:13:20+02:00",
+            datetime(2023, 11, 14, 22, 13, 20, 123456, tzinfo=timezone.utc), datetime(2023, 11, 14, 22, 13, 20, 5),
+            datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone(timedelta(hours=-5))),
+            date(2023, 11, 14),
+            np.datetime64("2023-11-14T22:13:20.123456789"), np.datetime64("2023-11-14", "D"),
+            1_700_000_000, np.int64(1_700_000_001), 1_700_000_000.5, np.float64(1_700_000_000.25),
+        ]
+        expected = [
+            *(int(ts.as_nsec()) for ts in seq[:5]),
+            *(int(iTSns(s)) for s in seq[5:8]),
+            *(int(TS(dt).as_nsec()) for dt in seq[8:12]),
+            1_700_000_000_123_456_789, 1_699_920_000_000_000_000,
+            1_700_000_000 * 10 ** 9, 1_700_000_001 * 10 ** 9, int(TS(1_700_000_000.5).as_nsec()), int(TS(1_700_000_000.25).as_nsec()),
+        ]
+        res = to_ns_array(seq)
+        self.assertEqual(res.dtype, np.int64)
+        self.assertEqual(res.tolist(), expected)
+
+    def test_default_prec_and_utc(self):
+        np.testing.assert_array_equal(to_ns_array([1, 2.5], default_prec="ms"), [1_000_000, 2_500_000])
+        self.assertEqual(to_ns_array([1.0000005], default_prec="ns").tolist(), [int(TS(1.0000005, prec="ns").as_nsec())])
+        self.assertEqual(to_ns_array(["2023-11-14T10:00:00"], utc=False).tolist(), [int(iTSns("2023-11-14T10:00:00", utc=False))])
+        self.assertEqual(to_ns_array([date(2023, 11, 14)], utc=False).tolist(), [int(TS(date(2023, 11, 14), utc=False).as_nsec())])
+
+    def test_numpy_arrays(self):
+        np.testing.assert_array_equal(to_ns_array(np.array([1, 2]), default_prec="us"), [1_000, 2_000])
+        np.testing.assert_array_equal(to_ns_array(np.array([1.5])), [1_500_000_000])
+        np.testing.assert_array_equal(to_ns_array(np.array(["1970-01-01T00:00:01"], dtype="datetime64[s]")), [10 ** 9])
+        np.testing.assert_array_equal(to_ns_array(np.array([iTSms(1), 2], dtype=object)), [10 ** 6, 2 * 10 ** 9])
+
+    def test_empty_and_invalid(self):
+        self.assertEqual(to_ns_array([]).size, 0)
+        with self.assertRaises(TypeError):
+            to_ns_array([1, None])
+        with self.assertRaises(TypeError):
+            to_ns_array([True])
+        with self.assertRaises(ValueError):
+            to_ns_array([1], default_prec="min")
+
+    def test_out_of_range_raises(self):
+        with self.assertRaises(OverflowError):
+            to_ns_array([1e18])
+        with self.assertRaises(OverflowError):
+            to_ns_array(np.array([2 ** 62]), "s")
+        with self.assertRaises(OverflowError):
+            to_ns_array([-2 ** 62], "ms")
+        with self.assertRaises(OverflowError):
+            to_ns_array([iTSms(2 ** 62)])
+        with self.assertRaises(OverflowError):
+            to_ns_array(np.array([-1e13]), "s")
+        self.assertEqual(to_ns_array([9_223_372_036]).tolist(), [9_223_372_036 * 10 ** 9])
+        self.assertEqual(to_ns_array(np.array([2 ** 62]), "ns").tolist(), [2 ** 62])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose:
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+import unittest
+from unittest import TestCase
+
+import numpy as np
+
+from tsx import iTSms, iTSns
+from tsx.bucket import bucket_aggregate, build_bars, BarBuilder
+from tsx.ts import dTS
+
+MIN_NS = 60 * 1_000_000_000
+
+
+class TestBucketAggregate(TestCase):
+    def test_sorted_minute_buckets(self):
+        ts = np.array([0, 10_000, 59_999, 60_000, 185_000], dtype=np.int64)
+        values = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+        starts, res = bucket_aggregate(ts, values, 60_000)
+        np.testing.assert_array_equal(starts, [0, 60_000, 180_000])
+        np.testing.assert_array_equal(res["count"], [3, 1, 1])
+        np.testing.assert_array_equal(res["sum"], [6.0, 4.0, 5.0])
+        np.testing.assert_array_equal(res["min"], [1.0, 4.0, 5.0])
+        np.testing.assert_array_equal(res["max"], [3.0, 4.0, 5.0])
+        np.testing.assert_array_equal(res["first"], [1.0, 4.0, 5.0])
+        np.testing.assert_array_equal(res["last"], [3.0, 4.0, 5.0])
+
+    def test_unsorted_input_orders_first_last_by_time(self):
+        ts = np.array([50, 5, 120, 10], dtype=np.int64)
+        values = np.array([4, 1, 7, 2])
+        starts, res = bucket_aggregate(ts, values, 60, aggs=("first", "last", "mean"))
+        np.testing.assert_array_equal(starts, [0, 120])
+        np.testing.assert_array_equal(res["first"], [1, 7])
+        np.testing.assert_array_equal(res["last"], [4, 7])
+        np.testing.assert_allclose(res["mean"], [7 / 3, 7.0])
+
+    def test_matches_floor_for_negative_timestamps(self):
+        ts_list = [iTSms(-1), iTSms(-60_000), iTSms(-60_001), iTSms(1)]
+        starts, res = bucket_aggregate(ts_list, None, 60_000, aggs=("count",))
+        expected = sorted({int(ts.floor(60_000)) for ts in ts_list})
+        np.testing.assert_array_equal(starts, expected)
+        np.testing.assert_array_equal(res["count"], [1, 2, 1])
+
+    def test_empty_input(self):
+        starts, res = bucket_aggregate(np.empty(0, dtype=np.int64), np.empty(0), 10)
+        self.assertEqual(starts.size, 0)
+        self.assertEqual(res["sum"].size, 0)
+        self.assertEqual(res["count"].size, 0)
+
+    def test_invalid_arguments(self):
+        ts = np.arange(3, dtype=np.int64)
+        with self.assertRaises(ValueError):
+            bucket_aggregate(ts, None, 10, aggs=("sum",))
+        with self.assertRaises(ValueError):
+            bucket_aggregate(ts, np.ones(3), 10, aggs=("median",))
+        with self.assertRaises(ValueError):
+            bucket_aggregate(ts, np.ones(2), 10)
+        with self.assertRaises(ValueError):
+            bucket_aggregate(ts, np.ones(3), 0)
+
+
+class TestBars(TestCase):
+    def setUp(self):
+        base = int(iTSns("2024-03-01T10:00:00Z"))
+        self.ts = np.array([base, base + 10 * 10 ** 9, base + 50 * 10 ** 9, base + MIN_NS, base + 3 * MIN_NS + 1], dtype=np.int64)
+        self.price = np.array([10.0, 12.0, 9.0, 11.0, 13.0])
+        self.size = np.array([1.0, 2.0, 1.0, 5.0, 0.0])
+        self.base = base
+
+    def test_build_bars_minute(self):
+        bars = build_bars(self.ts, self.price, self.size, dTS("1m"))
+        np.testing.assert_array_equal(bars.start, [self.base, self.base + MIN_NS, self.base + 3 * MIN_NS])
+        np.testing.assert_array_equal(bars.open, [10.0, 11.0, 13.0])
+        np.testing.assert_array_equal(bars.high, [12.0, 11.0, 13.0])
+        np.testing.assert_array_equal(bars.low, [9.0, 11.0, 13.0])
+        np.testing.assert_array_equal(bars.close, [9.0, 11.0, 13.0])
+        np.testing.assert_array_equal(bars.volume, [4.0, 5.0, 0.0])
+        np.testing.assert_allclose(bars.vwap[:2], [(10 + 24 + 9) / 4, 11.0])
+        self.assertTrue(np.isnan(bars.vwap[2]))
+
+    def test_int_unit_and_str_unit_agree(self):
+        by_int = build_bars(self.ts, self.price, self.size, MIN_NS)
+        by_str = build_bars(list(map(iTSns, self.ts)), self.price, self.size, "1m")
+        np.testing.assert_array_equal(by_int.start, by_str.start)
+        np.testing.assert_array_equal(by_int.close, by_str.close)
+
+    def test_daily_bars_in_exchange_tz(self):
+        ts = np.array([int(iTSns("2024-03-10T04:59:00Z")), int(iTSns("2024-03-10T05:00:00Z")), int(iTSns("2024-03-11T03:59:00Z")),
+                       int(iTSns("2024-03-11T04:00:00Z"))], dtype=np.int64)
+        bars = build_bars(ts, [1, 2, 3, 4], [1, 1, 1, 1], "1d", tz="America/New_York")
+        expected = [iTSns("2024-03-09T05:00:00Z"), iTSns("2024-03-10T05:00:00Z"), iTSns("2024-03-11T04:00:00Z")]
+        np.testing.assert_array_equal(bars.start, [int(ts) for ts in expected])
+        np.testing.assert_array_equal(bars.close, [1, 3, 4])
+
+    def test_daily_bars_when_dst_starts_at_midnight(self):
+        # Sao Paulo skipped 2018-11-04 00:00..01:00 local: that day starts at 01:00-02:00 (03:00Z)
+        ts = np.array([int(iTSns(s)) for s in ("2018-11-04T02:30:00Z", "2018-11-04T03:30:00Z", "2018-11-04T10:00:00Z",
+                                                "2018-11-05T01:00:00Z", "2018-11-05T02:30:00Z")], dtype=np.int64)
+        bars = build_bars(ts, [1, 2, 3, 4, 5], [1, 1, 1, 1, 1], "1d", tz="America/Sao_Paulo")
+        expected = [iTSns("2018-11-03T03:00:00Z"), iTSns("2018-11-04T03:00:00Z"), iTSns("2018-11-05T02:00:00Z")]
+        np.testing.assert_array_equal(bars.start, [int(ts) for ts in expected])
+        np.testing.assert_array_equal(bars.close, [1, 4, 5])
+        np.testing.assert_array_equal(bars.volume, [1, 3, 1])
+
+    def test_streaming_daily_bars_when_dst_starts_at_midnight(self):
+        builder = BarBuilder("1d", tz="America/Sao_Paulo")
+        emitted = []
+        for i, ts in enumerate(("2018-11-04T02:00:00Z", "2018-11-04T02:30:00Z", "2018-11-04T02:59:59Z", "2018-11-04T03:00:00Z",
+                                "2018-11-04T12:00:00Z", "2018-11-05T01:59:59Z")):
+            emitted.extend(builder.update(iTSns(ts), float(i), 1.0))
+        self.assertEqual([bar.start for bar in emitted], [int(iTSns("2018-11-03T03:00:00Z"))])
+        self.assertEqual(emitted[0].volume, 3.0)
+        self.assertEqual(builder.current.start, int(iTSns("2018-11-04T03:00:00Z")))
+        self.assertEqual(builder.current.volume, 3.0)
+        self.assertIsNone(builder.advance(iTSns("2018-11-05T01:59:59Z")))
+        self.assertEqual(builder.advance(iTSns("2018-11-05T02:00:00Z")).close, 5.0)
+
+    def test_monthly_bars(self):
+        ts = np.array([int(iTSns("2024-01-31T23:00:00Z")), int(iTSns("2024-02-01T00:00:00Z")), int(iTSns("2024-03-15T00:00:00Z"))])
+        bars = build_bars(ts, [1, 2, 3], [1, 1, 1], "2M")
+        np.testing.assert_array_equal(bars.start, [int(iTSns("2024-01-01T00:00:00Z")), int(iTSns("2024-03-01T00:00:00Z"))])
+        np.testing.assert_array_equal(bars.volume, [2, 1])
+
+    def test_streaming_matches_batch(self):
+        batch = build_bars(self.ts, self.price, self.size, "1m")
+        builder = BarBuilder("1m")
+        emitted = []
+        for ts, price, size in zip(self.ts, self.price, self.size):
+            emitted.extend(builder.update(iTSns(ts), price, size))
+        emitted.append(builder.flush())
+        self.assertEqual([bar.start for bar in emitted], list(batch.start))
+        self.assertEqual([bar.high for bar in emitted], list(batch.high))
+        self.assertEqual([bar.volume for bar in emitted], list(batch.volume))
+        self.assertIsNone(builder.flush())
+
+    def test_streaming_update_many_merges_with_current_bar(self):
+        builder = BarBuilder(MIN_NS)
+        self.assertEqual(builder.update(self.ts[0], self.price[0], self.size[0]), [])
+        completed = builder.update_many(self.ts[1:], self.price[1:], self.size[1:])
+        np.testing.assert_array_equal(completed.start, [self.base, self.base + MIN_NS])
+        np.testing.assert_array_equal(completed.open, [10.0, 11.0])
+        np.testing.assert_array_equal(completed.high, [12.0, 11.0])
+        np.testing.assert_array_equal(completed.volume, [4.0, 5.0])
+        np.testing.assert_allclose(completed.vwap, [(10 + 24 + 9) / 4, 11.0])
+        self.assertEqual(builder.current.start, self.base + 3 * MIN_NS)
+
+    def test_streaming_advance_and_order(self):
+        builder = BarBuilder("1m")
+        builder.update(self.ts[0], 1.0, 1.0)
+        self.assertIsNone(builder.advance(self.ts[0] + MIN_NS - 1))
+        self.assertEqual(builder.advance(self.ts[0] + MIN_NS).start, self.base)
+        with self.assertRaises(ValueError):
+            builder.update(self.ts[0] - 1, 1.0, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
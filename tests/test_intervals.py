@@ -0,0 +1,470 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose:
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+import asyncio
+import unittest
+from unittest import TestCase
+
+import numpy as np
+
+from datetime import timedelta
+
+from tsx import TS, iTS, iTSms, iTSus, iTSns, TSInterval
+from tsx.intervals import TSIntervalSet, IntervalIndex, IntervalArray, assign, interval_join, iter_interval_join, overlap_profile, allen_relations, \
+    IntervalCoalescer, coalesce, acoalesce
+from tsx.ts import ALLEN_RELATIONS
+from tsx.ts import dTS, nsInterval
+
+
+def _random_set(rng, n, span=200):
+    starts = rng.integers(0, span, n)
+    return TSIntervalSet((starts, starts + rng.integers(0, 15, n)))
+
+
+def _mask(interval_set, span=230):
+    points = np.arange(span)
+    return interval_set.contains_array(points)
+
+
+class TestTSIntervalSet(TestCase):
+    def test_normalization(self):
+        s = TSIntervalSet((np.array([50, 10, 20, 30, 70, 5]), np.array([60, 20, 25, 30, 80, 12])))
+        self.assertEqual(s.starts.tolist(), [5, 50, 70])
+        self.assertEqual(s.ends.tolist(), [25, 60, 80])
+        self.assertEqual(len(s), 3)
+        self.assertEqual(s.duration, dTS(40, unit="ns"))
+        with self.assertRaises(ValueError):
+            s.starts[0] = 1
+
+    def test_from_ts_intervals(self):
+        s = TSIntervalSet([TSInterval(iTS(10), iTS(20)), TSInterval(iTS(0), iTS(10))])
+        self.assertEqual(s.to_intervals(), [TSInterval(iTSns(0), iTSns(20 * 10 ** 9))])
+        self.assertEqual(TSIntervalSet(TSInterval(iTS(0), iTS(1))).duration, dTS("1s"))
+        self.assertFalse(TSIntervalSet())
+
+    def test_contains(self):
+        s = TSIntervalSet((np.array([0, 10]), np.array([5, 15])))
+        self.assertTrue(s.contains(0))
+        self.assertFalse(s.contains(5))
+        self.assertTrue(14 in s)
+        self.assertFalse(s.contains(-1))
+        self.assertFalse(s.contains(iTS(1)))
+        self.assertEqual(s.contains_array([-1, 0, 4, 5, 9, 10, 15]).tolist(), [False, True, True, False, False, True, False])
+        self.assertEqual(TSIntervalSet().contains_array([1, 2]).tolist(), [False, False])
+
+    def test_algebra_matches_brute_force(self):
+        rng = np.random.default_rng(7)
+        for _ in range(50):
+            a, b = _random_set(rng, rng.integers(0, 12)), _random_set(rng, rng.integers(0, 12))
+            ma, mb = _mask(a), _mask(b)
+            for res, expected in ((a | b, ma | mb), (a & b, ma & mb), (a - b, ma & ~mb), (a ^ b, ma ^ mb)):
+                np.testing.assert_array_equal(_mask(res), expected)
+                self.assertTrue(np.all(res.starts[1:] > res.ends[:-1]))
+                self.assertTrue(np.all(res.starts < res.ends))
+
+    def test_touching_intervals_coalesce(self):
+        a = TSIntervalSet((np.array([0]), np.array([10])))
+        b = TSIntervalSet((np.array([10]), np.array([20])))
+        self.assertEqual(a | b, TSIntervalSet((np.array([0]), np.array([20]))))
+        self.assertFalse(a & b)
+        self.assertEqual((a | b) - b, a)
+
+    def test_complement(self):
+        s = TSIntervalSet((np.array([10, 30]), np.array([20, 40])))
+        gaps = s.complement((0, 50))
+        self.assertEqual(gaps.starts.tolist(), [0, 20, 40])
+        self.assertEqual(gaps.ends.tolist(), [10, 30, 50])
+        gaps = s.complement(TSInterval(iTSns(15), iTSns(35)))
+        self.assertEqual(list(zip(gaps.starts.tolist(), gaps.ends.tolist())), [(20, 30)])
+
+    def test_trading_hours_minus_outages(self):
+        day = 24 * 3600 * 10 ** 9
+        hour = 3600 * 10 ** 9
+        sessions = TSIntervalSet((np.arange(5) * day + 9 * hour, np.arange(5) * day + 17 * hour))
+        outages = TSIntervalSet([TSInterval(iTSns(day + 16 * hour), iTSns(day + 18 * hour))])
+        available = sessions - outages
+        self.assertEqual(len(available), 5)
+        self.assertEqual(int(available.duration.as_nsec()), 5 * 8 * hour - hour)
+
+
+class TestIntervalIndex(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        n = 500
+        self.starts = rng.integers(0, 10_000, n)
+        self.ends = self.starts + rng.integers(0, 800, n)
+        self.ends[:50] = self.starts[:50] + rng.integers(3_000, 9_000, 50)
+        self.index = IntervalIndex((self.starts, self.ends))
+        self.points = rng.integers(-100, 11_000, 300)
+        self.points[:20] = self.starts[:20]
+        self.points[20:40] = self.ends[20:40]
+
+    def test_tree_has_inner_nodes(self):
+        self.assertGreater(len(self.index._node_center), 1)
+        self.assertEqual(sorted(self.index._node_start_idx.tolist()), list(range(len(self.index))))
+
+    def test_stab_matches_brute_force(self):
+        for t in self.points:
+            expected = np.flatnonzero((self.starts <= t) & (t <= self.ends))
+            np.testing.assert_array_equal(self.index.stab(int(t)), expected)
+
+    def test_overlap_matches_brute_force(self):
+        for a, b in zip(self.points[:100], self.points[100:200]):
+            a, b = min(a, b), max(a, b)
+            np.testing.assert_array_equal(self.index.overlap(int(a), int(b)), np.flatnonzero((self.starts <= b) & (self.ends >= a)))
+            np.testing.assert_array_equal(self.index.overlap(int(a), int(b), inclusive=False),
+                                          np.flatnonzero((self.starts < b) & (self.ends > a)))
+
+    def test_batch_queries_match_single(self):
+        point_idx, interval_idx = self.index.stab_many(self.points)
+        expected = [(p, i) for p, t in enumerate(self.points) for i in self.index.stab(int(t))]
+        self.assertEqual(list(zip(point_idx.tolist(), interval_idx.tolist())), expected)
+
+        q_starts = np.minimum(self.points[:100], self.points[100:200])
+        q_ends = np.maximum(self.points[:100], self.points[100:200])
+        for inclusive in (True, False):
+            query_idx, interval_idx = self.index.overlap_many((q_starts, q_ends), inclusive=inclusive)
+            expected = [(q, i) for q, (a, b) in enumerate(zip(q_starts, q_ends)) for i in self.index.overlap(int(a), int(b), inclusive=inclusive)]
+            self.assertEqual(list(zip(query_idx.tolist(), interval_idx.tolist())), expected)
+
+    def test_exclusive_overlap_skips_empty_intervals_at_query_start(self):
+        index = IntervalIndex((np.array([10, 10, 5, 12]), np.array([10, 15, 10, 12])))
+        self.assertEqual(index.overlap(10, 20, inclusive=False).tolist(), [1, 3])
+        self.assertEqual(index.overlap(10, 20).tolist(), [0, 1, 2, 3])
+        query_idx, interval_idx = index.overlap_many((np.array([10, 0]), np.array([20, 11])), inclusive=False)
+        self.assertEqual(list(zip(query_idx.tolist(), interval_idx.tolist())), [(0, 1), (0, 3), (1, 0), (1, 1), (1, 2)])
+
+    def test_nearest(self):
+        res = self.index.nearest_many(self.points)
+        dist = np.maximum(np.maximum(self.starts[None, :] - self.points[:, None], self.points[:, None] - self.ends[None, :]), 0)
+        np.testing.assert_array_equal(dist[np.arange(self.points.size), res], dist.min(axis=1))
+        index = IntervalIndex((np.array([0, 20]), np.array([10, 30])))
+        self.assertEqual([index.nearest(t) for t in (-5, 5, 14, 15, 16, 35)], [0, 0, 0, 0, 1, 1])
+        self.assertEqual(IntervalIndex(([], [])).nearest(3), -1)
+
+    def test_ts_interval_queries(self):
+        index = IntervalIndex([TSInterval(iTS(0), iTS(10)), TSInterval(iTS(5), iTS(20)), TSInterval(iTS(30), iTS(40))])
+        self.assertEqual(index.stab(iTS(7)).tolist(), [0, 1])
+        self.assertEqual(index.stab(iTS(10)).tolist(), [0, 1])
+        self.assertEqual(index.overlap(TSInterval(iTS(20), iTS(30))).tolist(), [1, 2])
+        self.assertEqual(index.overlap(TSInterval(iTS(20), iTS(30)), inclusive=False).tolist(), [])
+        self.assertEqual(index.stab(iTS(25)).size, 0)
+        self.assertEqual(IntervalIndex(([], [])).stab(1).size, 0)
+        with self.assertRaises(ValueError):
+            index.overlap(5, 1)
+
+
+class TestIntervalArray(TestCase):
+    def setUp(self):
+        self.intervals = [TSInterval(iTSms(1_000), iTSms(5_000)), TSInterval(iTSms(3_000), iTSms(3_500)), TSInterval(iTSms(-2_000), iTSms(1_001))]
+        self.arr = IntervalArray(self.intervals)
+
+    def test_round_trip(self):
+        self.assertEqual(self.arr.ts_cls, iTSms)
+        self.assertEqual(self.arr.to_intervals(), self.intervals)
+        self.assertIsInstance(self.arr[0].start, iTSms)
+        self.assertEqual(self.arr[-1], self.intervals[-1])
+        self.assertEqual(list(self.arr[1:]), self.intervals[1:])
+        for cls in (iTS, iTSus, iTSns, TS):
+            intervals = [TSInterval(cls(1), cls(2)), TSInterval(cls(5), cls(9))]
+            self.assertEqual(IntervalArray(intervals).to_intervals(), intervals)
+        ns_intervals = [nsInterval.from_interval(interval) for interval in self.intervals]
+        self.assertEqual(IntervalArray(ns_intervals), self.arr)
+
+    def test_duration_midpoint(self):
+        self.assertEqual(self.arr.duration.tolist(), [int(interval.duration.as_nsec()) for interval in self.intervals])
+        self.assertEqual(self.arr.midpoint.tolist(), [3_000_000_000, 3_250_000_000, -499_500_000])
+
+    def test_contains(self):
+        self.assertEqual(self.arr.contains(iTS(1)).tolist(), [interval.contains(iTS(1)) for interval in self.intervals])
+        self.assertEqual(self.arr.contains(1, prec="s").tolist(), [True, False, True])
+        self.assertEqual(self.arr.contains([5_000, 3_000, 0], prec="ms").tolist(), [True, True, True])
+        self.assertEqual(self.arr.contains_exclusive([5_000, 3_000, 0], prec="ms").tolist(), [False, False, True])
+        with self.assertRaises(ValueError):
+            self.arr.contains([1, 2])
+
+    def test_overlaps_and_intersection(self):
+        other = TSInterval(iTSms(1_001), iTSms(3_000))
+        self.assertEqual(self.arr.overlaps(other).tolist(), [interval.overlaps(other) for interval in self.intervals])
+        self.assertEqual(self.arr.overlaps_inclusive(other).tolist(), [interval.overlaps_inclusive(other) for interval in self.intervals])
+        self.assertEqual((self.arr & other).to_intervals(), [interval & other for interval in self.intervals])
+        shifted = self.arr.shift(1)
+        self.assertEqual((self.arr & shifted).to_intervals(), [a & b for a, b in zip(self.intervals, shifted.to_intervals())])
+        with self.assertRaises(ValueError):
+            self.arr.overlaps(self.arr[:2])
+
+    def test_shift_expand(self):
+        self.assertEqual(self.arr.shift(timedelta(seconds=1)).to_intervals(), [interval.shift(timedelta(seconds=1)) for interval in self.intervals])
+        self.assertEqual(self.arr.shift(dTS("1s")), self.arr.shift(timedelta(seconds=1)))
+        self.assertEqual(self.arr.shift(0.5).starts.tolist(), [1_500_000_000, 3_500_000_000, -1_500_000_000])
+        expanded = self.arr.expand(timedelta(seconds=1), dTS("2s"))
+        self.assertEqual(expanded.to_intervals(), [interval.expand(timedelta(seconds=1), timedelta(seconds=2)) for interval in self.intervals])
+        with self.assertRaises(ValueError):
+            self.arr.shift(dTS("1M"))
+
+    def test_isoformat(self):
+        self.assertEqual(self.arr.isoformat().tolist(), [interval.isoformat() for interval in self.intervals])
+        for cls in (iTS, iTSus, iTSns, TS):
+            intervals = [TSInterval(cls(1), cls(2)), TSInterval(cls(-5), cls(9))]
+            self.assertEqual(IntervalArray(intervals).isoformat(" / ").tolist(), [interval.isoformat(" / ") for interval in intervals])
+        intervals = [TSInterval(TS(1.25), TS(2))]
+        self.assertEqual(IntervalArray(intervals).isoformat().tolist(), [intervals[0].isoformat()])
+
+    def test_sort(self):
+        intervals = self.intervals + [TSInterval(iTSms(1_000), iTSms(2_000))]
+        self.assertEqual(IntervalArray(intervals).sort().to_intervals(), sorted(intervals))
+
+
+def _assign_brute_force(points, starts, ends):
+    res = []
+    for p in points:
+        candidates = [i for i in range(starts.size) if starts[i] <= p <= ends[i]]
+        res.append(max(candidates, key=lambda i: (starts[i], -i)) if candidates else -1)
+    return res
+
+
+class TestAssign(TestCase):
+    def test_disjoint_intervals(self):
+        day = 24 * 3600
+        intervals = [TSInterval(iTS(day), iTS(2 * day)), TSInterval(iTS(0), iTS(day)), TSInterval(iTS(5 * day), iTS(6 * day))]
+        points = [iTS(-1), iTS(0), iTS(day), iTS(day + 1), iTS(3 * day), iTS(6 * day), iTS(7 * day)]
+        self.assertEqual(assign(points, intervals).tolist(), [-1, 1, 0, 0, -1, 2, -1])
+        self.assertEqual(assign(np.array([0, day]), intervals, prec="s").tolist(), [1, 0])
+
+    def test_overlapping_matches_brute_force(self):
+        rng = np.random.default_rng(11)
+        for n in (1, 2, 3, 7, 64, 300):
+            starts = rng.integers(0, 5_000, n)
+            ends = starts + rng.integers(0, 400, n)
+            ends[: n // 10] += 3_000
+            points = rng.integers(-50, 9_000, 400)
+            expected = _assign_brute_force(points, starts, ends)
+            self.assertEqual(assign(points, (starts, ends)).tolist(), expected)
+            self.assertEqual(assign(points, IntervalArray((starts, ends))).tolist(), expected)
+
+    def test_ties_and_empty(self):
+        starts, ends = np.array([10, 10, 0]), np.array([20, 30, 100])
+        self.assertEqual(assign([15, 25, 5, 200], (starts, ends)).tolist(), [0, 1, 2, -1])
+        self.assertEqual(assign([1, 2], ([], [])).tolist(), [-1, -1])
+        self.assertEqual(assign([], (starts, ends)).size, 0)
+
+
+class TestIntervalJoin(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        self.l_starts = rng.integers(0, 2_000, 150)
+        self.l_ends = self.l_starts + rng.integers(0, 300, 150)
+        self.r_starts = rng.integers(0, 2_000, 120)
+        self.r_ends = self.r_starts + rng.integers(0, 100, 120)
+        self.r_starts[:10] = self.l_starts[:10]
+        self.r_ends[:10] = self.l_starts[:10] + 20
+        self.r_ends[10:20] = self.l_ends[10:20]
+        self.r_starts[10:20] = self.l_ends[10:20] - 40
+
+    def _brute_force(self, how, min_overlap=0):
+        pairs = set()
+        for i, (ls, le) in enumerate(zip(self.l_starts, self.l_ends)):
+            for j, (rs, re) in enumerate(zip(self.r_starts, self.r_ends)):
+                inter = min(le, re) - max(ls, rs)
+                if how == "overlap":
+                    ok = inter > 0
+                elif how == "contains":
+                    ok = ls <= rs and re <= le
+                else:
+                    ok = rs <= ls and le <= re
+                if ok and inter >= min_overlap:
+                    pairs.add((i, j))
+        return pairs
+
+    def test_matches_brute_force(self):
+        for how in ("overlap", "contains", "within"):
+            for min_overlap in (0, 50):
+                with self.subTest(how=how, min_overlap=min_overlap):
+                    left_idx, right_idx = interval_join((self.l_starts, self.l_ends), (self.r_starts, self.r_ends), how=how, min_overlap=min_overlap)
+                    pairs = list(zip(left_idx.tolist(), right_idx.tolist()))
+                    self.assertEqual(len(pairs), len(set(pairs)))
+                    self.assertEqual(set(pairs), self._brute_force(how, min_overlap))
+
+    def test_chunks_are_bounded_and_complete(self):
+        left, right = (self.l_starts, self.l_ends), (self.r_starts, self.r_ends)
+        chunks = list(iter_interval_join(left, right, chunk_size=7))
+        self.assertTrue(all(chunk[0].size <= 7 for chunk in chunks))
+        left_idx, right_idx = interval_join(left, right)
+        self.assertEqual(sorted(zip(np.concatenate([c[0] for c in chunks]).tolist(), np.concatenate([c[1] for c in chunks]).tolist())),
+                         sorted(zip(left_idx.tolist(), right_idx.tolist())))
+
+    def test_intersections_and_ts_intervals(self):
+        left = [TSInterval(iTS(0), iTS(10)), TSInterval(iTS(20), iTS(30))]
+        right = [TSInterval(iTS(5), iTS(25)), TSInterval(iTS(10), iTS(11))]
+        left_idx, right_idx, inter = interval_join(left, right, return_intersections=True)
+        order = np.lexsort((right_idx, left_idx))
+        self.assertEqual(list(zip(left_idx[order].tolist(), right_idx[order].tolist())), [(0, 0), (1, 0)])
+        self.assertEqual(inter[order].to_intervals(), [left[0] & right[0], left[1] & right[0]])
+        left_idx, right_idx = interval_join(left, right, min_overlap=dTS("6s"))
+        self.assertEqual(left_idx.tolist(), [])
+        left_idx, right_idx = interval_join(left, right, how="contains")
+        self.assertEqual(list(zip(left_idx.tolist(), right_idx.tolist())), [])
+        left_idx, right_idx = interval_join(right, left, how="within")
+        self.assertEqual(left_idx.size, 0)
+        self.assertEqual(interval_join(left, ([], []))[0].size, 0)
+        with self.assertRaises(ValueError):
+            interval_join(left, right, how="inner")
+
+
+class TestOverlapProfile(TestCase):
+    def test_counts_and_peak(self):
+        profile = overlap_profile((np.array([0, 5, 10, 10, 20]), np.array([10, 15, 20, 12, 25])))
+        self.assertEqual(profile.times.tolist(), [0, 5, 10, 12, 15, 25])
+        self.assertEqual(profile.counts.tolist(), [1, 2, 3, 2, 1, 0])
+        self.assertEqual(profile.peak, 3)
+        self.assertEqual((profile.peak_start, profile.peak_end), (10, 12))
+        self.assertEqual(profile.at([-1, 0, 9, 10, 11, 12, 24, 25]).tolist(), [0, 1, 2, 3, 3, 2, 1, 0])
+
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(1)
+        starts = rng.integers(0, 1_000, 200)
+        ends = starts + rng.integers(0, 100, 200)
+        weights = rng.random(200)
+        points = np.arange(-5, 1_105)
+        active = (starts[None, :] <= points[:, None]) & (points[:, None] < ends[None, :])
+        profile = overlap_profile((starts, ends))
+        np.testing.assert_array_equal(profile.at(points), active.sum(axis=1))
+        self.assertEqual(profile.peak, active.sum(axis=1).max())
+        self.assertEqual(active.sum(axis=1)[points == profile.peak_start][0], profile.peak)
+        weighted = overlap_profile((starts, ends), weights=weights)
+        np.testing.assert_allclose(weighted.at(points), active @ weights, atol=1e-9)
+        self.assertAlmostEqual(weighted.peak, (active @ weights).max())
+
+    def test_negative_weights_have_no_peak(self):
+        profile = overlap_profile((np.array([0, 5]), np.array([10, 15])), weights=[-1.0, -2.0])
+        self.assertEqual(profile.counts.tolist(), [-1.0, -3.0, -2.0, 0.0])
+        self.assertEqual((profile.peak, profile.peak_start, profile.peak_end), (0.0, None, None))
+
+    def test_float_weights_return_to_zero(self):
+        # 0.1 + 0.2 + 0.3 - 0.1 - 0.2 - 0.3 leaves 1.1e-16 with plain float sums
+        profile = overlap_profile((np.array([0, 1, 2]), np.array([10, 11, 12])), weights=[0.1, 0.2, 0.3])
+        self.assertEqual(profile.counts[-1], 0.0)
+        self.assertEqual(profile.at([12, 100]).tolist(), [0.0, 0.0])
+        self.assertEqual((profile.peak_start, profile.peak_end), (2, 10))
+
+    def test_steps_always_change_the_level(self):
+        profile = overlap_profile((np.array([0, 20]), np.array([10, 30])))
+        self.assertEqual(profile.counts.tolist(), [1, 0, 1, 0])
+        # the negligible weight is snapped to 0 along with the residue, so 12, 20 and 30 collapse into one step
+        profile = overlap_profile((np.array([0, 1, 2, 20]), np.array([10, 11, 12, 30])), weights=[0.1, 0.2, 0.3, 1e-17])
+        self.assertEqual(profile.times.tolist(), [0, 1, 2, 10, 11, 12])
+        self.assertEqual(profile.counts[-1], 0.0)
+        self.assertTrue(np.all(np.diff(profile.counts) != 0))
+        profile = overlap_profile((np.array([0, 1]), np.array([10, 11])), weights=[-0.1, -0.2])
+        self.assertEqual((profile.peak, profile.peak_start, profile.peak_end), (0.0, None, None))
+
+    def test_ts_intervals_and_empty(self):
+        profile = overlap_profile([TSInterval(iTS(0), iTS(10)), TSInterval(iTS(10), iTS(20))])
+        self.assertEqual(profile.counts.tolist(), [1, 0])
+        self.assertEqual(profile.peak, 1)
+        self.assertEqual(profile.peak_end, 20 * 10 ** 9)
+        empty = overlap_profile(([], []))
+        self.assertEqual((empty.peak, empty.peak_start), (0, None))
+        self.assertEqual(empty.at([1]).tolist(), [0])
+
+
+
+class TestAllenRelations(TestCase):
+    def setUp(self) -> None:
+        bounds = [(a, b) for a in range(5) for b in range(5) if a < b]
+        self.pairs = [(TSInterval(iTSns(a), iTSns(b)), TSInterval(iTSns(c), iTSns(d))) for a, b in bounds for c, d in bounds]
+
+    def test_matches_scalar_relation(self):
+        codes = allen_relations([a for a, _ in self.pairs], [b for _, b in self.pairs])
+        self.assertEqual(codes.dtype, np.int8)
+        self.assertEqual([ALLEN_RELATIONS[code] for code in codes], [a.relation(b) for a, b in self.pairs])
+        self.assertEqual(set(codes.tolist()), set(range(13)))
+        inverse = allen_relations([b for _, b in self.pairs], [a for a, _ in self.pairs])
+        np.testing.assert_array_equal(inverse, 12 - codes)
+
+    def test_single_right_interval(self):
+        left = (np.array([0, 0, 5, 12], dtype=np.int64), np.array([5, 20, 20, 30], dtype=np.int64))
+        right = TSInterval(iTSns(5), iTSns(20))
+        expected = ["meets", "finished_by", "equals", "overlapped_by"]
+        self.assertEqual([ALLEN_RELATIONS[c] for c in allen_relations(left, right)], expected)
+        self.assertEqual([ALLEN_RELATIONS[c] for c in allen_relations(left, nsInterval.from_interval(right))], expected)
+        self.assertEqual([ALLEN_RELATIONS[c] for c in IntervalArray(left).relation(right)], expected)
+
+    def test_interval_array_rows(self):
+        left = IntervalArray([a for a, _ in self.pairs])
+        right = IntervalArray([b for _, b in self.pairs])
+        np.testing.assert_array_equal(left.relation(right), allen_relations(left, right))
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            allen_relations([TSInterval(iTS(0), iTS(1))], [TSInterval(iTS(0), iTS(1))] * 2)
+        self.assertEqual(allen_relations([], []).size, 0)
+
+
+def _ns_intervals(bounds):
+    return [TSInterval(iTSns(start), iTSns(end)) for start, end in bounds]
+
+
+class TestCoalesce(TestCase):
+    def test_merges_overlapping_and_adjacent(self):
+        res = list(coalesce(_ns_intervals([(0, 5), (3, 8), (8, 10), (12, 15), (20, 25), (21, 22)])))
+        self.assertEqual(res, _ns_intervals([(0, 10), (12, 15), (20, 25)]))
+
+    def test_gap_tolerance(self):
+        bounds = [(0, 5), (7, 8), (11, 12)]
+        self.assertEqual(list(coalesce(_ns_intervals(bounds), gap=2)), _ns_intervals([(0, 8), (11, 12)]))
+        self.assertEqual(list(coalesce(_ns_intervals(bounds), gap=3)), _ns_intervals([(0, 12)]))
+        self.assertEqual(list(coalesce(_ns_intervals(bounds), gap=timedelta(0))), _ns_intervals(bounds))
+
+    def test_emits_as_soon_as_final(self):
+        coalescer = IntervalCoalescer(gap=1, lateness=2)
+        self.assertEqual(coalescer.update(TSInterval(iTSns(0), iTSns(5))), [])
+        self.assertEqual(coalescer.update(TSInterval(iTSns(7), iTSns(9))), [])
+        # a late interval can still start at 6 and be merged with [0, 5]
+        self.assertEqual(coalescer.update(TSInterval(iTSns(8), iTSns(9))), [])
+        self.assertEqual(coalescer.update(TSInterval(iTSns(9), iTSns(10))), _ns_intervals([(0, 5)]))
+        self.assertEqual(coalescer.open_intervals, 1)
+        # at stream time 13 an interval can still start at 11 and extend [7, 10]
+        self.assertEqual(coalescer.expire(iTSns(13)), [])
+        self.assertEqual(coalescer.expire(14), _ns_intervals([(7, 10)]))
+        self.assertEqual(coalescer.flush(), [])
+
+    def test_late_intervals(self):
+        stream = _ns_intervals([(10, 12), (14, 16), (12, 13), (11, 15), (30, 31)])
+        self.assertEqual(list(coalesce(stream, lateness=3)), _ns_intervals([(10, 16), (30, 31)]))
+        with self.assertRaises(ValueError):
+            list(coalesce(stream, lateness=2))
+
+    def test_keeps_bound_classes(self):
+        res = list(coalesce([TSInterval(iTS(0), iTS(10)), TSInterval(iTSms(5_000), iTSms(12_500))]))
+        self.assertEqual(res, [TSInterval(iTS(0), iTSms(12_500))])
+        self.assertIs(type(res[0].start), iTS)
+        self.assertIs(type(res[0].end), iTSms)
+
+    def test_bounded_memory(self):
+        coalescer = IntervalCoalescer(lateness=10)
+        finalised = 0
+        for i in range(10_000):
+            finalised += len(coalescer.update(TSInterval(iTSns(i * 10), iTSns(i * 10 + 5))))
+            self.assertLessEqual(coalescer.open_intervals, 3)
+        self.assertEqual(finalised + len(coalescer.flush()), 10_000)
+
+    def test_async(self):
+        async def source():
+            for interval in _ns_intervals([(0, 5), (3, 8), (12, 15)]):
+                await asyncio.sleep(0)
+                yield interval
+
+        async def collect():
+            return [interval async for interval in acoalesce(source())]
+
+        self.assertEqual(asyncio.run(collect()), _ns_intervals([(0, 8), (12, 15)]))
+
+
+if __name__ == "__main__":
+    unittest.main()
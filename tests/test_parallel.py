@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose:
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+import multiprocessing
+import threading
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import TestCase
+
+from tsx import iTS, iTSms, TSInterval, map_intervals, iter_map_intervals
+from tsx.ts import dTS
+
+
+def _duration_sec(chunk: TSInterval) -> int:
+    return chunk.duration.as_sec()
+
+
+class TestMapIntervals(TestCase):
+    def setUp(self) -> None:
+        self.interval = TSInterval(iTSms("2024-01-01T12:00:00"), iTSms("2024-01-05T06:00:00"))
+
+    def test_results_in_order(self):
+        def slow_first(chunk: TSInterval) -> TSInterval:
+            # the first chunks finish last
+            time.sleep(0.02 if chunk.start < iTSms("2024-01-03") else 0)
+            return chunk
+
+        with ThreadPoolExecutor(4) as executor:
+            res = map_intervals(slow_first, self.interval, dTS("1d"), executor)
+        self.assertEqual(res, list(self.interval.chunks(dTS("1d"))))
+        self.assertEqual(len(res), 5)
+
+    def test_bounded_in_flight(self):
+        lock = threading.Lock()
+        state = {"running": 0, "max": 0}
+
+        def track(chunk: TSInterval) -> int:
+            with lock:
+                state["running"] += 1
+                state["max"] = max(state["max"], state["running"])
+            time.sleep(0.005)
+            with lock:
+                state["running"] -= 1
+            return 1
+
+        interval = TSInterval(iTS("2024-01-01"), iTS("2024-01-02"))
+        with ThreadPoolExecutor(8) as executor:
+            submitted = []
+            original_submit = executor.submit
+
+            def submit(fn, *args):
+                submitted.append(args[0])
+                return original_submit(fn, *args)
+
+            executor.submit = submit
+            results = iter_map_intervals(track, interval, dTS("1h"), executor, max_in_flight=3)
+            self.assertEqual(next(results), 1)
+            self.assertEqual(len(submitted), 3)
+            # consuming a result allows a single extra submission
+            self.assertEqual(next(results), 1)
+            self.assertEqual(len(submitted), 4)
+            self.assertEqual(sum(results), 22)
+        self.assertLessEqual(state["max"], 3)
+
+    def test_exception_is_propagated(self):
+        def fail_on_day_3(chunk: TSInterval) -> int:
+            if chunk.start == iTSms("2024-01-03"):
+                raise RuntimeError("boom")
+            return 1
+
+        with ThreadPoolExecutor(2) as executor:
+            with self.assertRaises(RuntimeError):
+                map_intervals(fail_on_day_3, self.interval, dTS("1d"), executor, max_in_flight=2)
+
+    def test_invalid_max_in_flight(self):
+        with ThreadPoolExecutor(1) as executor:
+            with self.assertRaises(ValueError):
+                map_intervals(_duration_sec, self.interval, dTS("1d"), executor, max_in_flight=0)
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("fork")) as executor:
+            res = map_intervals(_duration_sec, self.interval, dTS("1d"), executor)
+        self.assertEqual(res, [12 * 3600, 86400, 86400, 86400, 6 * 3600])
+
+
+if __name__ == "__main__":
+    unittest.main()
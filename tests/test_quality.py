@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose:
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+import unittest
+from datetime import timedelta
+from unittest import TestCase
+
+import numpy as np
+
+from tsx import iTSms, iTSns, TSInterval
+from tsx.quality import profile
+from tsx.ts import dTS
+
+MS = 1_000_000
+
+
+class TestProfile(TestCase):
+    def test_clean_regular_feed(self):
+        ts = np.arange(0, 1000, 100, dtype=np.int64) * MS
+        res = profile(ts)
+        self.assertEqual(res.n_rows, 10)
+        self.assertTrue(res.is_sorted)
+        self.assertEqual(res.out_of_order, 0)
+        self.assertEqual(res.duplicates, 0)
+        self.assertEqual(res.period_ns, 100 * MS)
+        self.assertEqual(res.jitter_ns, 0)
+        self.assertEqual(res.gaps, [])
+        self.assertEqual((res.first, res.last), (0, 900 * MS))
+
+    def test_dirty_feed(self):
+        ts = [iTSms(0), iTSms(100), iTSms(210), iTSms(200), iTSms(300), iTSms(300), iTSms(1000), iTSms(1100)]
+        res = profile(ts)
+        self.assertFalse(res.is_sorted)
+        self.assertEqual(res.out_of_order, 1)
+        self.assertEqual(res.duplicates, 1)
+        self.assertEqual(res.period_ns, 100 * MS)
+        self.assertEqual(res.jitter_ns, 5 * MS)
+        self.assertEqual(res.gaps, [TSInterval(iTSns(300 * MS), iTSns(1000 * MS))])
+
+    def test_expected_period_and_threshold(self):
+        ts = np.array([0, 95, 200, 300, 700], dtype=np.int64)
+        res = profile(ts, expected_period=timedelta(milliseconds=100), prec="ms")
+        self.assertEqual(res.period_ns, 100 * MS)
+        self.assertEqual(res.jitter_ns, 5 * MS)
+        self.assertEqual(len(res.gaps), 1)
+        res = profile(ts, expected_period=dTS("100ms"), gap_threshold=dTS("104ms"), prec="ms")
+        self.assertEqual(res.gaps, [TSInterval(iTSns(95 * MS), iTSns(200 * MS)), TSInterval(iTSns(300 * MS), iTSns(700 * MS))])
+
+    def test_empty_and_single(self):
+        self.assertEqual(profile(np.empty(0, dtype=np.int64)).n_rows, 0)
+        res = profile([iTSns(5)])
+        self.assertEqual(res.n_rows, 1)
+        self.assertIsNone(res.period_ns)
+        self.assertEqual(res.gaps, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
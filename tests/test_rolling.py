@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose:
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+import unittest
+from datetime import timedelta
+from unittest import TestCase
+
+import numpy as np
+
+from tsx import iTSns
+from tsx.rolling import rolling, RollingWindow
+from tsx.ts import dTS
+
+SEC = 1_000_000_000
+
+
+def brute_force(ts, values, window_ns, closed):
+    res = {"count": [], "sum": [], "min": [], "max": []}
+    for i, t in enumerate(ts):
+        selected = []
+        for j, (u, v) in enumerate(zip(ts, values)):
+            after_start = u >= t - window_ns if closed in ("left", "both") else u > t - window_ns
+            before_end = j <= i if closed in ("right", "both") else u < t
+            if after_start and before_end:
+                selected.append(v)
+        res["count"].append(len(selected))
+        res["sum"].append(sum(selected))
+        res["min"].append(min(selected) if selected else np.nan)
+        res["max"].append(max(selected) if selected else np.nan)
+    return res
+
+
+class TestRolling(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.ts = np.cumsum(rng.integers(0, 3, size=200)) * SEC
+        self.values = rng.integers(-50, 50, size=200)
+
+    def test_matches_brute_force_for_all_closings(self):
+        for closed in ("right", "left", "both", "neither"):
+            with self.subTest(closed=closed):
+                res = rolling(self.ts, self.values, dTS("5s"), aggs=("count", "sum", "min", "max"), closed=closed)
+                expected = brute_force(self.ts, self.values, 5 * SEC, closed)
+                np.testing.assert_array_equal(res["count"], expected["count"])
+                np.testing.assert_array_equal(res["sum"], expected["sum"])
+                np.testing.assert_array_equal(res["min"], expected["min"])
+                np.testing.assert_array_equal(res["max"], expected["max"])
+
+    def test_window_types_agree(self):
+        by_dts = rolling(self.ts, self.values, dTS("5s"))
+        by_td = rolling(list(map(iTSns, self.ts)), self.values, timedelta(seconds=5))
+        by_int = rolling(self.ts, self.values, 5 * SEC)
+        for agg in ("count", "sum", "mean"):
+            np.testing.assert_array_equal(by_dts[agg], by_td[agg])
+            np.testing.assert_array_equal(by_dts[agg], by_int[agg])
+
+    def test_mean_of_empty_window_is_nan(self):
+        res = rolling(np.array([0, 10 * SEC]), np.array([1.0, 2.0]), dTS("1s"), closed="left")
+        self.assertTrue(np.isnan(res["mean"]).all())
+        np.testing.assert_array_equal(res["count"], [0, 0])
+
+    def test_float_sums_are_local_to_the_window(self):
+        # a global cumsum would carry the rounding error of 1e17 (ulp 16) into every later window
+        values = np.ones(1_000)
+        values[0] = 1e17
+        res = rolling(np.arange(1_000), values, 3, aggs=("sum", "mean"))
+        np.testing.assert_array_equal(res["sum"][3:], np.full(997, 3.0))
+        np.testing.assert_array_equal(res["mean"][3:], np.ones(997))
+        self.assertEqual(res["sum"][0], 1e17)
+        rng = np.random.default_rng(3)
+        ts = np.cumsum(rng.integers(0, 3, size=500))
+        values = rng.random(500) * 1e6
+        for window in (1, 7, 100, 5_000):
+            expected = [values[(ts > t - window) & (np.arange(500) <= i)].sum() for i, t in enumerate(ts)]
+            np.testing.assert_allclose(rolling(ts, values, window, aggs=("sum",))["sum"], expected, rtol=1e-12)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            rolling(np.array([2, 1]), np.array([1, 2]), 10)
+        with self.assertRaises(ValueError):
+            rolling(np.array([1, 2]), np.array([1, 2]), 10, closed="middle")
+        with self.assertRaises(ValueError):
+            rolling(np.array([1, 2]), np.array([1, 2]), dTS("1M"))
+        with self.assertRaises(ValueError):
+            rolling(np.array([1, 2]), np.array([1, 2]), 10, aggs=("median",))
+
+
+class TestRollingWindow(TestCase):
+    def test_streaming_matches_batch(self):
+        rng = np.random.default_rng(7)
+        ts = np.cumsum(rng.integers(0, 3, size=300)) * SEC
+        values = rng.integers(-50, 50, size=300)
+        for closed in ("right", "left", "both", "neither"):
+            with self.subTest(closed=closed):
+                batch = rolling(ts, values, 4 * SEC, aggs=("count", "sum", "min", "max"), closed=closed)
+                window = RollingWindow(dTS("4s"), closed=closed)
+                for i, (t, v) in enumerate(zip(ts, values)):
+                    res = window.update(int(t), int(v))
+                    self.assertEqual(res["count"], batch["count"][i])
+                    self.assertEqual(res["sum"], batch["sum"][i])
+                    np.testing.assert_array_equal([res["min"], res["max"]], [batch["min"][i], batch["max"][i]])
+
+    def test_memory_is_bounded_by_window(self):
+        window = RollingWindow(timedelta(seconds=10))
+        for i in range(1000):
+            window.update(i * SEC, 1.0)
+        self.assertEqual(len(window), 10)
+
+    def test_sum_does_not_drift(self):
+        window = RollingWindow(3)
+        window.update(0, 1e17)
+        for i in range(1, 20):
+            res = window.update(i, 1.0)
+        self.assertEqual(res["sum"], 3.0)
+        self.assertEqual(res["mean"], 1.0)
+
+    def test_out_of_order_raises(self):
+        window = RollingWindow(10)
+        window.update(5, 1)
+        with self.assertRaises(ValueError):
+            window.update(4, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
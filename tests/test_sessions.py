@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose:
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+import unittest
+from datetime import timedelta
+from unittest import TestCase
+
+import numpy as np
+
+from tsx import iTSms, iTSns, TSInterval
+from tsx.sessions import sessionize, Sessionizer
+from tsx.ts import dTS
+
+SEC = 1_000_000_000
+
+
+class TestSessionize(TestCase):
+    def test_single_stream(self):
+        ts = np.array([0, 5, 10, 40, 41, 100], dtype=np.int64) * SEC
+        sessions = sessionize(ts, dTS("10s"))
+        np.testing.assert_array_equal(sessions.ids, [0, 0, 0, 1, 1, 2])
+        np.testing.assert_array_equal(sessions.start, np.array([0, 40, 100]) * SEC)
+        np.testing.assert_array_equal(sessions.end, np.array([10, 41, 100]) * SEC)
+        np.testing.assert_array_equal(sessions.n_events, [3, 2, 1])
+        self.assertIsNone(sessions.key)
+
+    def test_gap_must_be_strictly_exceeded(self):
+        sessions = sessionize([iTSms(0), iTSms(1000), iTSms(2001)], timedelta(seconds=1))
+        np.testing.assert_array_equal(sessions.ids, [0, 0, 1])
+
+    def test_by_keys_with_unsorted_input(self):
+        ts = np.array([30, 0, 5, 1, 50, 12], dtype=np.int64) * SEC
+        keys = np.array(["b", "a", "a", "b", "a", "a"])
+        sessions = sessionize(ts, 10 * SEC, by=keys)
+        np.testing.assert_array_equal(sessions.key, ["a", "a", "b", "b"])
+        np.testing.assert_array_equal(sessions.start, np.array([0, 50, 1, 30]) * SEC)
+        np.testing.assert_array_equal(sessions.n_events, [3, 1, 1, 1])
+        np.testing.assert_array_equal(sessions.ids, [3, 0, 0, 2, 1, 0])
+
+    def test_keys_of_mixed_types(self):
+        ts = np.array([0, 1, 2, 3, 30], dtype=np.int64) * SEC
+        sessions = sessionize(ts, 10 * SEC, by=["a", 1, "1", 1, "a"])
+        self.assertEqual(sessions.key.tolist(), ["a", "a", 1, "1"])
+        np.testing.assert_array_equal(sessions.n_events, [1, 1, 2, 1])
+        np.testing.assert_array_equal(sessions.ids, [0, 2, 3, 2, 1])
+        sessions = sessionize(ts[:3], 10 * SEC, by=np.array([None, "a", None], dtype=object))
+        self.assertEqual(sessions.key.tolist(), [None, "a"])
+
+    def test_to_intervals(self):
+        sessions = sessionize(np.array([0, 3, 100], dtype=np.int64) * SEC, dTS("5s"))
+        intervals = sessions.to_intervals()
+        self.assertEqual(intervals[0], TSInterval(iTSns(0), iTSns(3 * SEC + 1)))
+        self.assertEqual(intervals[1], TSInterval(iTSns(100 * SEC), iTSns(100 * SEC + 1)))
+
+    def test_empty(self):
+        sessions = sessionize(np.empty(0, dtype=np.int64), dTS("5s"))
+        self.assertEqual(sessions.ids.size, 0)
+        self.assertEqual(sessions.start.size, 0)
+
+
+class TestSessionizer(TestCase):
+    def test_streaming_matches_batch(self):
+        rng = np.random.default_rng(3)
+        ts = np.sort(rng.integers(0, 1000, size=300)) * SEC
+        keys = rng.integers(0, 5, size=300)
+        batch = sessionize(ts, dTS("20s"), by=keys)
+        sessionizer = Sessionizer(dTS("20s"))
+        closed = []
+        for t, key in zip(ts, keys):
+            _, newly_closed = sessionizer.update(int(t), int(key))
+            closed.extend(newly_closed)
+        closed.extend(sessionizer.flush())
+        self.assertEqual(sessionizer.open_sessions, 0)
+        streamed = sorted((s.key, s.start, s.end, s.n_events) for s in closed)
+        expected = list(zip(batch.key.tolist(), batch.start.tolist(), batch.end.tolist(), batch.n_events.tolist()))
+        self.assertEqual(streamed, expected)
+
+    def test_sessions_close_when_time_passes(self):
+        sessionizer = Sessionizer(dTS("10s"))
+        first_id, _ = sessionizer.update(iTSns(0), "a")
+        same_id, _ = sessionizer.update(iTSns(10 * SEC), "a")
+        self.assertEqual(first_id, same_id)
+        self.assertEqual(sessionizer.expire(20 * SEC), [])
+        closed = sessionizer.expire(20 * SEC + 1)
+        self.assertEqual([(s.key, s.start, s.end, s.n_events) for s in closed], [("a", 0, 10 * SEC, 2)])
+        new_id, _ = sessionizer.update(30 * SEC, "a")
+        self.assertNotEqual(new_id, first_id)
+        with self.assertRaises(ValueError):
+            sessionizer.update(0, "a")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose:
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+import multiprocessing
+import pickle
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import resource_tracker
+from unittest import TestCase, mock
+
+import numpy as np
+
+from tsx import iTSms, iTSns, TSInterval
+from tsx import shared
+from tsx.shared import share_ts_column, attach_ts_column
+
+
+def _count_in_interval(args):
+    column, start_ms, end_ms = args
+    with column:
+        lo, hi = column.range_indices(TSInterval(iTSms(start_ms), iTSms(end_ms)))
+        return column.prec, hi - lo
+
+
+class TestSharedTSColumn(TestCase):
+    def setUp(self):
+        self.ts = np.arange(0, 10_000, 10, dtype=np.int64)
+        self.column = share_ts_column(self.ts, prec="ms")
+
+    def tearDown(self):
+        if not self.column.closed:
+            self.column.close()
+        if self.column._owner:
+            self.column.unlink()
+
+    def test_attach_is_read_only_view(self):
+        attached = attach_ts_column(self.column.name)
+        self.assertEqual(attached.prec, "ms")
+        self.assertTrue(attached.is_sorted)
+        self.assertEqual(len(attached), self.ts.size)
+        np.testing.assert_array_equal(attached.array, self.ts)
+        with self.assertRaises(ValueError):
+            attached.array[0] = 1
+        with self.assertRaises(ValueError):
+            attached.unlink()
+        attached.close()
+        attached.close()
+        self.assertTrue(attached.closed)
+        with self.assertRaises(ValueError):
+            _ = attached.array
+
+    def test_range_queries_use_column_precision(self):
+        interval = TSInterval(iTSns(19_999_999), iTSns(40_000_001))
+        self.assertEqual(self.column.bounds(interval), (20, 40))
+        self.assertEqual(self.column.range_indices(interval), (2, 5))
+        np.testing.assert_array_equal(self.column.slice(interval), [20, 30, 40])
+        self.assertEqual(self.column.slice(TSInterval(iTSms(20_000), iTSms(30_000))).size, 0)
+
+    def test_pickle_sends_only_the_name(self):
+        payload = pickle.dumps(self.column)
+        self.assertLess(len(payload), 200)
+        attached = pickle.loads(payload)
+        np.testing.assert_array_equal(attached.array[-3:], self.ts[-3:])
+        attached.close()
+
+    def test_workers(self):
+        with multiprocessing.get_context("fork").Pool(2) as pool:
+            res = pool.map(_count_in_interval, [(self.column, 0, 95), (self.column, 5_000, 20_000)])
+        self.assertEqual(res, [("ms", 10), ("ms", 500)])
+        np.testing.assert_array_equal(self.column.array, self.ts)
+
+    def test_concurrent_attach_leaves_the_tracker_alone(self):
+        register = resource_tracker.register
+
+        def attach_and_close(_):
+            attach_ts_column(self.column.name).close()
+
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(attach_and_close, range(200)))
+        self.assertIs(resource_tracker.register, register)
+
+    @unittest.skipIf(sys.version_info >= (3, 13), "attached blocks aren't tracked at all since 3.13")
+    def test_attach_unregisters_only_foreign_blocks(self):
+        with mock.patch.object(resource_tracker, "unregister") as unregister:
+            attach_ts_column(self.column.name).close()
+            unregister.assert_not_called()
+            # as seen from a process that didn't create the block
+            with mock.patch.object(shared, "_OWNED_NAMES", set()):
+                attach_ts_column(self.column.name).close()
+            unregister.assert_called_once_with("/" + self.column.name, "shared_memory")
+
+    def test_unsorted_and_invalid(self):
+        with share_ts_column([3, 1, 2]) as column:
+            self.assertFalse(column.is_sorted)
+            with self.assertRaises(ValueError):
+                column.range_indices(TSInterval(iTSns(0), iTSns(5)))
+        with self.assertRaises(FileNotFoundError):
+            attach_ts_column(column.name)
+        with self.assertRaises(ValueError):
+            share_ts_column([1], prec="min")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,7 +22,7 @@ from dateutil import tz
 from pydantic import BaseModel
 
 from tsx import TS, TSMsec, iTS, iTSms, iTSus, iTSns, TSInterval
-from tsx.ts import dTS, BaseTS
+from tsx.ts import dTS, BaseTS, nsInterval, ALLEN_RELATIONS
 
 
 def run_test_from_iso(self: TestCase, cls: Type[BaseTS]):
@@ -563,6 +563,29 @@ class TestBaseTS(TestCase):
         ts = TS.from_parts_utc(2022, 12, 7, 1, 2, 3)
         self.assertEqual(ts, TS("2022-12-07T01:02:03Z"))
 
+    def test_comparisons_match_as_nsec(self):
+        stamps = [iTS(1), iTSms(999), iTSms(1_000), iTSus(1_000_001), iTSns(999_999_999), iTSns(1_000_000_000),
+                  TS(1.0), TS(1.0000004), TS(0.9999996), TS(1.000001), iTS(-1), iTSms(-1_000)]
+        for a in stamps:
+            for b in stamps:
+                with self.subTest(a=repr(a), b=repr(b)):
+                    a_ns, b_ns = int(a.as_nsec()), int(b.as_nsec())
+                    self.assertEqual(a < b, a_ns < b_ns)
+                    self.assertEqual(a <= b, a_ns <= b_ns)
+                    self.assertEqual(a > b, a_ns > b_ns)
+                    self.assertEqual(a >= b, a_ns >= b_ns)
+                    self.assertEqual(a == b, a_ns == b_ns)
+                    self.assertEqual(a != b, a_ns != b_ns)
+            self.assertEqual(hash(a), hash(int(a.as_nsec())))
+        self.assertEqual(sorted(stamps, key=lambda ts: int(ts.as_nsec())), sorted(stamps))
+
+    def test_comparisons_do_not_build_timestamps(self):
+        a, b, c = iTSms(1_000), iTSns(2_000_000_000), TS(1.5)
+        with patch.object(iTSns, "__new__", side_effect=AssertionError("no iTSns should be built")):
+            self.assertTrue(a < b and a <= c and b > c and b >= a and a != b and not a == c)
+            self.assertTrue(c < b and c > a and c >= a and c <= b)
+            self.assertEqual(len({a, b, c, iTS(1)}), 3)
+
     def test_comparisons(self):
         ts1 = TS("2022-12-07T00:00:00.000001Z")
         ts2 = TS("2022-12-07T00:00:00.000002Z")
@@ -1421,6 +1444,37 @@ class Test_iTSns(TestCase):
         self.assertEqual(0, BaseTS.ns_timestamp_from_iso("1970-01-01T00:00:00Z", utc=False))
         self.assertEqual(0, BaseTS.ns_timestamp_from_iso("1970-01-01T00:00:00Z"))
 
+    def test_rounding_modes(self):
+        ts = iTSns(1_500_500)
+        self.assertEqual(ts.as_usec(), 1_500)
+        self.assertEqual(ts.as_usec("half_up"), 1_501)
+        self.assertEqual(ts.as_usec("half_even"), 1_500)
+        self.assertEqual(ts.as_usec("floor"), 1_500)
+        self.assertEqual(ts.as_usec("ceil"), 1_501)
+        self.assertEqual(ts.as_msec("half_up"), 2)
+        self.assertEqual(ts.as_msec("floor"), 1)
+        self.assertEqual(iTSns(-1_500_000).as_msec("half_up"), -1)
+        self.assertEqual(iTSns(-1_500_000).as_msec("half_even"), -2)
+        self.assertEqual(iTSns(-1_500_000).as_msec("ceil"), -1)
+        self.assertEqual(iTSns(2_500_000_000).as_sec("half_even"), 2)
+        self.assertIsInstance(ts.as_msec("floor"), iTSms)
+        self.assertEqual(iTSms(1_500).as_sec("floor"), 1)
+        self.assertEqual(iTSms(1_500).as_nsec("floor"), 1_500_000_000)
+        self.assertEqual(TS(1.5).as_msec("floor"), 1_500)
+        self.assertEqual(TS(0.0000025).as_usec("half_up"), 3)
+        self.assertEqual(TS(-0.0000025).as_nsec("half_up"), -2_000)
+        self.assertEqual(TS(1.5).to_sec("floor"), 1)
+        self.assertEqual(TS(1.5).to_sec("ceil"), 2)
+        self.assertEqual(TS(-1.5).to_sec("half_up"), -1)
+        self.assertEqual(TS(1.4).to_sec(), iTS(TS(1.4)))
+        self.assertIsInstance(TS(1.5).to_sec("floor"), iTS)
+        with self.assertRaises(ValueError):
+            TS(1.5).to_sec("up")
+        with self.assertRaises(ValueError):
+            ts.as_msec("up")
+        with self.assertRaises(ValueError):
+            ts.as_nsec("up")
+
 
 class TestTimedeltaOps(TestCase):
     """Comprehensive tests for timedelta arithmetic operations across all timestamp classes."""
@@ -2248,6 +2302,269 @@ class TestTSInterval(TestCase):
         self.assertEqual(interval.end.as_dt(tz=custom_tz).isoformat(), "2026-01-01T00:00:00-05:00")
         self.assertEqual(interval.duration.as_sec(), 365 * 86400)
 
+    def test_from_calendar_periods_utc(self):
+        self.assertEqual(TSInterval.from_quarter(2024, 2), TSInterval(iTS("2024-04-01"), iTS("2024-07-01")))
+        self.assertEqual(TSInterval.from_month(2024, 2), TSInterval(iTS("2024-02-01"), iTS("2024-03-01")))
+        self.assertEqual(TSInterval.from_week(2025, 1), TSInterval(iTS("2024-12-30"), iTS("2025-01-06")))
+        self.assertEqual(TSInterval.from_day(2024, 2, 29), TSInterval(iTS("2024-02-29"), iTS("2024-03-01")))
+        self.assertEqual(TSInterval.from_hour(2024, 2, 29, 23), TSInterval(iTS("2024-02-29T23:00:00"), iTS("2024-03-01")))
+        self.assertIsInstance(TSInterval.from_month(2024, 1).start, iTS)
+        self.assertIsInstance(TSInterval.from_month(2024, 1, dtype=iTSms).start, iTSms)
+
+    def test_from_calendar_periods_outside_ns_range(self):
+        # int64 nanoseconds only cover 1678..2262, the other classes must get the right year
+        for dtype in (iTS, iTSms, iTSus, TS):
+            with self.subTest(dtype=dtype):
+                for year in (1600, 2300, 3000):
+                    interval = TSInterval.from_year(year, dtype=dtype)
+                    self.assertEqual(interval.start.as_dt(), datetime(year, 1, 1, tzinfo=timezone.utc))
+                    self.assertEqual(interval.end.as_dt(), datetime(year + 1, 1, 1, tzinfo=timezone.utc))
+                ny = TSInterval.from_year(1600, tz="America/New_York", dtype=dtype)
+                self.assertEqual(ny.start.as_dt().year, 1600)
+        self.assertEqual(TSInterval.from_month(2500, 1).start.as_dt(), datetime(2500, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual(TSInterval.from_day(1500, 1, 1), TSInterval(iTS(datetime(1500, 1, 1, tzinfo=timezone.utc)),
+                                                                     iTS(datetime(1500, 1, 2, tzinfo=timezone.utc))))
+        self.assertEqual(TSInterval.from_hour(1500, 1, 1, 5, tz="Europe/Paris").duration.as_sec(), 3600)
+        quarters = list(TSInterval.periods(TSInterval.from_year(2300), "quarter"))
+        self.assertEqual([q.start.as_dt().month for q in quarters], [1, 4, 7, 10])
+        self.assertEqual(quarters[0].start.as_dt().year, 2300)
+        with self.assertRaises(OverflowError):
+            TSInterval.from_year(1600, dtype=iTSns)
+        with self.assertRaises(OverflowError):
+            TSInterval.from_year(2300, dtype=iTSns)
+
+    def test_from_calendar_periods_invalid(self):
+        with self.assertRaises(ValueError):
+            TSInterval.from_quarter(2024, 5)
+        with self.assertRaises(ValueError):
+            TSInterval.from_month(2024, 13)
+        with self.assertRaises(ValueError):
+            TSInterval.from_hour(2024, 1, 1, 24)
+        with self.assertRaises(ValueError):
+            list(TSInterval.periods(TSInterval.from_year(2024), "minute"))
+
+    def test_from_day_dst(self):
+        tz_name = "America/New_York"
+        self.assertEqual(TSInterval.from_day(2024, 3, 10, tz=tz_name).duration.as_sec(), 23 * 3600)
+        self.assertEqual(TSInterval.from_day(2024, 11, 3, tz=tz_name).duration.as_sec(), 25 * 3600)
+        interval = TSInterval.from_day(2024, 11, 3, tz=tz_name)
+        self.assertEqual(interval.start.as_dt(tz=pytz.timezone(tz_name)).isoformat(), "2024-11-03T00:00:00-04:00")
+        self.assertEqual(interval.end.as_dt(tz=pytz.timezone(tz_name)).isoformat(), "2024-11-04T00:00:00-05:00")
+        # +05:45 offset
+        self.assertEqual(TSInterval.from_day(2024, 1, 1, tz="Asia/Kathmandu").start, iTS("2023-12-31T18:15:00"))
+
+    def test_from_hour_dst(self):
+        tz_name = "America/New_York"
+        repeated = TSInterval.from_hour(2024, 11, 3, 1, tz=tz_name)
+        self.assertEqual(repeated, TSInterval(iTS("2024-11-03T05:00:00"), iTS("2024-11-03T06:00:00")))
+        skipped = TSInterval.from_hour(2024, 3, 10, 2, tz=tz_name)
+        self.assertEqual(skipped, TSInterval(iTS("2024-03-10T07:00:00"), iTS("2024-03-10T08:00:00")))
+
+    def test_periods_days_of_year(self):
+        tz_name = "America/New_York"
+        days = list(TSInterval.periods(TSInterval.from_year(2024, tz=tz_name), "day", tz=tz_name))
+        self.assertEqual(len(days), 366)
+        self.assertEqual({day.duration.as_sec() for day in days}, {86400, 23 * 3600, 25 * 3600})
+        for prev, nxt in zip(days, days[1:]):
+            self.assertEqual(prev.end, nxt.start)
+
+    def test_periods_hours_across_fall_back(self):
+        tz_name = "America/New_York"
+        hours = list(TSInterval.periods(TSInterval.from_day(2024, 11, 3, tz=tz_name), "hour", tz=tz_name))
+        self.assertEqual(len(hours), 25)
+        local_hours = [h.start.as_dt(tz=pytz.timezone(tz_name)).hour for h in hours]
+        self.assertEqual(local_hours[:4], [0, 1, 1, 2])
+        self.assertTrue(all(h.duration.as_sec() == 3600 for h in hours))
+
+    def test_periods_partial_span(self):
+        span = TSInterval(iTSms("2024-01-15"), iTSms("2024-03-02"))
+        months = list(TSInterval.periods(span, "month"))
+        self.assertEqual([m.start for m in months], [iTSms("2024-01-01"), iTSms("2024-02-01"), iTSms("2024-03-01")])
+        self.assertIsInstance(months[0].start, iTSms)
+        weeks = list(TSInterval.periods(TSInterval.from_year(2024), "week"))
+        self.assertEqual(len(weeks), 53)
+        self.assertEqual(len(list(TSInterval.periods(TSInterval.from_year(2024), "quarter"))), 4)
+
+    def test_periods_of_float_span(self):
+        span = TSInterval(TS("2024-01-15T10:30:00.5"), TS("2024-01-17T00:00:00.25"))
+        days = list(TSInterval.periods(span, "day"))
+        self.assertEqual([d.start for d in days], [TS("2024-01-15"), TS("2024-01-16"), TS("2024-01-17")])
+        self.assertIsInstance(days[0].start, TS)
+        self.assertEqual(days[-1].end, TS("2024-01-18"))
+
+
+    def test_range(self):
+        interval = TSInterval(iTSms("2024-01-01"), iTSms("2024-01-01T00:00:10"))
+        stamps = list(interval.range(dTS("3s")))
+        self.assertEqual(stamps, [iTSms("2024-01-01T00:00:00"), iTSms("2024-01-01T00:00:03"),
+                                  iTSms("2024-01-01T00:00:06"), iTSms("2024-01-01T00:00:09")])
+        self.assertTrue(all(type(ts) is iTSms for ts in stamps))
+        self.assertEqual(list(interval.range(5)), list(interval.range(timedelta(seconds=5))))
+        self.assertEqual(len(list(interval.range(5))), 2)
+        self.assertEqual(list(interval.range(5, inclusive=True))[-1], interval.end)
+        self.assertEqual(list(TSInterval(TS(0), TS(1)).range(0.25)), [TS(0), TS(0.25), TS(0.5), TS(0.75)])
+
+    def test_range_months(self):
+        interval = TSInterval(iTS("2024-01-31T12:00:00"), iTS("2024-05-31T12:00:00"))
+        expected = [iTS("2024-01-31T12:00:00"), iTS("2024-02-29T12:00:00"), iTS("2024-03-31T12:00:00"), iTS("2024-04-30T12:00:00")]
+        self.assertEqual(list(interval.range(dTS("1M"))), expected)
+        self.assertEqual(list(interval.range(dTS("1M"), inclusive=True)), expected + [interval.end])
+        self.assertEqual(interval.arange(dTS("1M")).tolist(), [int(ts.as_nsec()) for ts in expected])
+        self.assertEqual(list(TSInterval(iTS("2020-02-29"), iTS("2024-03-01")).range(dTS("1Y")))[-1], iTS("2024-02-29"))
+
+    def test_arange_matches_range(self):
+        interval = TSInterval(iTSus("2024-01-01"), iTSus("2024-01-02"))
+        for step in (dTS("7m"), timedelta(hours=1, microseconds=3), 3600, dTS("1d")):
+            for inclusive in (False, True):
+                arr = interval.arange(step, inclusive=inclusive)
+                self.assertEqual(arr.dtype, np.int64)
+                self.assertEqual(arr.tolist(), [int(ts.as_nsec()) for ts in interval.range(step, inclusive=inclusive)])
+
+    def test_range_invalid_step(self):
+        interval = TSInterval(iTS(0), iTS(10))
+        for step in (0, -1, dTS("-1M"), timedelta(0)):
+            with self.assertRaises(ValueError):
+                list(interval.range(step))
+            with self.assertRaises(ValueError):
+                interval.arange(step)
+        with self.assertRaises(TypeError):
+            interval.arange("1s")
+
+    def test_range_step_finer_than_the_class_unit(self):
+        interval = TSInterval(iTS(0), iTS(10))
+        for step in (0.5, 1.5, dTS("100ms"), timedelta(seconds=2, microseconds=1)):
+            with self.assertRaises(ValueError):
+                list(interval.range(step))
+            with self.assertRaises(ValueError):
+                interval.arange(step)
+        self.assertEqual(list(interval.range(2.0)), [iTS(0), iTS(2), iTS(4), iTS(6), iTS(8)])
+        self.assertEqual(len(list(TSInterval(iTSms(0), iTSms(10_000)).range(0.5))), 20)
+
+    def test_chunks_aligned(self):
+        interval = TSInterval(iTSms("2024-03-09T18:30:00"), iTSms("2024-03-12T06:00:00"))
+        chunks = list(interval.chunks(dTS("1d")))
+        self.assertEqual([c.start for c in chunks], [interval.start, iTSms("2024-03-10"), iTSms("2024-03-11"), iTSms("2024-03-12")])
+        self.assertEqual(chunks[-1].end, interval.end)
+        self.assertTrue(all(type(c.start) is iTSms and type(c.end) is iTSms for c in chunks))
+        local = list(interval.chunks(dTS("1d"), tz="America/New_York"))
+        self.assertEqual([c.duration.as_sec() for c in local], [37800, 23 * 3600, 86400, 7200])
+        monday = list(TSInterval(iTS("2024-01-03"), iTS("2024-01-20")).chunks(dTS("1w")))
+        self.assertEqual([c.start for c in monday], [iTS("2024-01-03"), iTS("2024-01-08"), iTS("2024-01-15")])
+
+    def test_chunks_not_aligned(self):
+        interval = TSInterval(iTS("2024-01-15"), iTS("2024-05-02"))
+        self.assertEqual([c.start for c in interval.chunks(dTS("2M"), align=False)], [iTS("2024-01-15"), iTS("2024-03-15")])
+        self.assertEqual([c.start for c in interval.chunks(dTS("1M"))],
+                         [iTS("2024-01-15"), iTS("2024-02-01"), iTS("2024-03-01"), iTS("2024-04-01"), iTS("2024-05-01")])
+        self.assertEqual([c.end for c in TSInterval(iTS(5), iTS(12)).chunks(3, align=False)], [iTS(8), iTS(11), iTS(12)])
+        self.assertEqual([c.end for c in TSInterval(iTS(5), iTS(12)).chunks(3)], [iTS(6), iTS(9), iTS(12)])
+        self.assertEqual(list(TSInterval(iTS(5), iTS(6)).chunks(dTS("1d"))), [TSInterval(iTS(5), iTS(6))])
+        with self.assertRaises(ValueError):
+            list(interval.chunks(0))
+
+    def test_split_n(self):
+        interval = TSInterval(iTS(0), iTS(10))
+        chunks = interval.split_n(3)
+        self.assertEqual(chunks, [TSInterval(iTS(0), iTS(3)), TSInterval(iTS(3), iTS(6)), TSInterval(iTS(6), iTS(10))])
+        self.assertEqual(interval.split_n(1), [interval])
+        self.assertEqual(len(TSInterval(iTSns(0), iTSns(7)).split_n(7)), 7)
+        with self.assertRaises(ValueError):
+            TSInterval(iTS(0), iTS(2)).split_n(3)
+        with self.assertRaises(ValueError):
+            interval.split_n(0)
+
+
+    def test_relation(self):
+        a = TSInterval(iTS(10), iTS(20))
+        cases = [((0, 5), "after"), ((0, 10), "met_by"), ((0, 15), "overlapped_by"), ((0, 20), "finishes"), ((0, 25), "during"),
+                 ((10, 15), "started_by"), ((10, 20), "equals"), ((10, 25), "starts"), ((12, 18), "contains"), ((15, 20), "finished_by"),
+                 ((15, 25), "overlaps"), ((20, 25), "meets"), ((25, 30), "before")]
+        for (start, end), expected in cases:
+            with self.subTest(other=(start, end)):
+                other = TSInterval(iTS(start), iTS(end))
+                self.assertEqual(a.relation(other), expected)
+                self.assertEqual(other.relation(a), ALLEN_RELATIONS[12 - ALLEN_RELATIONS.index(expected)])
+        # bounds of different classes are compared in nanoseconds
+        self.assertEqual(a.relation(TSInterval(iTSms(20_000), iTSms(20_001))), "meets")
+        self.assertEqual(a.relation(TSInterval(iTSns(10_000_000_001), iTSns(19_999_999_999))), "contains")
+
+
+class TestNsInterval(TestCase):
+    def setUp(self):
+        self.ts_a = TSInterval(iTSms(1_000), iTSms(5_000))
+        self.ts_b = TSInterval(iTSms(3_000), iTSms(9_000))
+        self.a = nsInterval.from_interval(self.ts_a)
+        self.b = nsInterval.from_interval(self.ts_b)
+
+    def test_relation(self):
+        self.assertEqual(self.a.relation(self.b), self.ts_a.relation(self.ts_b))
+        self.assertEqual(self.a.relation(self.b), "overlaps")
+        self.assertEqual(self.b.relation(self.a), "overlapped_by")
+
+    def test_round_trip_keeps_class(self):
+        self.assertEqual(self.a.start_ns, 1_000_000_000)
+        self.assertIsInstance(self.a.start, iTSms)
+        self.assertEqual(self.a.to_interval(), self.ts_a)
+        ts_interval = TSInterval(TS(1.5), TS(2.25))
+        self.assertEqual(nsInterval.from_interval(ts_interval).to_interval(), ts_interval)
+        self.assertIsInstance(nsInterval(0, 10).end, iTSns)
+        self.assertEqual(pickle.loads(pickle.dumps(self.a)), self.a)
+
+    def test_methods_match_ts_interval(self):
+        self.assertEqual(self.a.duration, self.ts_a.duration)
+        self.assertEqual(self.a.midpoint, TS(3))
+        self.assertEqual(self.a.isoformat(), self.ts_a.isoformat())
+        self.assertEqual(str(self.a), str(self.ts_a))
+        for ts in (iTS(0), iTS(1), iTSms(3_000), iTSns(5_000_000_000), iTSus(5_000_001)):
+            self.assertEqual(self.a.contains(ts), self.ts_a.contains(ts))
+            self.assertEqual(self.a.contains_exclusive(ts), self.ts_a.contains_exclusive(ts))
+        self.assertTrue(1_000_000_000 in self.a)
+        self.assertEqual(self.a.overlaps(self.b), self.ts_a.overlaps(self.ts_b))
+        self.assertEqual((self.a & self.b).to_interval(), self.ts_a & self.ts_b)
+        self.assertEqual((self.a | self.b).to_interval(), self.ts_a | self.ts_b)
+        self.assertEqual(self.a < self.b, self.ts_a < self.ts_b)
+        self.assertEqual(hash(self.a), hash(self.ts_a))
+        c = nsInterval(iTSms(5_000), iTSms(6_000))
+        self.assertTrue(self.a.is_adjacent_to(c))
+        self.assertTrue(self.a.is_before(c))
+        self.assertFalse(self.a.overlaps(c))
+        self.assertTrue(self.a.overlaps_inclusive(c))
+        self.assertIsNone(self.a & c)
+        self.assertIsNone(nsInterval(0, 1) | c)
+
+    def test_derived_intervals_match_ts_interval(self):
+        ts_interval = TSInterval(TS(10), TS(20.5))
+        interval = nsInterval.from_interval(ts_interval)
+        self.assertEqual(interval.as_iso, ts_interval.as_iso)
+        self.assertEqual(interval.as_iso_basic, ts_interval.as_iso_basic)
+        for delta in (1, -2, dTS("250ms"), timedelta(seconds=3, microseconds=5)):
+            self.assertEqual(interval.shift(delta).to_interval(), ts_interval.shift(delta))
+            self.assertEqual(interval.expand(delta, 1).to_interval(), ts_interval.expand(delta, 1))
+            self.assertEqual(interval.shrink(1, delta).to_interval(), ts_interval.shrink(1, delta))
+        self.assertEqual([part.to_interval() for part in interval.split(TS(12))], list(ts_interval.split(TS(12))))
+        other = TSInterval(TS(25), TS(30))
+        self.assertEqual(interval.gap_to(nsInterval.from_interval(other)), ts_interval.gap_to(other))
+        self.assertEqual(nsInterval.from_interval(other).gap_to(interval), other.gap_to(ts_interval))
+        self.assertEqual(self.a.gap_to(self.b), -2.0)
+        self.assertEqual(self.a.expand(dTS("1M")).start, iTSms.from_iso("1969-12-01T00:00:01Z"))
+        self.assertIsInstance(self.a.shift(1).start, iTSms)
+        self.assertEqual(interval.shift(1.5).start, TS(11.5))
+        self.assertEqual(self.a.shift(dTS("2s")).start_ns, 3_000_000_000)
+        left, right = self.a.split(2_000_000_000)
+        self.assertEqual((left.end_ns, right.start_ns), (2_000_000_000, 2_000_000_000))
+        with self.assertRaises(ValueError):
+            self.a.split(iTSms(1_000))
+        with self.assertRaises(ValueError):
+            self.a.shrink(2, 2)
+        with self.assertRaises(TypeError):
+            self.a.shift("1s")
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            nsInterval(iTSms(5), iTSms(5))
+        with self.assertRaises(AttributeError):
+            self.a._start_ns = 0
+
 
 class TestDTS(TestCase):
     def test_conversion_helpers_return_ints(self):
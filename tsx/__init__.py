@@ -1,2 +1,13 @@
-from .ts import TS, TSMsec, iTS, iTSms, iTSus, iTSns, TSInterval, FIRST_MONDAY_TS, DAY_SEC, DAY_MSEC, WEEK_SEC
-
+from .ts import TS, TSMsec, iTS, iTSms, iTSus, iTSns, TSInterval, nsInterval, ALLEN_RELATIONS, FIRST_MONDAY_TS, DAY_SEC, DAY_MSEC, WEEK_SEC
+from .bucket import bucket_aggregate, build_bars, BarBuilder, Bars, Bar
+from .rolling import rolling, RollingWindow
+from .align import asof_join, make_grid, reindex, time_weighted_mean
+from .sessions import sessionize, Sessionizer
+from .quality import profile, TSProfile
+from .arrays import unique, dedupe, to_ns_array, convert
+from .shared import share_ts_column, attach_ts_column, SharedTSColumn
+from .intervals import (
+    TSIntervalSet, IntervalIndex, IntervalArray, assign, interval_join, iter_interval_join, overlap_profile, OverlapProfile, allen_relations,
+    IntervalCoalescer, coalesce, acoalesce,
+)
+from .parallel import map_intervals, iter_map_intervals
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose: Calendar period boundaries (year ... hour) in any time zone, computed in batches from the cached transition tables
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+from datetime import date, tzinfo as dt_tzinfo
+from typing import Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+from ._tz import get_tz, local_to_utc_s, utc_offsets_s, utc_to_local_s
+
+CALENDAR_UNITS = ("year", "quarter", "month", "week", "day", "hour")
+HOUR_NS = 3600 * 1_000_000_000
+DAY_NS = 24 * HOUR_NS
+# the boundaries are computed in int64 seconds, which (unlike nanoseconds) cover the whole calendar range (years 1..9999)
+HOUR_SEC = 3600
+# offsets are sampled at this step to find the ones in use; every offset lasts much longer than that
+_OFFSET_SAMPLING_SEC = 15 * 60
+# datetime64 unit and number of units per period
+_STEPS = {"year": ("Y", 1), "quarter": ("M", 3), "month": ("M", 1), "week": ("D", 7), "day": ("D", 1)}
+# 1970-01-01 is a Thursday: day index + 3 is 0 on Mondays (mod 7)
+_MONDAY_SHIFT = 3
+
+
+def check_unit(unit: str) -> None:
+    if unit not in CALENDAR_UNITS:
+        raise ValueError(f"Invalid calendar unit: {unit!r}. Expected one of {CALENDAR_UNITS}")
+
+
+def _to_local(ts_s: int, tz: dt_tzinfo) -> int:
+    return int(utc_to_local_s(np.array([ts_s], dtype=np.int64), tz)[0])
+
+
+def _period_index(local_s: int, unit: str) -> int:
+    """Returns the index (in datetime64 units of the period) of the period containing the local wall-clock time"""
+    np_unit, step = _STEPS[unit]
+    idx = int(np.datetime64(local_s, "s").astype(f"datetime64[{np_unit}]").astype(np.int64))
+    if unit == "quarter":
+        return idx - idx % 3
+    if unit == "week":
+        return idx - (idx + _MONDAY_SHIFT) % 7
+    return idx
+
+
+def _local_bounds_s(first_index: int, count: int, unit: str) -> np.ndarray:
+    """Returns the local wall-clock seconds of `count` consecutive period boundaries starting at first_index"""
+    np_unit, step = _STEPS[unit]
+    indexes = first_index + np.arange(count, dtype=np.int64) * step
+    return indexes.astype(f"datetime64[{np_unit}]").astype("datetime64[s]").astype(np.int64)
+
+
+def _hour_bounds_s(first_s: int, count: int, tz: dt_tzinfo) -> np.ndarray:
+    """
+    Returns the first `count` UTC instants >= first_s that are local hour boundaries. Repeated local hours (DST end)
+    appear twice and skipped ones (DST start) not at all, so every hour period lasts exactly one hour.
+    """
+    res = []
+    found = 0
+    start = first_s
+    while found < count:
+        stop = start + (count - found + 1) * HOUR_SEC
+        samples = np.arange(start, stop + _OFFSET_SAMPLING_SEC, _OFFSET_SAMPLING_SEC, dtype=np.int64)
+        # with the offset o, local hours start at the UTC instants u with (u + o) % HOUR_SEC == 0;
+        # offsets aren't always multiples of 15 minutes (ex: local mean time before 1900), so every offset in use is tried
+        candidates = np.unique(np.concatenate([np.arange(start + (-start - o) % HOUR_SEC, stop, HOUR_SEC, dtype=np.int64)
+                                               for o in np.unique(utc_offsets_s(samples, tz)).tolist()]))
+        hours = candidates[utc_to_local_s(candidates, tz) % HOUR_SEC == 0]
+        res.append(hours[:count - found])
+        found += res[-1].size
+        start = stop
+    return np.concatenate(res)
+
+
+def period_of(ts_s: int, unit: str, tz: Optional[Union[dt_tzinfo, str]] = None) -> Tuple[int, int]:
+    """Returns the UTC [start, end) bounds, in seconds, of the calendar period containing the timestamp (in seconds)"""
+    check_unit(unit)
+    tz = get_tz(tz)
+    local_s = _to_local(ts_s, tz)
+    if unit == "hour":
+        bounds = _hour_bounds_s(ts_s - local_s % HOUR_SEC, 2, tz)
+    else:
+        bounds = local_to_utc_s(_local_bounds_s(_period_index(local_s, unit), 2, unit), tz)
+    return int(bounds[0]), int(bounds[1])
+
+
+def calendar_period(unit: str, tz: Optional[Union[dt_tzinfo, str]], year: int, index: int = 1, day: int = 1, hour: int = 0) -> Tuple[int, int]:
+    """
+    Returns the UTC [start, end) bounds, in seconds, of a calendar period given by its local components:
+    (year), (year, quarter), (year, month), (ISO year, ISO week), (year, month, day) or (year, month, day, hour).
+    """
+    if unit == "quarter":
+        if not 1 <= index <= 4:
+            raise ValueError(f"Quarter should be in 1..4, got {index}")
+        first = date(year, 3 * index - 2, 1)
+    elif unit == "week":
+        first = date.fromisocalendar(year, index, 1)
+    else:
+        first = date(year, index, day)
+        if not 0 <= hour <= 23:
+            raise ValueError(f"Hour should be in 0..23, got {hour}")
+    tz = get_tz(tz)
+    local_s = int(np.datetime64(first, "s").astype(np.int64))
+    if unit == "hour":
+        local_s += hour * HOUR_SEC
+        # a local hour skipped by a DST start resolves to the first hour after the gap
+        return period_of(int(local_to_utc_s(np.array([local_s], dtype=np.int64), tz)[0]), "hour", tz)
+    bounds = local_to_utc_s(_local_bounds_s(_period_index(local_s, unit), 2, unit), tz)
+    return int(bounds[0]), int(bounds[1])
+
+
+def iter_periods(start_s: int, end_s: int, unit: str, tz: Optional[Union[dt_tzinfo, str]] = None,
+                 batch: int = 256) -> Iterator[Tuple[int, int]]:
+    """
+    Lazily yields the UTC [start, end) bounds, in seconds, of the consecutive calendar periods overlapping [start_s, end_s),
+    computing `batch` boundaries at a time.
+    """
+    check_unit(unit)
+    tz = get_tz(tz)
+    first_start, _ = period_of(start_s, unit, tz)
+    if unit != "hour":
+        index = _period_index(_to_local(first_start, tz), unit)
+        step = _STEPS[unit][1]
+    while True:
+        if unit == "hour":
+            bounds = _hour_bounds_s(first_start, batch + 1, tz)
+        else:
+            bounds = local_to_utc_s(_local_bounds_s(index, batch + 1, unit), tz)
+            index += batch * step
+        for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+            if lo >= end_s:
+                return
+            yield lo, hi
+        first_start = int(bounds[-1])
+
+
+def add_months_ns(ts_ns: int, months: np.ndarray) -> np.ndarray:
+    """
+    Vectorised dTS month arithmetic: returns ts_ns + months[i] calendar months (UTC) for every i, as int64 nanoseconds.
+    The time of day is kept and the day of month is clipped to the last day of the target month (Jan 31 + 1M -> Feb 28/29).
+    """
+    day_ns = ts_ns % DAY_NS
+    day = np.datetime64(ts_ns // DAY_NS, "D")
+    month = day.astype("datetime64[M]")
+    day_of_month = int((day - month.astype("datetime64[D]")).astype(np.int64))
+    target = month + np.asarray(months, dtype=np.int64)
+    first = target.astype("datetime64[D]").astype(np.int64)
+    last = (target + 1).astype("datetime64[D]").astype(np.int64) - 1
+    return np.minimum(first + day_of_month, last) * DAY_NS + day_ns
@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose: Internal helpers shared by the columnar (NumPy based) timestamp utilities
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+from datetime import date, datetime, time, timedelta, timezone
+from itertools import groupby
+from numbers import Integral
+from typing import Any, Callable, Dict, Optional, Tuple, Union, overload
+
+import numpy as np
+
+from .ts import dTS, BaseTS, iBaseTS, iTSns, TS, TSInterval, EPOCH_DT_UTC
+
+NANOS_PER_PREC = {"s": 1_000_000_000, "ms": 1_000_000, "us": 1_000, "ns": 1}
+INT64_MAX = np.iinfo(np.int64).max
+
+
+def as_int64(ts_array: Any) -> np.ndarray:
+    """
+    Returns the timestamps as a 1-D int64 array without changing their units.
+    Accepts int64 arrays (returned as is, no copy), sequences of ints or of iBaseTS instances.
+    """
+    if isinstance(ts_array, np.ndarray) and ts_array.dtype == np.int64:
+        arr = ts_array
+    else:
+        arr = np.asarray(ts_array)
+        if arr.dtype.kind == "M":
+            arr = arr.view(np.int64)
+        elif arr.dtype.kind not in "iu":
+            raise TypeError(f"Expected an integer timestamp array, got dtype {arr.dtype}")
+        arr = arr.astype(np.int64, copy=False)
+    if arr.ndim != 1:
+        raise ValueError(f"Expected a 1-D timestamp array, got shape {arr.shape}")
+    return arr
+
+
+def _scale_to_ns(arr: np.ndarray, nanos_per_unit: int) -> np.ndarray:
+    """Multiplies int64 timestamps by nanos_per_unit, checking the bounds first since NumPy wraps silently"""
+    if nanos_per_unit == 1:
+        return arr
+    limit = INT64_MAX // nanos_per_unit
+    if arr.size and (arr.max() > limit or arr.min() < -limit):
+        raise OverflowError(f"Timestamps out of the int64 nanosecond range: [{arr.min()}, {arr.max()}] x {nanos_per_unit}")
+    return arr * nanos_per_unit
+
+
+def _ns_from_ints(values: Any, prec: str, utc: bool) -> np.ndarray:
+    """Plain integers in `prec` units, exact like the iTS/iTSms/iTSus/iTSns constructors"""
+    return _scale_to_ns(as_int64(values), NANOS_PER_PREC[prec])
+
+
+def _ns_from_floats(values: Any, prec: str, utc: bool) -> np.ndarray:
+    """Plain floats in `prec` units, like TS(x, prec=prec).as_nsec(), i.e. with microsecond precision"""
+    arr = np.asarray(values, dtype=np.float64)
+    if prec != "s":
+        arr = arr / (1_000_000_000 // NANOS_PER_PREC[prec])
+    usec = np.rint(arr * 1_000_000)
+    # the float -> int64 cast doesn't raise on overflow either
+    if usec.size and not np.all(np.abs(usec) <= INT64_MAX // 1_000):
+        raise OverflowError(f"Timestamps out of the int64 nanosecond range: [{np.min(arr)}, {np.max(arr)}] {prec}")
+    return usec.astype(np.int64) * 1_000
+
+
+def _ns_from_its(values: list, prec: str, utc: bool) -> np.ndarray:
+    """A run of instances of the same iBaseTS class"""
+    return _scale_to_ns(as_int64(values), type(values[0]).NANOS_PER_UNIT)
+
+
+def _ns_from_ts(values: list, prec: str, utc: bool) -> np.ndarray:
+    """A run of TS instances, like TS.as_nsec()"""
+    return _ns_from_floats(values, "s", utc)
+
+
+def _ns_from_strs(values: list, prec: str, utc: bool) -> np.ndarray:
+    return np.fromiter((int.__int__(iTSns(s, utc=utc)) for s in values), dtype=np.int64, count=len(values))
+
+
+def _aware_dt_to_ns(dt: datetime) -> int:
+    delta = dt - EPOCH_DT_UTC
+    return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+
+def _ns_from_datetimes(values: list, prec: str, utc: bool) -> np.ndarray:
+    """Like TS(dt): naive datetimes are in local time (as datetime.timestamp() does), but computed exactly"""
+    return np.fromiter((_aware_dt_to_ns(dt if dt.tzinfo is not None else dt.astimezone()) for dt in values), dtype=np.int64, count=len(values))
+
+
+def _ns_from_dates(values: list, prec: str, utc: bool) -> np.ndarray:
+    """Like TS(date, utc=utc): midnight in UTC, or in local time if utc is False"""
+    if utc:
+        dts = (datetime.combine(d, time.min, tzinfo=timezone.utc) for d in values)
+    else:
+        dts = (datetime.combine(d, time.min).astimezone() for d in values)
+    return np.fromiter((_aware_dt_to_ns(dt) for dt in dts), dtype=np.int64, count=len(values))
+
+
+def _ns_from_datetime64s(values: Any, prec: str, utc: bool) -> np.ndarray:
+    return np.asarray(values, dtype="datetime64[ns]").view(np.int64)
+
+
+def _ns_from_other(values: list, prec: str, utc: bool) -> np.ndarray:
+    """Fallback for any other BaseTS (ex: user subclasses)"""
+    for value in values:
+        if not isinstance(value, BaseTS):
+            raise TypeError(f"Can't convert {value!r} of class {type(value)} to a nanosecond timestamp")
+    return np.fromiter((int.__int__(ts.as_nsec()) for ts in values), dtype=np.int64, count=len(values))
+
+
+# Resolution order matters: classes are looked up along the MRO of the element type, so iBaseTS wins over int and datetime over date
+_CONVERTERS: Dict[type, Callable[[Any, str, bool], np.ndarray]] = {
+    iBaseTS: _ns_from_its,
+    TS: _ns_from_ts,
+    BaseTS: _ns_from_other,
+    bool: _ns_from_other,
+    int: _ns_from_ints,
+    np.integer: _ns_from_ints,
+    float: _ns_from_floats,
+    np.floating: _ns_from_floats,
+    str: _ns_from_strs,
+    datetime: _ns_from_datetimes,
+    date: _ns_from_dates,
+    np.datetime64: _ns_from_datetime64s,
+}
+_CONVERTER_BY_TYPE: Dict[type, Callable[[Any, str, bool], np.ndarray]] = {}
+
+
+def _converter(tp: type) -> Callable[[Any, str, bool], np.ndarray]:
+    converter = _CONVERTER_BY_TYPE.get(tp)
+    if converter is None:
+        converter = next((_CONVERTERS[base] for base in tp.__mro__ if base in _CONVERTERS), _ns_from_other)
+        _CONVERTER_BY_TYPE[tp] = converter
+    return converter
+
+
+def to_ns_array(seq: Any, default_prec: str = "s", utc: bool = True) -> np.ndarray:
+    """
+    Converts a heterogeneous sequence of timestamps to an int64 array of nanoseconds since Epoch.
+    The sequence is split into runs of elements of the same type and every run is converted at once by the converter
+    registered for its type, so homogeneous input costs a single dispatch. Every element converts like its constructor:
+
+    - iTS/iTSms/iTSus/iTSns and other BaseTS: x.as_nsec() (TS has microsecond precision)
+    - int / np.integer: exact number of `default_prec` units
+    - float / np.floating: TS(x, prec=default_prec).as_nsec()
+    - str: iTSns(x, utc=utc)
+    - datetime: TS(x), computed exactly; naive datetimes are in local time, like datetime.timestamp()
+    - date: TS(x, utc=utc), i.e. midnight in UTC or in local time
+    - np.datetime64: its value at nanosecond precision
+
+    :param seq: any iterable of timestamps, or a NumPy array (int, float or datetime64 arrays are converted in one call)
+    :param default_prec: units of the plain numbers: "s", "ms", "us" or "ns"
+    :param utc: how strings and dates without time zone are interpreted
+    :raises OverflowError: if a timestamp is out of the int64 nanosecond range
+    """
+    if default_prec not in NANOS_PER_PREC:
+        raise ValueError(f"Invalid precision: {default_prec}")
+    if isinstance(seq, np.ndarray) and seq.dtype != object:
+        if seq.ndim != 1:
+            raise ValueError(f"Expected a 1-D timestamp array, got shape {seq.shape}")
+        kind = seq.dtype.kind
+        if kind == "M":
+            return seq.astype("datetime64[ns]").view(np.int64)
+        if kind in "iu":
+            return _ns_from_ints(seq, default_prec, utc)
+        if kind == "f":
+            return _ns_from_floats(seq, default_prec, utc)
+        raise TypeError(f"Can't convert an array of dtype {seq.dtype} to nanosecond timestamps")
+    seq = seq if isinstance(seq, (list, tuple)) else list(seq)
+    if not seq:
+        return np.empty(0, dtype=np.int64)
+    first_type = type(seq[0])
+    if all(type(x) is first_type for x in seq):
+        return _converter(first_type)(seq, default_prec, utc)
+    out = np.empty(len(seq), dtype=np.int64)
+    pos = 0
+    for tp, group in groupby(seq, key=type):
+        run = list(group)
+        out[pos:pos + len(run)] = _converter(tp)(run, default_prec, utc)
+        pos += len(run)
+    return out
+
+
+def as_ns(ts_array: Any, prec: str = "ns") -> np.ndarray:
+    """
+    Returns the timestamps as a 1-D int64 array of nanoseconds (int64 arrays in nanoseconds are returned without copy).
+    Sequences of BaseTS instances are converted according to their own precision (so iTSms and iTSns may be mixed),
+    datetime64 arrays according to their unit, while plain numbers are interpreted in the `prec` units.
+    See to_ns_array() for all the supported element types.
+    """
+    if isinstance(ts_array, np.ndarray) and ts_array.dtype == np.int64 and prec == "ns":
+        if ts_array.ndim != 1:
+            raise ValueError(f"Expected a 1-D timestamp array, got shape {ts_array.shape}")
+        return ts_array
+    return to_ns_array(ts_array, default_prec=prec)
+
+
+def as_ns_bounds(intervals: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the (starts, ends) int64 nanosecond arrays of a collection of intervals.
+    Accepts a sequence of TSInterval, a (starts, ends) pair of arrays, an (n, 2) array of nanoseconds
+    or an interval collection exposing int64 nanosecond `starts`/`ends` arrays (IntervalArray, TSIntervalSet).
+    """
+    if isinstance(getattr(intervals, "starts", None), np.ndarray) and isinstance(getattr(intervals, "ends", None), np.ndarray):
+        starts, ends = intervals.starts, intervals.ends
+    elif isinstance(intervals, tuple) and len(intervals) == 2 and not isinstance(intervals[0], TSInterval):
+        starts, ends = as_ns(intervals[0]), as_ns(intervals[1])
+    elif isinstance(intervals, np.ndarray) and intervals.ndim == 2:
+        if intervals.shape[1] != 2:
+            raise ValueError(f"Expected an (n, 2) array of interval bounds, got shape {intervals.shape}")
+        starts, ends = as_int64(intervals[:, 0]), as_int64(intervals[:, 1])
+    else:
+        intervals = intervals if isinstance(intervals, (list, tuple)) else list(intervals)
+        n = len(intervals)
+        for interval in intervals:
+            if not isinstance(interval, TSInterval):
+                raise TypeError(f"Expected a sequence of TSInterval, got {type(interval)}")
+        starts = np.fromiter((int(interval.start.as_nsec()) for interval in intervals), dtype=np.int64, count=n)
+        ends = np.fromiter((int(interval.end.as_nsec()) for interval in intervals), dtype=np.int64, count=n)
+    if starts.shape != ends.shape:
+        raise ValueError(f"Interval starts and ends must have the same length: {starts.size} != {ends.size}")
+    if np.any(starts > ends):
+        raise ValueError("Interval starts must not be after their ends")
+    return starts, ends
+
+
+@overload
+def as_values(values: None, n: int) -> None:
+    ...
+
+
+@overload
+def as_values(values: Any, n: int) -> np.ndarray:
+    ...
+
+
+def as_values(values: Optional[Any], n: int) -> Optional[np.ndarray]:
+    """Returns the values as a 1-D array of length n, or None if no values were given."""
+    if values is None:
+        return None
+    arr = np.asarray(values)
+    if arr.shape != (n,):
+        raise ValueError(f"values must be a 1-D array of the same length as timestamps ({n}), got shape {arr.shape}")
+    return arr
+
+
+def is_sorted(arr: np.ndarray) -> bool:
+    """Checks in O(n) whether the array is sorted in non-decreasing order."""
+    return arr.size < 2 or bool(np.all(arr[1:] >= arr[:-1]))
+
+
+def group_starts(keys: np.ndarray) -> np.ndarray:
+    """Returns the positions where a new run of equal keys begins in a sorted keys array."""
+    if keys.size == 0:
+        return np.empty(0, dtype=np.intp)
+    boundaries = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+    return np.concatenate((np.zeros(1, dtype=np.intp), boundaries))
+
+
+def delta_spec(delta: Union[int, str, dTS, timedelta]) -> Tuple[int, int]:
+    """
+    Returns the delta as (nanoseconds, months).
+    Integers are interpreted as nanoseconds and strings are parsed as dTS (ex: "5m", "1d", "1M").
+    """
+    if isinstance(delta, str):
+        delta = dTS(delta)
+    if isinstance(delta, dTS):
+        return delta._delta_ns, delta._months
+    if isinstance(delta, timedelta):
+        return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000, 0
+    if isinstance(delta, Integral):
+        return int(delta), 0
+    raise TypeError(f"Expected a delta as int nanoseconds, str, dTS or timedelta, got {type(delta)}")
+
+
+def delta_to_ns(delta: Union[int, str, dTS, timedelta]) -> int:
+    """Returns the delta in nanoseconds; month based deltas are rejected since they don't have a fixed length."""
+    delta_ns, months = delta_spec(delta)
+    if months != 0:
+        raise ValueError(f"Month based delta {delta} doesn't have a fixed length in nanoseconds")
+    return delta_ns
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose: Vectorised UTC offset lookups based on cached time zone transition tables
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+from datetime import datetime, timedelta, timezone, tzinfo as dt_tzinfo
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+import pytz
+
+from .ts import EPOCH_DT
+
+INT64_MIN = np.iinfo(np.int64).min
+INT64_MAX = np.iinfo(np.int64).max
+# seconds that still fit in int64 nanoseconds; all the transitions of the tables are inside this range
+_NS_MIN_SEC = -(-INT64_MIN // 1_000_000_000)
+_NS_MAX_SEC = INT64_MAX // 1_000_000_000
+
+
+def get_tz(tz: Optional[Union[dt_tzinfo, str]]) -> dt_tzinfo:
+    """Resolves a time zone name (ex: "America/New_York") to a tzinfo; None means UTC."""
+    if tz is None:
+        return timezone.utc
+    if isinstance(tz, str):
+        return pytz.timezone(tz)
+    if not isinstance(tz, dt_tzinfo):
+        raise TypeError(f"tz must be a tzinfo or a time zone name, got {type(tz)}")
+    return tz
+
+
+def is_utc(tz: dt_tzinfo) -> bool:
+    return tz is timezone.utc or tz is pytz.utc
+
+
+@lru_cache(maxsize=None)
+def transition_table(tz: dt_tzinfo) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Returns (transition instants in UTC nanoseconds, UTC offset in nanoseconds valid from each instant),
+    or None if the time zone doesn't expose its transitions.
+    The first instant is always the int64 minimum, so every timestamp falls after a transition.
+    """
+    # pytz DstTzInfo keeps its tables in these private attributes, the other tzinfo classes don't have them
+    transition_times: Optional[List[datetime]] = getattr(tz, "_utc_transition_times", None)
+    transition_info: Optional[List[Tuple[timedelta, timedelta, str]]] = getattr(tz, "_transition_info", None)
+    if transition_times is not None and transition_info is not None:
+        instants = []
+        for dt in transition_times:
+            delta = dt - EPOCH_DT
+            instants.append(max((delta.days * 86400 + delta.seconds) * 1_000_000_000, INT64_MIN))
+        instants[0] = INT64_MIN
+        offsets = [round(info[0].total_seconds()) * 1_000_000_000 for info in transition_info]
+        return np.array(instants, dtype=np.int64), np.array(offsets, dtype=np.int64)
+    offset = tz.utcoffset(None)
+    if offset is not None:
+        offset_ns = round(offset.total_seconds()) * 1_000_000_000
+        return np.array([INT64_MIN], dtype=np.int64), np.array([offset_ns], dtype=np.int64)
+    return None
+
+
+def _offset_sec(ts_s: int, tz: dt_tzinfo) -> int:
+    """Returns the UTC offset (in whole seconds) of the time zone at a UTC timestamp, for tzinfo without transition tables."""
+    offset = datetime.fromtimestamp(ts_s, tz=tz).utcoffset()
+    if offset is None:
+        raise ValueError(f"{tz!r} doesn't define a UTC offset at {ts_s}s")
+    return round(offset.total_seconds())
+
+
+def utc_offsets_ns(ts_ns: np.ndarray, tz: dt_tzinfo) -> np.ndarray:
+    """Returns the UTC offset (in nanoseconds) of the time zone at every UTC timestamp of the array."""
+    table = transition_table(tz)
+    if table is None:
+        # tzinfo implementations without transition tables (ex: zoneinfo) are resolved element by element
+        seconds = ts_ns // 1_000_000_000
+        return np.fromiter((_offset_sec(int(s), tz) * 1_000_000_000 for s in seconds), dtype=np.int64, count=seconds.size)
+    instants, offsets = table
+    if offsets.size == 1:
+        return np.full(ts_ns.shape, offsets[0], dtype=np.int64)
+    return offsets[np.searchsorted(instants, ts_ns, side="right") - 1]
+
+
+def utc_to_local_ns(ts_ns: np.ndarray, tz: dt_tzinfo) -> np.ndarray:
+    """Converts UTC nanosecond timestamps to nanoseconds of local wall-clock time since 1970-01-01T00:00."""
+    return ts_ns + utc_offsets_ns(ts_ns, tz)
+
+
+def local_to_utc_ns(local_ns: np.ndarray, tz: dt_tzinfo) -> np.ndarray:
+    """
+    Converts nanoseconds of local wall-clock time back to UTC nanoseconds.
+    Ambiguous wall times (repeated by a DST transition) resolve to their first occurrence, and skipped ones
+    (inside a DST gap) are shifted forward by the gap length, like datetime with fold=0: 02:30 on a 02:00 -> 03:00 jump
+    gives 03:30, and a skipped local midnight gives the end of the gap.
+    """
+    offsets = utc_offsets_ns(local_ns - utc_offsets_ns(local_ns, tz), tz)
+    utc = local_ns - offsets
+    after = utc_offsets_ns(utc, tz)
+    # the wall time doesn't exist when the offset at the candidate differs: use the offset before the gap (the smaller one)
+    return np.where(after == offsets, utc, np.maximum(utc, local_ns - after))
+
+
+def utc_offsets_s(ts_s: np.ndarray, tz: dt_tzinfo) -> np.ndarray:
+    """
+    Returns the UTC offset (in seconds) of the time zone at every UTC timestamp given in seconds.
+    Unlike utc_offsets_ns(), it's valid for the whole datetime range (years 1..9999), not only for 1678..2262.
+    """
+    table = transition_table(tz)
+    if table is None:
+        return np.fromiter((_offset_sec(int(s), tz) for s in ts_s), dtype=np.int64, count=ts_s.size)
+    # clipping to the nanoseconds range doesn't change the offsets since there are no transitions outside of it
+    clipped_ns = np.clip(ts_s, _NS_MIN_SEC, _NS_MAX_SEC) * 1_000_000_000
+    return utc_offsets_ns(clipped_ns, tz) // 1_000_000_000
+
+
+def utc_to_local_s(ts_s: np.ndarray, tz: dt_tzinfo) -> np.ndarray:
+    """Seconds version of utc_to_local_ns()"""
+    return ts_s + utc_offsets_s(ts_s, tz)
+
+
+def local_to_utc_s(local_s: np.ndarray, tz: dt_tzinfo) -> np.ndarray:
+    """Seconds version of local_to_utc_ns()"""
+    offsets = utc_offsets_s(local_s - utc_offsets_s(local_s, tz), tz)
+    utc = local_s - offsets
+    after = utc_offsets_s(utc, tz)
+    return np.where(after == offsets, utc, np.maximum(utc, local_s - after))
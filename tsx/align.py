@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose: Vectorised operations over timestamped series: as-of joins, regular grid reindexing and time-weighted means
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+from datetime import timedelta
+from typing import Any, Dict, Literal, Optional, Union
+
+import numpy as np
+
+from ._columns import as_ns, as_ns_bounds, as_values, is_sorted, delta_to_ns
+from .ts import dTS, TSInterval
+
+Direction = Literal["backward", "forward", "nearest"]
+ReindexMethod = Literal["ffill", "bfill", "nearest", "linear"]
+
+
+# direction of the as-of match used by every reindex() method but "linear"
+_REINDEX_DIRECTIONS: Dict[str, Direction] = {"ffill": "backward", "bfill": "forward", "nearest": "nearest"}
+
+
+def _match_backward(right: np.ndarray, left: np.ndarray, allow_exact_matches: bool) -> np.ndarray:
+    """Positions of the latest sorted right timestamp <= (or <) every left one, -1 if there is none"""
+    return np.searchsorted(right, left, side="right" if allow_exact_matches else "left") - 1
+
+
+def _match_forward(right: np.ndarray, left: np.ndarray, allow_exact_matches: bool) -> np.ndarray:
+    """Positions of the earliest sorted right timestamp >= (or >) every left one, -1 if there is none"""
+    fwd = np.searchsorted(right, left, side="left" if allow_exact_matches else "right")
+    fwd[fwd >= right.size] = -1
+    return fwd
+
+
+def asof_join(left_ts: Any, right_ts: Any, direction: Direction = "backward", tolerance: Optional[Union[int, dTS, timedelta]] = None,
+              allow_exact_matches: bool = True, left_prec: str = "ns", right_prec: str = "ns") -> np.ndarray:
+    """
+    Matches every left timestamp with the closest right timestamp in the given direction, like a trade to the latest quote.
+    Both sides are normalised to int64 nanoseconds, so they may have different precisions (ex: list of iTSms vs. iTSns array).
+
+    :param left_ts: timestamps to match (any order)
+    :param right_ts: timestamps to match against; if not sorted, a stable sort is applied internally
+    :param direction: "backward" -> latest right <= left; "forward" -> earliest right >= left; "nearest" -> closest of both (ties go backward)
+    :param tolerance: maximum distance between the matched timestamps (int nanoseconds, dTS or timedelta)
+    :param allow_exact_matches: if False, a right timestamp equal to the left one is not a match (strict < or >)
+    :param left_prec: units of left_ts if given as plain integers
+    :param right_prec: units of right_ts if given as plain integers
+    :return: int64 array with, for every left row, the position of the matched right row, or -1 if there is no match.
+        When several right rows have the same timestamp, backward matches pick the last of them and forward matches the first.
+    """
+    if direction not in ("backward", "forward", "nearest"):
+        raise ValueError(f"Invalid direction={direction!r}. Expected one of 'backward', 'forward', 'nearest'")
+    left = as_ns(left_ts, left_prec)
+    right = as_ns(right_ts, right_prec)
+    order = None
+    if not is_sorted(right):
+        order = np.argsort(right, kind="stable")
+        right = right[order]
+    if right.size == 0:
+        return np.full(left.shape, -1, dtype=np.int64)
+
+    # only the searches required by the direction are done, to keep the memory low on very large columns
+    if direction == "backward":
+        idx = _match_backward(right, left, allow_exact_matches)
+    elif direction == "forward":
+        idx = _match_forward(right, left, allow_exact_matches)
+    else:
+        back = _match_backward(right, left, allow_exact_matches)
+        fwd = _match_forward(right, left, allow_exact_matches)
+        back_dist = np.where(back >= 0, left - right[np.maximum(back, 0)], np.iinfo(np.int64).max)
+        fwd_dist = np.where(fwd >= 0, right[np.maximum(fwd, 0)] - left, np.iinfo(np.int64).max)
+        idx = np.where(fwd_dist < back_dist, fwd, back)
+    idx = idx.astype(np.int64, copy=False)
+
+    if tolerance is not None:
+        tolerance_ns = delta_to_ns(tolerance)
+        if tolerance_ns < 0:
+            raise ValueError(f"Tolerance should not be negative: {tolerance}")
+        dist = np.abs(right[np.maximum(idx, 0)] - left)
+        idx[dist > tolerance_ns] = -1
+    if order is not None:
+        idx = np.where(idx >= 0, order[np.maximum(idx, 0)], -1)
+    return idx
+
+
+def make_grid(interval: TSInterval, step: Union[int, dTS, timedelta]) -> np.ndarray:
+    """
+    Returns the regular grid start, start + step, ... covering [interval.start, interval.end) as int64 nanoseconds.
+
+    :param step: grid step as int nanoseconds, dTS or timedelta
+    """
+    step_ns = delta_to_ns(step)
+    if step_ns <= 0:
+        raise ValueError(f"Step should be a positive duration: {step}")
+    start, end = int(interval.start.as_nsec()), int(interval.end.as_nsec())
+    return np.arange(start, end, step_ns, dtype=np.int64)
+
+
+def reindex(ts_array: Any, values: Any, grid: Any, method: ReindexMethod = "ffill", limit: Optional[Union[int, dTS, timedelta]] = None,
+            fill_value: Any = np.nan, prec: str = "ns") -> np.ndarray:
+    """
+    Aligns an irregular series on the grid timestamps (see make_grid()).
+
+    :param ts_array: timestamps of the series (any order; int64 in `prec` units or sequence of BaseTS)
+    :param values: values of the series
+    :param grid: int64 nanosecond timestamps to align on
+    :param method: "ffill" -> last value at or before the grid point; "bfill" -> first value at or after it;
+        "nearest" -> closest value (ties go backward); "linear" -> linear interpolation between the surrounding samples
+    :param limit: maximum distance (int nanoseconds, dTS or timedelta) between a grid point and the sample(s) used to fill it;
+        with "linear" both surrounding samples must be within the limit
+    :param fill_value: value of the grid points that can't be filled
+    :param prec: units of ts_array if given as plain integers
+    :return: array of values aligned on the grid
+    """
+    if method not in ("ffill", "bfill", "nearest", "linear"):
+        raise ValueError(f"Invalid method={method!r}. Expected one of 'ffill', 'bfill', 'nearest', 'linear'")
+    ts = as_ns(ts_array, prec)
+    vals = as_values(values, ts.size)
+    grid = as_ns(grid)
+    if method != "linear":
+        idx = asof_join(grid, ts, direction=_REINDEX_DIRECTIONS[method], tolerance=limit)
+        out = np.full(grid.shape, fill_value, dtype=np.result_type(vals.dtype, np.asarray(fill_value).dtype))
+        matched = idx >= 0
+        out[matched] = vals[idx[matched]]
+        return out
+
+    back = asof_join(grid, ts, direction="backward", tolerance=limit)
+    fwd = asof_join(grid, ts, direction="forward", tolerance=limit)
+    out = np.full(grid.shape, fill_value, dtype=np.result_type(vals.dtype, np.float64, np.asarray(fill_value).dtype))
+    exact = (back >= 0) & (ts[np.maximum(back, 0)] == grid) if ts.size else np.zeros(grid.shape, dtype=bool)
+    out[exact] = vals[back[exact]]
+    between = ~exact & (back >= 0) & (fwd >= 0)
+    t0, t1 = ts[back[between]], ts[fwd[between]]
+    v0, v1 = vals[back[between]], vals[fwd[between]]
+    out[between] = v0 + (v1 - v0) * ((grid[between] - t0) / (t1 - t0))
+    return out
+
+
+def time_weighted_mean(ts_array: Any, values: Any, windows: Any, prec: str = "ns") -> np.ndarray:
+    """
+    Computes the time-weighted mean of a step function over every window, as needed for gauges (position size, queue depth, etc.).
+    Every sample holds its value from its timestamp until the next sample (the last one holds indefinitely).
+    The parts of a window before the first sample are not covered by the step function, so they are excluded from the weighting.
+
+    Durations are handled as int64 nanoseconds; all the windows are computed in one vectorised pass.
+    Every window is integrated relative to its own bounds (partial first and last segments, plus the sum of the segments
+    fully inside it), so large timestamps and values don't lose precision in narrow windows;
+    the cost is O(n + m + number of samples inside the windows).
+
+    :param ts_array: timestamps of the samples (int64 in `prec` units or sequence of BaseTS); unsorted input is sorted (stable)
+    :param values: values of the samples
+    :param windows: sequence of TSInterval, (starts, ends) pair of int64 nanosecond arrays or (n, 2) array
+    :param prec: units of ts_array if given as plain integers
+    :return: float64 array with the mean of every window, NaN if the window is not covered by any sample
+    """
+    ts = as_ns(ts_array, prec)
+    vals = as_values(values, ts.size).astype(np.float64, copy=False)
+    starts, ends = as_ns_bounds(windows)
+    out = np.full(starts.shape, np.nan)
+    if ts.size == 0:
+        return out
+    if not is_sorted(ts):
+        order = np.argsort(ts, kind="stable")
+        ts, vals = ts[order], vals[order]
+    starts = np.maximum(starts, ts[0])
+    covered = ends > starts
+    a, b = starts[covered], ends[covered]
+    # samples holding the value at the window start and just before the window end
+    first = np.searchsorted(ts, a, side="right") - 1
+    last = np.searchsorted(ts, b, side="left") - 1
+    single = first == last
+    area = np.where(single, vals[first] * (b - a), 0.0)
+    multi = ~single
+    lo, hi = first[multi], last[multi]
+    # partial segments at both ends, integrated from the window bounds
+    area[multi] = vals[lo] * (ts[lo + 1] - a[multi]) + vals[hi] * (b[multi] - ts[hi])
+    # segments fully inside the window: ts[lo + 1] .. ts[hi]
+    inner = lo + 1 < hi
+    if inner.any():
+        segments = np.append(vals[:-1] * np.diff(ts), 0.0)
+        bounds = np.column_stack((lo[inner] + 1, hi[inner])).ravel()
+        inner_pos = np.flatnonzero(multi)[inner]
+        area[inner_pos] += np.add.reduceat(segments, bounds)[::2]
+    out[covered] = area / (b - a)
+    return out
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose: Bulk conversion, precision changes and deduplication of timestamp columns with the same semantics as the scalar classes
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+from typing import Any, Iterable, Iterator, Literal, Optional, Tuple, Union, cast
+
+import numpy as np
+
+from ._columns import as_int64, as_ns, is_sorted, group_starts, to_ns_array
+from .ts import BaseTS, iBaseTS, Rounding, _check_rounding
+
+__all__ = ["Prec", "UNITS_IN_SEC", "round_to_prec", "convert", "unique", "dedupe", "to_ns_array"]
+
+Prec = Literal["s", "ms", "us", "ns"]
+UNITS_IN_SEC = {"s": 1, "ms": 1_000, "us": 1_000_000, "ns": 1_000_000_000}
+
+
+def _check_prec(prec: str) -> None:
+    if prec not in UNITS_IN_SEC:
+        raise ValueError(f"Invalid precision: {prec}")
+
+
+def _as_native(ts_array: Any, prec: Prec) -> Tuple[np.ndarray, Prec]:
+    """
+    Returns the timestamps as int64 in their own precision, along with that precision.
+    Sequences of a single iBaseTS class keep the class precision, other BaseTS sequences are converted to nanoseconds,
+    and plain integers are interpreted in the `prec` units.
+    """
+    if not isinstance(ts_array, np.ndarray):
+        ts_array = ts_array if isinstance(ts_array, (list, tuple)) else list(ts_array)
+        if ts_array and isinstance(ts_array[0], BaseTS):
+            first_type = type(ts_array[0])
+            if issubclass(first_type, iBaseTS) and all(type(ts) is first_type for ts in ts_array):
+                return as_int64(ts_array), cast(Prec, first_type.PREC_STR)
+            return as_ns(ts_array), "ns"
+    return as_int64(ts_array), prec
+
+
+def round_to_prec(arr: np.ndarray, from_prec: Prec, to_prec: Prec) -> np.ndarray:
+    """
+    Changes the precision of int64 timestamps with exactly the same results as the scalar conversions
+    (as_sec/as_msec/as_usec/as_nsec) of the iBaseTS class having `from_prec`:
+    - increasing the precision is an exact multiplication
+    - iTSns -> us rounds half down, like iTSns.as_usec()
+    - the other decreasing conversions go through float seconds and round half to even, like BaseTS.as_msec()
+    """
+    _check_prec(from_prec)
+    _check_prec(to_prec)
+    src, dst = UNITS_IN_SEC[from_prec], UNITS_IN_SEC[to_prec]
+    if src == dst:
+        return arr
+    if dst > src:
+        return arr * (dst // src)
+    if from_prec == "ns" and to_prec == "us":
+        us, ns = np.divmod(arr, 1_000)
+        return us + (ns > 500)
+    return np.rint(arr.astype(np.float64) / src * dst).astype(np.int64)
+
+
+def _div_round(arr: np.ndarray, divisor: int, rounding: Rounding) -> np.ndarray:
+    """Vectorised counterpart of ts._div_round(), i.e. exact integer division with explicit rounding."""
+    q, r = np.divmod(arr, divisor)
+    if rounding == "floor":
+        return q
+    if rounding == "ceil":
+        return q + (r > 0)
+    if rounding == "half_up":
+        return q + (2 * r >= divisor)
+    return q + ((2 * r > divisor) | ((2 * r == divisor) & (q % 2 == 1)))
+
+
+def convert(ts_array: Any, from_prec: Prec, to_prec: Prec, rounding: Optional[Rounding] = "half_up") -> np.ndarray:
+    """
+    Changes the precision of a timestamp column with exact integer arithmetic.
+    The results are identical to the scalar iBaseTS conversions called with the same rounding,
+    ex: convert(arr, "ns", "ms", "floor")[i] == iTSns(arr[i]).as_msec("floor").
+
+    :param ts_array: int64 timestamps in `from_prec` units
+    :param from_prec: the precision of ts_array
+    :param to_prec: the precision of the result
+    :param rounding: one of "half_up" (halves towards +infinity), "half_even", "floor", "ceil";
+                     None keeps the legacy rounding of the scalar methods called without arguments (see round_to_prec())
+    :raises OverflowError: if increasing the precision overflows int64
+    """
+    _check_prec(from_prec)
+    _check_prec(to_prec)
+    if rounding is not None:
+        _check_rounding(rounding)
+    arr = as_int64(ts_array)
+    src, dst = UNITS_IN_SEC[from_prec], UNITS_IN_SEC[to_prec]
+    if dst > src:
+        factor = dst // src
+        limit = np.iinfo(np.int64).max // factor
+        if arr.size and (arr.max() > limit or arr.min() < -limit):
+            raise OverflowError(f"Converting from {from_prec} to {to_prec} overflows int64")
+        return arr * factor
+    if rounding is None:
+        return round_to_prec(arr, from_prec, to_prec)
+    if src == dst:
+        return arr
+    return _div_round(arr, src // dst, rounding)
+
+
+def _round_scalar(value: int, src: int, dst: int, half_down: bool) -> int:
+    """Scalar counterpart of round_to_prec() on plain ints, without creating BaseTS objects."""
+    if src == dst:
+        return value
+    if dst > src:
+        return value * (dst // src)
+    if half_down:
+        q, r = divmod(value, 1_000)
+        return q + 1 if r > 500 else q
+    return round(float(value) / src * dst)
+
+
+def unique(ts_array: Any, prec: Prec = "ms", from_prec: Prec = "ns", return_index: bool = False, return_inverse: bool = False,
+           return_counts: bool = False) -> Union[np.ndarray, Tuple[np.ndarray, ...]]:
+    """
+    Returns the sorted unique timestamps after changing their precision to `prec`, like np.unique().
+    The rounding matches the scalar as_sec/as_msec/as_usec of the input class exactly (see round_to_prec()).
+    Already sorted input is deduplicated in O(n) without sorting.
+
+    :param ts_array: timestamps (int64 in `from_prec` units or sequence of BaseTS)
+    :param prec: the precision of the result
+    :param from_prec: units of ts_array if given as plain integers
+    :param return_index: also return the position of the first occurrence of every unique value
+    :param return_inverse: also return, for every input row, the position of its value in the unique array
+    :param return_counts: also return the number of occurrences of every unique value
+    """
+    native_prec: Prec
+    arr, native_prec = _as_native(ts_array, from_prec)
+    rounded = round_to_prec(arr, native_prec, prec)
+    if not is_sorted(rounded):
+        # always ask for every output, so the call matches a single np.unique() overload, then keep the requested ones
+        values, index, inverse, counts = np.unique(rounded, return_index=True, return_inverse=True, return_counts=True)
+        res = [values]
+        if return_index:
+            res.append(index)
+        if return_inverse:
+            res.append(inverse)
+        if return_counts:
+            res.append(counts)
+        return res[0] if len(res) == 1 else tuple(res)
+    starts = group_starts(rounded)
+    res = [rounded[starts]]
+    if return_index:
+        res.append(starts)
+    if return_inverse:
+        is_new = np.zeros(rounded.size, dtype=np.intp)
+        is_new[starts[1:]] = 1
+        res.append(np.cumsum(is_new))
+    if return_counts:
+        res.append(np.diff(np.append(starts, rounded.size)))
+    return res[0] if len(res) == 1 else tuple(res)
+
+
+def dedupe(iterable: Iterable[Union[int, BaseTS]], prec: Prec = "ms", from_prec: Prec = "ns") -> Iterator[int]:
+    """
+    Lazily yields the distinct timestamps of the iterable, in first-seen order, after changing their precision to `prec`.
+    Works on raw ints (and a set of ints), so no BaseTS object is created or hashed per element.
+
+    :param iterable: timestamps as ints in `from_prec` units, or as iBaseTS instances (their own precision is used)
+    :param prec: the precision of the yielded ints
+    :param from_prec: units of the plain int elements
+    """
+    _check_prec(prec)
+    _check_prec(from_prec)
+    dst = UNITS_IN_SEC[prec]
+    seen = set()
+    for ts in iterable:
+        if isinstance(ts, iBaseTS):
+            src_prec = ts.PREC_STR
+            value = _round_scalar(int.__int__(ts), ts.UNITS_IN_SEC, dst, src_prec == "ns" and prec == "us")
+        elif isinstance(ts, BaseTS):
+            value = int({"s": ts.as_sec, "ms": ts.as_msec, "us": ts.as_usec, "ns": ts.as_nsec}[prec]())
+        else:
+            value = _round_scalar(int(ts), UNITS_IN_SEC[from_prec], dst, from_prec == "ns" and prec == "us")
+        if value not in seen:
+            seen.add(value)
+            yield value
@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose: Vectorised group-by-time-bucket aggregations and OHLCV bars over timestamp arrays
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+from datetime import timedelta, tzinfo as dt_tzinfo
+from numbers import Integral
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ._columns import as_int64, as_values, is_sorted, delta_spec, group_starts
+from ._tz import get_tz, is_utc, local_to_utc_ns, utc_to_local_ns
+from .ts import BaseTS, DAY_NSEC, FIRST_MONDAY_TS, WEEK_SEC, dTS
+
+WEEK_NSEC = WEEK_SEC * 1_000_000_000
+
+SUPPORTED_AGGS = ("count", "sum", "mean", "min", "max", "first", "last")
+DEFAULT_AGGS = ("count", "sum", "min", "max", "first", "last")
+
+
+def _reduce_groups(values: Optional[np.ndarray], starts: np.ndarray, n: int, aggs: Sequence[str]) -> Dict[str, np.ndarray]:
+    """
+    Computes the requested aggregates over consecutive groups of values.
+
+    :param values: the values, already ordered so that every group is a contiguous run
+    :param starts: the start position of every group (sorted, first one is 0)
+    :param n: total number of rows
+    :param aggs: the names of the aggregates to compute
+    """
+    counts = np.diff(np.append(starts, n))
+    res: Dict[str, np.ndarray] = {}
+    for agg in aggs:
+        if agg == "count":
+            res[agg] = counts
+            continue
+        assert values is not None, "values are required for aggregations other than 'count'"
+        if starts.size == 0:
+            dtype = np.float64 if agg == "mean" else values.dtype
+            res[agg] = np.empty(0, dtype=dtype)
+        elif agg == "sum":
+            res[agg] = np.add.reduceat(values, starts)
+        elif agg == "mean":
+            res[agg] = np.add.reduceat(values, starts) / counts
+        elif agg == "min":
+            res[agg] = np.minimum.reduceat(values, starts)
+        elif agg == "max":
+            res[agg] = np.maximum.reduceat(values, starts)
+        elif agg == "first":
+            res[agg] = values[starts]
+        elif agg == "last":
+            res[agg] = values[starts + counts - 1]
+    return res
+
+
+def _check_aggs(aggs: Sequence[str], values: Optional[np.ndarray]) -> Tuple[str, ...]:
+    if isinstance(aggs, str):
+        aggs = (aggs,)
+    for agg in aggs:
+        if agg not in SUPPORTED_AGGS:
+            raise ValueError(f"Unsupported aggregation {agg!r}. Supported: {SUPPORTED_AGGS}")
+    if values is None and any(agg != "count" for agg in aggs):
+        raise ValueError("values are required for aggregations other than 'count'")
+    return tuple(aggs)
+
+
+def bucket_aggregate(ts_array: Any, values: Optional[Any], unit: int,
+                     aggs: Sequence[str] = DEFAULT_AGGS) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Groups the timestamps into buckets of `unit` and aggregates the values of every non-empty bucket.
+    Bucket starts follow the same semantics as iBaseTS.floor, i.e. `(ts // unit) * unit`,
+    so the unit is expressed in the same time units as the timestamps (ex: 60_000 for minutes over iTSms).
+
+    Rows are grouped after a stable sort by timestamp, so "first"/"last" are the values of the earliest/latest timestamps in the bucket.
+    If the timestamps are already sorted, the sort is skipped.
+
+    :param ts_array: int64 array or sequence of integer timestamps (ex: list of iTSms)
+    :param values: array of values of the same length as ts_array; may be None if only "count" is requested
+    :param unit: bucket width, in the units of ts_array
+    :param aggs: any of "count", "sum", "mean", "min", "max", "first", "last"
+    :return: (sorted int64 array of bucket starts, dict mapping every aggregation name to its array)
+    """
+    if not isinstance(unit, Integral) or unit <= 0:
+        raise ValueError(f"Invalid unit for bucketing. It should be a positive integer: {unit}")
+    ts = as_int64(ts_array)
+    vals = as_values(values, ts.size)
+    aggs = _check_aggs(aggs, vals)
+    if not is_sorted(ts):
+        order = np.argsort(ts, kind="stable")
+        ts = ts[order]
+        if vals is not None:
+            vals = vals[order]
+    keys = ts // unit * unit
+    starts = group_starts(keys)
+    return keys[starts], _reduce_groups(vals, starts, ts.size, aggs)
+
+
+class Bars(NamedTuple):
+    """Columnar OHLCV bars; `start` holds the int64 bar start in UTC nanoseconds"""
+    start: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    vwap: np.ndarray
+
+
+class Bar(NamedTuple):
+    """A single OHLCV bar; `start` is the bar start in UTC nanoseconds"""
+    start: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    vwap: float
+
+
+def _bucket_bounds(ts_ns: np.ndarray, unit: Union[int, str, dTS, timedelta],
+                   tz: Optional[Union[dt_tzinfo, str]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the (start, end) UTC nanoseconds of the bucket containing every timestamp.
+
+    Units that are multiples of a day or of a month are aligned on the local calendar of `tz`, so a "1d" bucket in
+    "America/New_York" spans from local midnight to the next local midnight (23h or 25h on DST changes).
+    Week multiples are aligned on Mondays. Sub-day units are floored on the UTC epoch, like iBaseTS.floor.
+    """
+    delta_ns, months = delta_spec(unit)
+    if delta_ns < 0 or months < 0 or delta_ns == months == 0:
+        raise ValueError(f"Invalid bucket unit. It should be a positive delta: {unit}")
+    tz = get_tz(tz)
+    is_calendar = months != 0 or delta_ns % DAY_NSEC == 0
+    local = ts_ns if not is_calendar or is_utc(tz) else utc_to_local_ns(ts_ns, tz)
+    if months != 0:
+        month_idx = local.astype("datetime64[ns]").astype("datetime64[M]").astype(np.int64) // months * months
+        start_local = month_idx.astype("datetime64[M]").astype("datetime64[ns]").astype(np.int64)
+        end_local = (month_idx + months).astype("datetime64[M]").astype("datetime64[ns]").astype(np.int64)
+    else:
+        origin = FIRST_MONDAY_TS * 1_000_000_000 if delta_ns % WEEK_NSEC == 0 else 0
+        start_local = (local - origin) // delta_ns * delta_ns + origin
+        end_local = start_local + delta_ns
+    if local is ts_ns:
+        return start_local, end_local
+    return local_to_utc_ns(start_local, tz), local_to_utc_ns(end_local, tz)
+
+
+def _aggregate_bars(ts: np.ndarray, price: np.ndarray, size: np.ndarray, unit: Union[int, str, dTS, timedelta],
+                    tz: Optional[Union[dt_tzinfo, str]]) -> Tuple[List[np.ndarray], np.ndarray, np.ndarray]:
+    """
+    Aggregates sorted ticks into bars.
+    Returns the [start, open, high, low, close, volume] columns, the sum of price * size and the end of every bar.
+    """
+    starts, ends = _bucket_bounds(ts, unit, tz)
+    first_rows = group_starts(starts)
+    ohlc = _reduce_groups(price, first_rows, ts.size, ("first", "max", "min", "last"))
+    sums = _reduce_groups(np.stack((size, price * size), axis=1), first_rows, ts.size, ("sum",))["sum"]
+    if sums.ndim == 1:
+        sums = np.empty((0, 2))
+    columns = [starts[first_rows], ohlc["first"], ohlc["max"], ohlc["min"], ohlc["last"], sums[:, 0]]
+    return columns, sums[:, 1], ends[first_rows]
+
+
+def _vwap(pv: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    return np.divide(pv, volume, out=np.full(volume.shape, np.nan), where=volume != 0)
+
+
+def _as_ticks(ts: Any, price: Any, size: Any) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    ts = as_int64(ts)
+    price = as_values(price, ts.size).astype(np.float64, copy=False)
+    size = as_values(size, ts.size).astype(np.float64, copy=False)
+    return ts, price, size
+
+
+def build_bars(ts: Any, price: Any, size: Any, unit: Union[int, str, dTS, timedelta],
+               tz: Optional[Union[dt_tzinfo, str]] = None) -> Bars:
+    """
+    Builds OHLCV bars from ticks. Only bars containing at least one tick are returned.
+
+    :param ts: tick timestamps in nanoseconds (int64 array or sequence of iTSns)
+    :param price: tick prices
+    :param size: tick sizes
+    :param unit: bar width as int nanoseconds, dTS, dTS string (ex: "1m", "1d", "1M") or timedelta
+    :param tz: time zone used to align day/week/month bars (ex: "America/New_York"); defaults to UTC
+    """
+    ts, price, size = _as_ticks(ts, price, size)
+    if not is_sorted(ts):
+        order = np.argsort(ts, kind="stable")
+        ts, price, size = ts[order], price[order], size[order]
+    columns, pv, _ = _aggregate_bars(ts, price, size, unit, tz)
+    return Bars._make([*columns, _vwap(pv, columns[5])])
+
+
+class BarBuilder:
+    """
+    Incremental OHLCV bar builder for live tick streams.
+    Ticks must arrive in non-decreasing time order; a bar is emitted as soon as a tick of a later bar arrives,
+    or when `advance()` is called with a time at or after the bar end.
+    """
+
+    def __init__(self, unit: Union[int, str, dTS, timedelta], tz: Optional[Union[dt_tzinfo, str]] = None) -> None:
+        """
+        :param unit: bar width as int nanoseconds, dTS, dTS string (ex: "1m", "1d", "1M") or timedelta
+        :param tz: time zone used to align day/week/month bars; defaults to UTC
+        """
+        self._unit = unit
+        self._tz = get_tz(tz)
+        _bucket_bounds(np.zeros(1, dtype=np.int64), unit, self._tz)  # validates the unit
+        self._last_ts: Optional[int] = None
+        self._start: Optional[int] = None
+        self._end = 0
+        self._open = self._high = self._low = self._close = 0.0
+        self._volume = self._pv = 0.0
+
+    @property
+    def current(self) -> Optional[Bar]:
+        """The bar in progress, or None if no tick was received since the last emitted bar"""
+        if self._start is None:
+            return None
+        vwap = self._pv / self._volume if self._volume != 0 else float("nan")
+        return Bar(self._start, self._open, self._high, self._low, self._close, self._volume, vwap)
+
+    def _check_order(self, first_ts: int, last_ts: int) -> None:
+        if self._last_ts is not None and first_ts < self._last_ts:
+            raise ValueError(f"Ticks must arrive in non-decreasing time order: {first_ts} < {self._last_ts}")
+        self._last_ts = last_ts
+
+    def update(self, ts: Union[int, BaseTS], price: float, size: float) -> List[Bar]:
+        """
+        Adds a tick and returns the bars completed by it (empty list or a single bar).
+
+        :param ts: tick time as iTSns/BaseTS or int nanoseconds
+        """
+        if isinstance(ts, BaseTS):
+            ts = ts.as_nsec()
+        ts = int(ts)
+        self._check_order(ts, ts)
+        price, size = float(price), float(size)
+        if self._start is not None and ts < self._end:
+            if price > self._high:
+                self._high = price
+            elif price < self._low:
+                self._low = price
+            self._close = price
+            self._volume += size
+            self._pv += price * size
+            return []
+        completed = self.flush()
+        starts, ends = _bucket_bounds(np.array([ts], dtype=np.int64), self._unit, self._tz)
+        self._start, self._end = int(starts[0]), int(ends[0])
+        self._open = self._high = self._low = self._close = price
+        self._volume, self._pv = size, price * size
+        return [completed] if completed is not None else []
+
+    def update_many(self, ts: Any, price: Any, size: Any) -> Bars:
+        """Adds a batch of sorted ticks in one vectorised pass and returns the bars completed by them."""
+        ts, price, size = _as_ticks(ts, price, size)
+        if ts.size == 0:
+            return _empty_bars()
+        if not is_sorted(ts):
+            raise ValueError("Ticks must arrive in non-decreasing time order")
+        self._check_order(int(ts[0]), int(ts[-1]))
+        columns, pv, ends = _aggregate_bars(ts, price, size, self._unit, self._tz)
+        if self._start is not None:
+            if columns[0][0] == self._start:
+                columns[1][0] = self._open
+                columns[2][0] = max(columns[2][0], self._high)
+                columns[3][0] = min(columns[3][0], self._low)
+                columns[5][0] += self._volume
+                pv[0] += self._pv
+            else:
+                current = (self._start, self._open, self._high, self._low, self._close, self._volume)
+                columns = [np.concatenate(([value], col)) for value, col in zip(current, columns)]
+                pv = np.concatenate(([self._pv], pv))
+                ends = np.concatenate(([self._end], ends))
+        self._start, self._end = int(columns[0][-1]), int(ends[-1])
+        self._open, self._high, self._low, self._close, self._volume = (float(col[-1]) for col in columns[1:])
+        self._pv = float(pv[-1])
+        columns = [col[:-1] for col in columns]
+        return Bars._make([*columns, _vwap(pv[:-1], columns[5])])
+
+    def advance(self, now: Union[int, BaseTS]) -> Optional[Bar]:
+        """Emits the bar in progress if `now` (UTC nanoseconds) has reached its end, i.e. no more ticks can fall in it."""
+        if isinstance(now, BaseTS):
+            now = now.as_nsec()
+        if self._start is not None and int(now) >= self._end:
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[Bar]:
+        """Emits the bar in progress, if any, even if it's not complete yet."""
+        bar = self.current
+        self._start = None
+        return bar
+
+
+def _empty_bars() -> Bars:
+    return Bars(np.empty(0, dtype=np.int64), *(np.empty(0) for _ in range(6)))
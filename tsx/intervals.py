@@ -0,0 +1,1019 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose: Collections of time intervals stored as int64 nanosecond arrays: disjoint interval sets, interval indexes
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+from bisect import bisect_left
+from datetime import timedelta
+from typing import Any, AsyncIterable, AsyncIterator, Callable, ClassVar, Iterable, Iterator, List, Literal, NamedTuple, Optional, Tuple, Type, Union
+
+import numpy as np
+
+from ._columns import NANOS_PER_PREC, as_ns, as_ns_bounds, as_values, delta_to_ns, group_starts, is_sorted
+from .ts import BaseTS, TSInterval, dTS, iBaseTS, iTSns, nsInterval, _ts_from_ns
+
+
+def _as_ns_scalar(ts: Union[int, BaseTS]) -> int:
+    return int(ts.as_nsec()) if isinstance(ts, BaseTS) else int(ts)
+
+
+def _normalize(starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sorts the [start, end) intervals, drops the empty ones and coalesces the overlapping or touching ones.
+    O(n) for input sorted by start, O(n log n) otherwise.
+    """
+    non_empty = starts < ends
+    if not non_empty.all():
+        starts, ends = starts[non_empty], ends[non_empty]
+    if not is_sorted(starts):
+        order = np.argsort(starts, kind="stable")
+        starts, ends = starts[order], ends[order]
+    if starts.size < 2:
+        return starts, ends
+    reach = np.maximum.accumulate(ends)
+    new_group = np.ones(starts.size, dtype=bool)
+    new_group[1:] = starts[1:] > reach[:-1]
+    first = np.flatnonzero(new_group)
+    last = np.append(first[1:], starts.size) - 1
+    return starts[first], reach[last]
+
+
+def _combine(a: "TSIntervalSet", b: "TSIntervalSet", op: Callable[[np.ndarray, np.ndarray], np.ndarray]) -> "TSIntervalSet":
+    """
+    Applies a boolean operation (with op(False, False) == False) to the membership of two normalized sets, in O(n + m):
+    the boundaries of both sets are merged (stable sort of two sorted runs) and the membership of every elementary segment
+    is the parity of the boundaries of each set seen so far.
+    """
+    bounds_a, bounds_b = a._bounds(), b._bounds()
+    bounds = np.concatenate((bounds_a, bounds_b))
+    from_b = np.concatenate((np.zeros(bounds_a.size, dtype=bool), np.ones(bounds_b.size, dtype=bool)))
+    order = np.argsort(bounds, kind="stable")
+    bounds, from_b = bounds[order], from_b[order]
+    in_b = (np.cumsum(from_b) & 1).astype(bool)
+    in_a = (np.cumsum(~from_b) & 1).astype(bool)
+    # the state of a segment is the one after the last boundary having its start value
+    last_of_value = np.append(bounds[1:] != bounds[:-1], True)
+    bounds = bounds[last_of_value]
+    inside = op(in_a[last_of_value], in_b[last_of_value])
+    changed = inside != np.concatenate(([False], inside[:-1]))
+    edges = bounds[changed]
+    return TSIntervalSet._from_normalized(edges[0::2], edges[1::2])
+
+
+class TSIntervalSet:
+    """
+    An immutable set of time points, stored as sorted, disjoint and non-touching half-open [start, end) intervals
+    in two int64 nanosecond arrays. Set operations are O(n + m) merges, membership tests are binary searches.
+
+    Half-open intervals make the algebra exact: [a, b) | [b, c) == [a, c) and [a, c) - [b, c) == [a, b).
+    """
+
+    __slots__ = ("_starts", "_ends")
+
+    def __init__(self, intervals: Any = ()) -> None:
+        """
+        :param intervals: a sequence of TSInterval, a (starts, ends) pair of int64 nanosecond arrays or an (n, 2) array;
+                          the intervals may be unsorted, overlapping or touching, they are coalesced
+        """
+        if isinstance(intervals, TSInterval):
+            intervals = [intervals]
+        starts, ends = as_ns_bounds(intervals)
+        starts, ends = _normalize(starts, ends)
+        self._set_arrays(starts, ends)
+
+    def _set_arrays(self, starts: np.ndarray, ends: np.ndarray) -> None:
+        starts.flags.writeable = False
+        ends.flags.writeable = False
+        self._starts = starts
+        self._ends = ends
+
+    @classmethod
+    def _from_normalized(cls, starts: np.ndarray, ends: np.ndarray) -> "TSIntervalSet":
+        res = cls.__new__(cls)
+        res._set_arrays(np.ascontiguousarray(starts, dtype=np.int64), np.ascontiguousarray(ends, dtype=np.int64))
+        return res
+
+    @property
+    def starts(self) -> np.ndarray:
+        """Read-only int64 nanosecond starts (inclusive) of the disjoint intervals, in increasing order"""
+        return self._starts
+
+    @property
+    def ends(self) -> np.ndarray:
+        """Read-only int64 nanosecond ends (exclusive) of the disjoint intervals, in increasing order"""
+        return self._ends
+
+    def _bounds(self) -> np.ndarray:
+        """The strictly increasing boundaries start0, end0, start1, end1, ..."""
+        return np.stack((self._starts, self._ends), axis=1).ravel()
+
+    def __len__(self) -> int:
+        """Number of disjoint intervals"""
+        return self._starts.size
+
+    def __bool__(self) -> bool:
+        return self._starts.size > 0
+
+    def __iter__(self) -> Iterator[TSInterval]:
+        for start, end in zip(self._starts.tolist(), self._ends.tolist()):
+            yield TSInterval(iTSns(start), iTSns(end))
+
+    def to_intervals(self) -> List[TSInterval]:
+        """Returns the disjoint intervals as TSInterval(iTSns(start), iTSns(end))"""
+        return list(self)
+
+    def __repr__(self) -> str:
+        if len(self) > 6:
+            return f"{self.__class__.__name__}(<{len(self)} intervals in [{int(self._starts[0])}, {int(self._ends[-1])})>)"
+        return f"{self.__class__.__name__}({list(zip(self._starts.tolist(), self._ends.tolist()))})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TSIntervalSet):
+            return NotImplemented
+        return np.array_equal(self._starts, other._starts) and np.array_equal(self._ends, other._ends)
+
+    # unhashable, like the arrays it wraps; declared the way typeshed declares list.__hash__
+    __hash__: ClassVar[None]  # type: ignore[assignment]
+
+    @property
+    def duration(self) -> dTS:
+        """Total covered duration, as dTS"""
+        return dTS(int((self._ends - self._starts).sum()), unit="ns")
+
+    def contains(self, ts: Union[int, BaseTS]) -> bool:
+        """
+        Checks whether the timestamp (BaseTS or int nanoseconds) falls inside one of the [start, end) intervals, by binary search.
+        """
+        ts_ns = _as_ns_scalar(ts)
+        i = int(np.searchsorted(self._starts, ts_ns, side="right")) - 1
+        return i >= 0 and ts_ns < int(self._ends[i])
+
+    def __contains__(self, ts: Union[int, BaseTS]) -> bool:
+        return self.contains(ts)
+
+    def contains_array(self, ts_array: Any, prec: str = "ns") -> np.ndarray:
+        """
+        Vectorised contains(): returns a bool array telling which timestamps fall inside the set.
+
+        :param ts_array: timestamps (int64 in `prec` units or sequence of BaseTS)
+        :param prec: units of ts_array if given as plain integers
+        """
+        ts = as_ns(ts_array, prec)
+        i = np.searchsorted(self._starts, ts, side="right") - 1
+        return (i >= 0) & (ts < self._ends[np.maximum(i, 0)]) if self._starts.size else np.zeros(ts.shape, dtype=bool)
+
+    def _coerce(self, other: Any) -> "TSIntervalSet":
+        return other if isinstance(other, TSIntervalSet) else TSIntervalSet(other)
+
+    def union(self, other: Any) -> "TSIntervalSet":
+        """Points in either set; `other` can be a TSIntervalSet or anything its constructor accepts"""
+        return _combine(self, self._coerce(other), np.logical_or)
+
+    def intersection(self, other: Any) -> "TSIntervalSet":
+        """Points in both sets"""
+        return _combine(self, self._coerce(other), np.logical_and)
+
+    def difference(self, other: Any) -> "TSIntervalSet":
+        """Points in this set and not in `other`"""
+        return _combine(self, self._coerce(other), lambda a, b: a & ~b)
+
+    def symmetric_difference(self, other: Any) -> "TSIntervalSet":
+        """Points in exactly one of the sets"""
+        return _combine(self, self._coerce(other), np.logical_xor)
+
+    def complement(self, bound: Union[TSInterval, Tuple[Union[int, BaseTS], Union[int, BaseTS]]]) -> "TSIntervalSet":
+        """
+        Points of `bound` not in this set, ex: the gaps of the set inside a day.
+
+        :param bound: a TSInterval or a (start, end) pair of BaseTS or int nanoseconds
+        """
+        start: Union[int, BaseTS]
+        end: Union[int, BaseTS]
+        if isinstance(bound, TSInterval):
+            start, end = bound.start, bound.end
+        else:
+            start, end = bound
+        bound_set = TSIntervalSet((np.array([_as_ns_scalar(start)], dtype=np.int64), np.array([_as_ns_scalar(end)], dtype=np.int64)))
+        return bound_set.difference(self)
+
+    def __or__(self, other: object) -> "TSIntervalSet":
+        return self.union(other) if isinstance(other, (TSIntervalSet, TSInterval)) else NotImplemented
+
+    def __and__(self, other: object) -> "TSIntervalSet":
+        return self.intersection(other) if isinstance(other, (TSIntervalSet, TSInterval)) else NotImplemented
+
+    def __sub__(self, other: object) -> "TSIntervalSet":
+        return self.difference(other) if isinstance(other, (TSIntervalSet, TSInterval)) else NotImplemented
+
+    def __xor__(self, other: object) -> "TSIntervalSet":
+        return self.symmetric_difference(other) if isinstance(other, (TSIntervalSet, TSInterval)) else NotImplemented
+
+
+def _expand_ranges(lo: np.ndarray, hi: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    For every i, enumerates the positions lo[i] <= p < hi[i]; returns the (i, p) pairs, grouped by i.
+    """
+    counts = np.maximum(hi - lo, 0)
+    owner = np.repeat(np.arange(lo.size), counts)
+    group_first = np.cumsum(counts) - counts
+    positions = np.arange(owner.size) - np.repeat(group_first, counts) + np.repeat(lo, counts)
+    return owner, positions
+
+
+def _as_query_bounds(query: Any, end: Optional[Union[int, BaseTS]]) -> Tuple[int, int]:
+    if isinstance(query, TSInterval):
+        return int(query.start.as_nsec()), int(query.end.as_nsec())
+    start_ns = _as_ns_scalar(query)
+    return start_ns, start_ns if end is None else _as_ns_scalar(end)
+
+
+class IntervalIndex:
+    """
+    An immutable index over a (possibly overlapping) collection of intervals, bulk built from int64 nanosecond bounds.
+    Results are positions in the input collection. The intervals are closed [start, end], like TSInterval.contains().
+
+    Single queries walk a centered interval tree flattened into arrays (O(log n + k)),
+    batch queries are vectorised sort/binary-search joins (O((n + m) log(n + m) + k)) without a Python loop per point.
+    """
+
+    LEAF_SIZE = 32
+
+    def __init__(self, intervals: Any) -> None:
+        """
+        :param intervals: a sequence of TSInterval, a (starts, ends) pair of int64 nanosecond arrays or an (n, 2) array
+        """
+        starts, ends = as_ns_bounds(intervals)
+        self._starts, self._ends = starts.copy(), ends.copy()
+        self._starts.flags.writeable = False
+        self._ends.flags.writeable = False
+        self._by_start = np.argsort(starts, kind="stable")
+        self._sorted_starts = starts[self._by_start]
+        self._by_end = np.argsort(ends, kind="stable")
+        self._sorted_ends = ends[self._by_end]
+        # running max of the ends in start order, and where it was reached, to find a containing interval in O(log n)
+        reach = np.maximum.accumulate(ends[self._by_start]) if starts.size else np.empty(0, dtype=np.int64)
+        self._reach = reach
+        positions = np.arange(starts.size)
+        self._reach_pos = np.maximum.accumulate(np.where(ends[self._by_start] == reach, positions, 0)) if starts.size else positions
+        self._build_tree()
+
+    def _build_tree(self) -> None:
+        """
+        Builds the centered interval tree: every node keeps the intervals containing its center (sorted by start and by end),
+        the intervals entirely before/after the center go to the left/right child. Small nodes are leaves, scanned linearly.
+        """
+        centers: List[int] = []
+        lefts: List[int] = []
+        rights: List[int] = []
+        offsets: List[int] = []
+        counts: List[int] = []
+        leaves: List[bool] = []
+        start_idx_parts: List[np.ndarray] = []
+        end_idx_parts: List[np.ndarray] = []
+        offset = 0
+        stack = [(np.arange(self._starts.size), -1, False)]
+        while stack:
+            members, parent, is_right = stack.pop()
+            node = len(centers)
+            if parent >= 0:
+                (rights if is_right else lefts)[parent] = node
+            starts, ends = self._starts[members], self._ends[members]
+            is_leaf = members.size <= self.LEAF_SIZE
+            if is_leaf:
+                center = 0
+                here = np.ones(members.size, dtype=bool)
+            else:
+                endpoints = np.concatenate((starts, ends))
+                center = int(np.partition(endpoints, endpoints.size // 2)[endpoints.size // 2])
+                here = (starts <= center) & (ends >= center)
+            node_members = members[here]
+            start_idx_parts.append(node_members[np.argsort(self._starts[node_members], kind="stable")])
+            end_idx_parts.append(node_members[np.argsort(self._ends[node_members], kind="stable")])
+            centers.append(center)
+            lefts.append(-1)
+            rights.append(-1)
+            offsets.append(offset)
+            counts.append(node_members.size)
+            leaves.append(is_leaf)
+            offset += node_members.size
+            if not is_leaf:
+                left, right = ends < center, starts > center
+                if left.any():
+                    stack.append((members[left], node, False))
+                if right.any():
+                    stack.append((members[right], node, True))
+        self._node_center = centers
+        self._node_left = lefts
+        self._node_right = rights
+        self._node_offset = offsets
+        self._node_count = counts
+        self._node_leaf = leaves
+        empty = np.empty(0, dtype=np.intp)
+        self._node_start_idx = np.concatenate(start_idx_parts) if start_idx_parts else empty
+        self._node_start_val = self._starts[self._node_start_idx]
+        self._node_end_idx = np.concatenate(end_idx_parts) if end_idx_parts else empty
+        self._node_end_val = self._ends[self._node_end_idx]
+
+    def __len__(self) -> int:
+        return self._starts.size
+
+    @property
+    def starts(self) -> np.ndarray:
+        """Read-only int64 nanosecond starts, in input order"""
+        return self._starts
+
+    @property
+    def ends(self) -> np.ndarray:
+        """Read-only int64 nanosecond ends, in input order"""
+        return self._ends
+
+    def _stab(self, ts: int, start_closed: bool = True, end_closed: bool = True) -> np.ndarray:
+        parts = []
+        node = 0 if self._node_center else -1
+        while node >= 0:
+            lo = self._node_offset[node]
+            hi = lo + self._node_count[node]
+            center = self._node_center[node]
+            if self._node_leaf[node] or ts == center:
+                members = self._node_start_idx[lo:hi]
+                starts, ends = self._node_start_val[lo:hi], self._ends[members]
+                mask = (starts <= ts if start_closed else starts < ts) & (ends >= ts if end_closed else ends > ts)
+                parts.append(members[mask])
+                break
+            if ts < center:
+                k = np.searchsorted(self._node_start_val[lo:hi], ts, side="right" if start_closed else "left")
+                parts.append(self._node_start_idx[lo:lo + k])
+                node = self._node_left[node]
+            else:
+                k = np.searchsorted(self._node_end_val[lo:hi], ts, side="left" if end_closed else "right")
+                parts.append(self._node_end_idx[lo + k:hi])
+                node = self._node_right[node]
+        return np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.intp)
+
+    def stab(self, ts: Union[int, BaseTS]) -> np.ndarray:
+        """
+        Returns the sorted positions of the intervals containing the timestamp: start <= ts <= end.
+
+        :param ts: BaseTS or int nanoseconds
+        """
+        return self._stab(_as_ns_scalar(ts))
+
+    def overlap(self, query: Union[TSInterval, int, BaseTS], end: Optional[Union[int, BaseTS]] = None, inclusive: bool = True) -> np.ndarray:
+        """
+        Returns the sorted positions of the intervals overlapping [start, end].
+
+        :param query: a TSInterval, or the start of the query (BaseTS or int nanoseconds) when `end` is given
+        :param end: the end of the query when `query` is a start timestamp
+        :param inclusive: True -> touching intervals overlap too (like TSInterval.overlaps_inclusive());
+                          False -> like TSInterval.overlaps()
+        """
+        start_ns, end_ns = _as_query_bounds(query, end)
+        if start_ns > end_ns:
+            raise ValueError(f"Query start ({start_ns}) must not be after its end ({end_ns})")
+        # the intervals that start before the query and reach it, plus the ones starting inside the query
+        before = self._stab(start_ns, start_closed=False, end_closed=inclusive)
+        lo = np.searchsorted(self._sorted_starts, start_ns, side="left")
+        hi = np.searchsorted(self._sorted_starts, end_ns, side="right" if inclusive else "left")
+        inside = self._by_start[lo:max(lo, hi)]
+        if not inclusive:
+            # empty intervals lying exactly on the query start don't overlap it
+            inside = inside[self._ends[inside] > start_ns]
+        return np.sort(np.concatenate((before, inside)))
+
+    def nearest_many(self, ts_array: Any, prec: str = "ns") -> np.ndarray:
+        """
+        Returns, for every timestamp, the position of the nearest interval (distance 0 if it's contained), -1 if the index is empty.
+        Among containing intervals the one reaching furthest is returned; equidistant neighbours resolve to the earlier one.
+
+        :param ts_array: timestamps (int64 in `prec` units or sequence of BaseTS)
+        :param prec: units of ts_array if given as plain integers
+        """
+        ts = as_ns(ts_array, prec)
+        n = self._starts.size
+        if n == 0:
+            return np.full(ts.shape, -1, dtype=np.int64)
+        started = np.searchsorted(self._sorted_starts, ts, side="right")
+        last_started = np.maximum(started - 1, 0)
+        contained = (started > 0) & (self._reach[last_started] >= ts)
+        containing = self._by_start[self._reach_pos[last_started]]
+        # the latest interval ending before ts, and the first one starting after it
+        before_pos = np.searchsorted(self._sorted_ends, ts, side="left") - 1
+        has_before = before_pos >= 0
+        before = self._by_end[np.maximum(before_pos, 0)]
+        has_after = started < n
+        after = self._by_start[np.minimum(started, n - 1)]
+        dist_before = np.where(has_before, ts - self._ends[before], np.iinfo(np.int64).max)
+        dist_after = np.where(has_after, self._starts[after] - ts, np.iinfo(np.int64).max)
+        res = np.where(dist_before <= dist_after, before, after)
+        return np.where(contained, containing, res).astype(np.int64)
+
+    def nearest(self, ts: Union[int, BaseTS]) -> int:
+        """Returns the position of the interval nearest to the timestamp, see nearest_many()"""
+        return int(self.nearest_many(np.array([_as_ns_scalar(ts)], dtype=np.int64))[0])
+
+    def _stab_pairs(self, ts: np.ndarray, start_closed: bool, end_closed: bool) -> Tuple[np.ndarray, np.ndarray]:
+        order = np.argsort(ts, kind="stable")
+        sorted_ts = ts[order]
+        lo = np.searchsorted(sorted_ts, self._starts, side="left" if start_closed else "right")
+        hi = np.searchsorted(sorted_ts, self._ends, side="right" if end_closed else "left")
+        interval_idx, positions = _expand_ranges(lo, hi)
+        return order[positions], interval_idx
+
+    @staticmethod
+    def _sorted_pairs(query_idx: np.ndarray, interval_idx: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        order = np.lexsort((interval_idx, query_idx))
+        return query_idx[order].astype(np.int64), interval_idx[order].astype(np.int64)
+
+    def stab_many(self, ts_array: Any, prec: str = "ns") -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Batch stab(): returns the (point_idx, interval_idx) pairs with starts[interval_idx] <= ts[point_idx] <= ends[interval_idx],
+        sorted by point then interval.
+
+        :param ts_array: timestamps (int64 in `prec` units or sequence of BaseTS)
+        :param prec: units of ts_array if given as plain integers
+        """
+        return self._sorted_pairs(*self._stab_pairs(as_ns(ts_array, prec), True, True))
+
+    def overlap_many(self, queries: Any, inclusive: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Batch overlap(): returns the (query_idx, interval_idx) pairs of overlapping intervals, sorted by query then interval.
+
+        :param queries: a sequence of TSInterval, a (starts, ends) pair of int64 nanosecond arrays or an (n, 2) array
+        :param inclusive: see overlap()
+        """
+        q_starts, q_ends = as_ns_bounds(queries)
+        before_q, before_i = self._stab_pairs(q_starts, start_closed=False, end_closed=inclusive)
+        lo = np.searchsorted(self._sorted_starts, q_starts, side="left")
+        hi = np.searchsorted(self._sorted_starts, q_ends, side="right" if inclusive else "left")
+        inside_q, positions = _expand_ranges(lo, hi)
+        inside_i = self._by_start[positions]
+        if not inclusive:
+            keep = self._ends[inside_i] > q_starts[inside_q]
+            inside_q, inside_i = inside_q[keep], inside_i[keep]
+        return self._sorted_pairs(np.concatenate((before_q, inside_q)), np.concatenate((before_i, inside_i)))
+
+
+def _seconds_or_delta_ns(delta: Union[dTS, timedelta, float, int]) -> int:
+    """Numbers are seconds, like for TSInterval.shift()/expand(); dTS and timedelta are converted exactly."""
+    if isinstance(delta, (int, float)) and not isinstance(delta, bool):
+        return round(delta * 1_000_000_000)
+    return delta_to_ns(delta)
+
+
+class IntervalArray:
+    """
+    A column of intervals backed by two int64 nanosecond arrays, with the vectorised counterparts of the TSInterval methods.
+    Rows with start == end are empty intervals; they only appear as results of intersection() and convert to None,
+    like TSInterval.intersection() returning None.
+    """
+
+    __slots__ = ("_starts", "_ends", "_ts_cls")
+
+    def __init__(self, intervals: Any, ts_cls: Optional[Type[BaseTS]] = None) -> None:
+        """
+        :param intervals: a sequence of TSInterval/nsInterval, a (starts, ends) pair of int64 nanosecond arrays or an (n, 2) array
+        :param ts_cls: the timestamp class used when converting back to TSInterval;
+                       defaults to the class of the first start for TSInterval input and iTSns otherwise
+        """
+        if isinstance(intervals, (list, tuple)) and intervals and isinstance(intervals[0], nsInterval):
+            if ts_cls is None:
+                ts_cls = intervals[0]._ts_cls
+            intervals = (np.array([interval.start_ns for interval in intervals], dtype=np.int64),
+                         np.array([interval.end_ns for interval in intervals], dtype=np.int64))
+        elif ts_cls is None and isinstance(intervals, (list, tuple)) and intervals and isinstance(intervals[0], TSInterval):
+            ts_cls = type(intervals[0].start)
+        starts, ends = as_ns_bounds(intervals)
+        self._starts = starts
+        self._ends = ends
+        self._ts_cls = ts_cls or iTSns
+
+    @classmethod
+    def _new(cls, starts: np.ndarray, ends: np.ndarray, ts_cls: Type[BaseTS]) -> "IntervalArray":
+        res = cls.__new__(cls)
+        res._starts, res._ends, res._ts_cls = starts, ends, ts_cls
+        return res
+
+    @classmethod
+    def from_intervals(cls, intervals: List[TSInterval], ts_cls: Optional[Type[BaseTS]] = None) -> "IntervalArray":
+        return cls(list(intervals), ts_cls)
+
+    def _interval(self, i: int) -> Optional[TSInterval]:
+        start, end = int(self._starts[i]), int(self._ends[i])
+        return TSInterval(_ts_from_ns(self._ts_cls, start), _ts_from_ns(self._ts_cls, end)) if start < end else None
+
+    def to_intervals(self) -> List[Optional[TSInterval]]:
+        """Converts back to TSInterval in the `ts_cls` class (None for the empty rows)"""
+        return [self._interval(i) for i in range(len(self))]
+
+    @property
+    def starts(self) -> np.ndarray:
+        return self._starts
+
+    @property
+    def ends(self) -> np.ndarray:
+        return self._ends
+
+    @property
+    def ts_cls(self) -> Type[BaseTS]:
+        return self._ts_cls
+
+    def __len__(self) -> int:
+        return self._starts.size
+
+    def __iter__(self) -> Iterator[Optional[TSInterval]]:
+        for i in range(len(self)):
+            yield self._interval(i)
+
+    def __getitem__(self, item: Any) -> Union[Optional[TSInterval], "IntervalArray"]:
+        """An int returns a TSInterval (None for an empty row); slices, masks and index arrays return an IntervalArray"""
+        if isinstance(item, (int, np.integer)):
+            return self._interval(int(np.arange(len(self))[item]))
+        return self._new(self._starts[item], self._ends[item], self._ts_cls)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(<{len(self)} intervals of {self._ts_cls.__name__}>)"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalArray):
+            return NotImplemented
+        return np.array_equal(self._starts, other._starts) and np.array_equal(self._ends, other._ends)
+
+    # unhashable, like the arrays it wraps; declared the way typeshed declares list.__hash__
+    __hash__: ClassVar[None]  # type: ignore[assignment]
+
+    def _other_bounds(self, other: Union["IntervalArray", TSInterval, nsInterval]) -> Tuple[Any, Any]:
+        """Bounds of the other operand: one interval for all the rows, or an IntervalArray of the same length"""
+        if isinstance(other, IntervalArray):
+            if len(other) != len(self):
+                raise ValueError(f"IntervalArrays must have the same length: {len(self)} != {len(other)}")
+            return other._starts, other._ends
+        if isinstance(other, nsInterval):
+            return other.start_ns, other.end_ns
+        if isinstance(other, TSInterval):
+            return int(other.start.as_nsec()), int(other.end.as_nsec())
+        raise TypeError(f"Expected an IntervalArray, TSInterval or nsInterval, got {type(other)}")
+
+    def _points(self, ts: Any, prec: str) -> Any:
+        if isinstance(ts, BaseTS):
+            return int(ts.as_nsec())
+        if isinstance(ts, (int, np.integer)):
+            return int(ts) * NANOS_PER_PREC[prec]
+        points = as_ns(ts, prec)
+        if points.shape != self._starts.shape:
+            raise ValueError(f"Expected one timestamp per interval ({len(self)}), got shape {points.shape}")
+        return points
+
+    @property
+    def duration(self) -> np.ndarray:
+        """int64 nanosecond durations"""
+        return self._ends - self._starts
+
+    @property
+    def midpoint(self) -> np.ndarray:
+        """int64 nanosecond midpoints (rounded down)"""
+        return self._starts + (self._ends - self._starts) // 2
+
+    def contains(self, ts: Any, prec: str = "ns") -> np.ndarray:
+        """
+        Checks, for every row, if the timestamp is within the interval (inclusive on both ends).
+
+        :param ts: one timestamp for all the rows (BaseTS or int) or one timestamp per row (int64 in `prec` units or sequence of BaseTS)
+        :param prec: units of the plain integer timestamps
+        """
+        points = self._points(ts, prec)
+        return (self._starts <= points) & (points <= self._ends)
+
+    def contains_exclusive(self, ts: Any, prec: str = "ns") -> np.ndarray:
+        """Like contains(), but exclusive on both ends"""
+        points = self._points(ts, prec)
+        return (self._starts < points) & (points < self._ends)
+
+    def overlaps(self, other: Union["IntervalArray", TSInterval, nsInterval]) -> np.ndarray:
+        """Row-wise TSInterval.overlaps() against another IntervalArray of the same length or a single interval"""
+        starts, ends = self._other_bounds(other)
+        return (self._starts < ends) & (self._ends > starts)
+
+    def overlaps_inclusive(self, other: Union["IntervalArray", TSInterval, nsInterval]) -> np.ndarray:
+        """Row-wise TSInterval.overlaps_inclusive()"""
+        starts, ends = self._other_bounds(other)
+        return (self._starts <= ends) & (self._ends >= starts)
+
+    def intersection(self, other: Union["IntervalArray", TSInterval, nsInterval]) -> "IntervalArray":
+        """Row-wise TSInterval.intersection(); rows without overlap become empty intervals (see overlaps())"""
+        starts, ends = self._other_bounds(other)
+        new_starts = np.maximum(self._starts, starts)
+        new_ends = np.minimum(self._ends, ends)
+        no_overlap = ~((self._starts < ends) & (self._ends > starts))
+        new_ends = np.where(no_overlap, new_starts, new_ends)
+        return self._new(new_starts, new_ends, self._ts_cls)
+
+    def __and__(self, other: object) -> "IntervalArray":
+        if not isinstance(other, (IntervalArray, TSInterval, nsInterval)):
+            return NotImplemented
+        return self.intersection(other)
+
+    def relation(self, other: Union["IntervalArray", TSInterval, nsInterval]) -> np.ndarray:
+        """Row-wise TSInterval.relation() as int8 codes, see allen_relations()"""
+        starts, ends = self._other_bounds(other)
+        return _allen_codes(self._starts, self._ends, starts, ends)
+
+    def shift(self, delta: Union[dTS, timedelta, float]) -> "IntervalArray":
+        """Shifts all the intervals by a delta (dTS, timedelta, or float seconds, like TSInterval.shift())"""
+        delta_ns = _seconds_or_delta_ns(delta)
+        return self._new(self._starts + delta_ns, self._ends + delta_ns, self._ts_cls)
+
+    def expand(self, before: Union[dTS, timedelta, float] = 0, after: Union[dTS, timedelta, float] = 0) -> "IntervalArray":
+        """Expands all the intervals (dTS, timedelta, or float seconds, like TSInterval.expand())"""
+        starts = self._starts - _seconds_or_delta_ns(before)
+        ends = self._ends + _seconds_or_delta_ns(after)
+        if np.any(starts > ends):
+            raise ValueError("Expanding by negative deltas would invert some intervals")
+        return self._new(starts, ends, self._ts_cls)
+
+    def _iso(self, ns: np.ndarray) -> np.ndarray:
+        if issubclass(self._ts_cls, iBaseTS):
+            unit = self._ts_cls.PREC_STR
+            return np.datetime_as_string((ns // self._ts_cls.NANOS_PER_UNIT).astype(f"datetime64[{unit}]"), timezone="UTC")
+        # float timestamps print their microseconds only when not zero, like TS.isoformat()
+        res = np.datetime_as_string((ns // 1_000).astype("datetime64[us]"), timezone="UTC")
+        whole_sec = ns % 1_000_000_000 == 0
+        if whole_sec.any():
+            res[whole_sec] = np.datetime_as_string((ns[whole_sec] // 1_000_000_000).astype("datetime64[s]"), timezone="UTC")
+        return res
+
+    def isoformat(self, stampsep: str = "/") -> np.ndarray:
+        """Returns the ISO 8601 "start/end" representation of every row, like TSInterval.isoformat() with the `ts_cls` bounds"""
+        return np.char.add(np.char.add(self._iso(self._starts), stampsep), self._iso(self._ends))
+
+    def argsort(self) -> np.ndarray:
+        """Positions sorting the rows by (start, end), the TSInterval ordering"""
+        return np.lexsort((self._ends, self._starts))
+
+    def sort(self) -> "IntervalArray":
+        """Returns a new IntervalArray sorted by (start, end)"""
+        order = self.argsort()
+        return self._new(self._starts[order], self._ends[order], self._ts_cls)
+
+
+_NO_END = np.iinfo(np.int64).min
+
+
+def _max_levels(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Builds a bottom-up max tree over the values: level 0 is the values, every next level holds the max of pairs of the previous one.
+    Levels are padded to an even size so every node has two children. Returns the flattened levels and their offsets (2n memory).
+    """
+    levels = []
+    level = values
+    while True:
+        if level.size > 1 and level.size % 2:
+            level = np.append(level, _NO_END)
+        levels.append(level)
+        if level.size <= 1:
+            break
+        level = np.maximum(level[0::2], level[1::2])
+    offsets = np.concatenate(([0], np.cumsum([level.size for level in levels])[:-1]))
+    return np.concatenate(levels), offsets
+
+
+def _last_reaching(ends: np.ndarray, k: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    For every point, returns the largest j < k with ends[j] >= point (-1 if none), in O(log n) vectorised steps per point:
+    blocks of the max tree entirely below the point are skipped leftwards, then the first block reaching it is descended.
+    """
+    flat, offsets = _max_levels(ends)
+    n_levels = offsets.size
+    node = k - 1
+    level = np.zeros(points.size, dtype=np.intp)
+    searching = node >= 0
+    found = np.zeros(points.size, dtype=bool)
+    for _ in range(2 * n_levels):
+        rows = np.flatnonzero(searching)
+        if rows.size == 0:
+            break
+        reaches = flat[offsets[level[rows]] + node[rows]] >= points[rows]
+        found[rows[reaches]] = True
+        searching[rows[reaches]] = False
+        failed = rows[~reaches]
+        # a failed right child continues with its left sibling, a failed left child with the block left of its parent
+        is_right = node[failed] % 2 == 1
+        node[failed] = np.where(is_right, node[failed] - 1, node[failed] // 2 - 1)
+        level[failed] += ~is_right
+        searching[failed[node[failed] < 0]] = False
+    for _ in range(n_levels):
+        rows = np.flatnonzero(found & (level > 0))
+        if rows.size == 0:
+            break
+        right = 2 * node[rows] + 1
+        level[rows] -= 1
+        reaches = flat[offsets[level[rows]] + right] >= points[rows]
+        node[rows] = np.where(reaches, right, right - 1)
+    return np.where(found, node, -1)
+
+
+def assign(points: Any, intervals: Any, prec: str = "ns") -> np.ndarray:
+    """
+    Returns, for every point, the position of the interval containing it (start <= point <= end, like TSInterval.contains()),
+    or -1 when there is none. When several intervals contain a point, the one starting last wins (ties go to the lowest position),
+    so a point on the boundary of two back-to-back intervals goes to the later one.
+    Disjoint (or back-to-back) intervals are assigned with a binary-search sweep, overlapping ones with a max-end tree,
+    both in O((n + m) log n).
+
+    :param points: timestamps (int64 in `prec` units or sequence of BaseTS)
+    :param intervals: a sequence of TSInterval, a (starts, ends) pair of int64 nanosecond arrays, an (n, 2) array,
+                      an IntervalArray or a TSIntervalSet
+    :param prec: units of points if given as plain integers
+    """
+    ts = as_ns(points, prec)
+    starts, ends = as_ns_bounds(intervals)
+    if starts.size == 0:
+        return np.full(ts.shape, -1, dtype=np.int64)
+    order = np.lexsort((-np.arange(starts.size), starts))
+    sorted_starts, sorted_ends = starts[order], ends[order]
+    k = np.searchsorted(sorted_starts, ts, side="right")
+    if np.all(sorted_ends[:-1] <= sorted_starts[1:]):
+        pos = k - 1
+        match = (pos >= 0) & (ts <= sorted_ends[np.maximum(pos, 0)])
+    else:
+        pos = _last_reaching(sorted_ends, k, ts)
+        match = pos >= 0
+    return np.where(match, order[np.maximum(pos, 0)], -1).astype(np.int64)
+
+
+JoinHow = Literal["overlap", "contains", "within"]
+DEFAULT_JOIN_CHUNK = 1_000_000
+
+
+def _iter_expand_ranges(lo: np.ndarray, hi: np.ndarray, chunk_size: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Lazy _expand_ranges(): yields the (i, p) pairs with lo[i] <= p < hi[i] in pieces of at most chunk_size pairs,
+    so the memory stays bounded whatever the total number of pairs (a single range may span several pieces).
+    """
+    counts = np.maximum(hi - lo, 0)
+    ends = np.cumsum(counts)
+    total = int(ends[-1]) if ends.size else 0
+    for first in range(0, total, chunk_size):
+        pair = np.arange(first, min(first + chunk_size, total), dtype=np.int64)
+        owner = np.searchsorted(ends, pair, side="right")
+        yield owner, lo[owner] + pair - (ends[owner] - counts[owner])
+
+
+def iter_interval_join(left: Any, right: Any, how: JoinHow = "overlap", min_overlap: Union[int, dTS, timedelta] = 0,
+                       return_intersections: bool = False, chunk_size: int = DEFAULT_JOIN_CHUNK) -> Iterator[tuple]:
+    """
+    Streaming interval_join(): yields (left_idx, right_idx) or (left_idx, right_idx, intersections) chunks,
+    each built from at most `chunk_size` candidate pairs, so arbitrarily large outputs are produced in bounded memory.
+    See interval_join() for the parameters.
+    """
+    if how not in ("overlap", "contains", "within"):
+        raise ValueError(f"Invalid how={how!r}. Expected one of 'overlap', 'contains', 'within'")
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size should be positive: {chunk_size}")
+    min_overlap_ns = delta_to_ns(min_overlap)
+    l_starts, l_ends = as_ns_bounds(left)
+    r_starts, r_ends = as_ns_bounds(right)
+    l_order = np.argsort(l_starts, kind="stable")
+    r_order = np.argsort(r_starts, kind="stable")
+    l_sorted, r_sorted = l_starts[l_order], r_starts[r_order]
+
+    # every pair of touching or overlapping intervals is enumerated once: the rights starting inside a left interval (at or after its start),
+    # then the lefts starting inside a right interval (strictly after its start)
+    r_lo = np.searchsorted(r_sorted, l_starts, side="left")
+    r_hi = np.searchsorted(r_sorted, l_ends, side="right")
+    l_lo = np.searchsorted(l_sorted, r_starts, side="right")
+    l_hi = np.searchsorted(l_sorted, r_ends, side="right")
+    candidates = (
+        (owner, r_order[positions]) for owner, positions in _iter_expand_ranges(r_lo, r_hi, chunk_size)
+    ), (
+        (l_order[positions], owner) for owner, positions in _iter_expand_ranges(l_lo, l_hi, chunk_size)
+    )
+    for pairs in candidates:
+        for left_idx, right_idx in pairs:
+            starts = np.maximum(l_starts[left_idx], r_starts[right_idx])
+            ends = np.minimum(l_ends[left_idx], r_ends[right_idx])
+            if how == "overlap":
+                keep = ends > starts
+            elif how == "contains":
+                keep = (l_starts[left_idx] <= r_starts[right_idx]) & (r_ends[right_idx] <= l_ends[left_idx])
+            else:
+                keep = (r_starts[right_idx] <= l_starts[left_idx]) & (l_ends[left_idx] <= r_ends[right_idx])
+            if min_overlap_ns > 0:
+                keep &= ends - starts >= min_overlap_ns
+            if not keep.any():
+                continue
+            left_idx, right_idx = left_idx[keep].astype(np.int64), right_idx[keep].astype(np.int64)
+            if return_intersections:
+                yield left_idx, right_idx, IntervalArray((starts[keep], ends[keep]))
+            else:
+                yield left_idx, right_idx
+
+
+def interval_join(left: Any, right: Any, how: JoinHow = "overlap", min_overlap: Union[int, dTS, timedelta] = 0,
+                  return_intersections: bool = False, chunk_size: int = DEFAULT_JOIN_CHUNK) -> tuple:
+    """
+    Joins two interval collections with a sort-and-sweep over their int64 endpoints, in O((n + m) log(n + m) + k) for k candidate pairs.
+
+    :param left: a sequence of TSInterval, a (starts, ends) pair of int64 nanosecond arrays, an (n, 2) array or an IntervalArray
+    :param right: same as left
+    :param how: "overlap" -> the intervals share a positive duration (like TSInterval.overlaps());
+                "contains" -> the left interval contains the right one; "within" -> the left interval is inside the right one
+    :param min_overlap: minimum duration of the intersection, as int nanoseconds, dTS or timedelta
+    :param return_intersections: also return the intersection of every pair, as an IntervalArray
+    :param chunk_size: maximum number of candidate pairs materialized at once, see iter_interval_join() to stream the result
+    :return: (left_idx, right_idx) int64 arrays of the matching pairs, plus the intersections if requested;
+             the pairs are not sorted, use np.lexsort((right_idx, left_idx)) if needed
+    """
+    chunks = list(iter_interval_join(left, right, how, min_overlap, return_intersections, chunk_size))
+    left_idx = np.concatenate([chunk[0] for chunk in chunks]) if chunks else np.empty(0, dtype=np.int64)
+    right_idx = np.concatenate([chunk[1] for chunk in chunks]) if chunks else np.empty(0, dtype=np.int64)
+    if not return_intersections:
+        return left_idx, right_idx
+    starts = np.concatenate([chunk[2].starts for chunk in chunks]) if chunks else np.empty(0, dtype=np.int64)
+    ends = np.concatenate([chunk[2].ends for chunk in chunks]) if chunks else np.empty(0, dtype=np.int64)
+    return left_idx, right_idx, IntervalArray((starts, ends))
+
+
+class OverlapProfile(NamedTuple):
+    """
+    Result of overlap_profile(): the step function of the active count (or weight), which is counts[i] on [times[i], times[i + 1])
+    and 0 before times[0]. Consecutive counts always differ: a 0 count inside marks a gap between intervals, and the last count is always 0.
+    The peak is first reached on [peak_start, peak_end), which are None when there are no intervals or the profile never rises above 0 (ex: negative weights).
+    """
+    times: np.ndarray
+    counts: np.ndarray
+    peak: Union[int, float]
+    peak_start: Optional[int]
+    peak_end: Optional[int]
+
+    def at(self, ts_array: Any, prec: str = "ns") -> np.ndarray:
+        """Returns the active count (or weight) at every timestamp (int64 in `prec` units or sequence of BaseTS)"""
+        ts = as_ns(ts_array, prec)
+        pos = np.searchsorted(self.times, ts, side="right") - 1
+        return np.where(pos >= 0, self.counts[np.maximum(pos, 0)], 0) if self.times.size else np.zeros(ts.shape, dtype=self.counts.dtype)
+
+
+def overlap_profile(intervals: Any, weights: Optional[Any] = None) -> OverlapProfile:
+    """
+    Computes how many intervals are active at every moment with an O(n log n) sweep over the start (+1) and end (-1) events.
+    Intervals are half-open here: one ending at t and another starting at t are never active together (like TSInterval.overlaps()).
+
+    :param intervals: a sequence of TSInterval, a (starts, ends) pair of int64 nanosecond arrays, an (n, 2) array or an IntervalArray
+    :param weights: optional weight of every interval (ex: the requested capacity); the profile then sums the active weights
+    """
+    starts, ends = as_ns_bounds(intervals)
+    weights = as_values(weights, starts.size)
+    if weights is None:
+        weights = np.ones(starts.size, dtype=np.int64)
+    events = np.concatenate((starts, ends))
+    deltas = np.concatenate((weights, -weights))
+    order = np.argsort(events, kind="stable")
+    events, deltas = events[order], deltas[order]
+    first = group_starts(events)
+    times = events[first]
+    net = np.add.reduceat(deltas, first) if first.size else deltas[:0]
+    # the events of the same instant (ex: back-to-back or empty intervals) may cancel out
+    changes = net != 0
+    times, counts = times[changes], np.cumsum(net[changes])
+    if counts.dtype.kind == "f" and counts.size:
+        # float sums of weights that cancel out may leave rounding residues instead of 0
+        counts[np.abs(counts) <= 4 * np.finfo(np.float64).eps * np.abs(weights).sum()] = 0.0
+        # snapping may leave steps that don't change the level (ex: 0 -> 0 over a negligible weight): merge them
+        keep = np.concatenate(([True], counts[1:] != counts[:-1]))
+        times, counts = times[keep], counts[keep]
+    if counts.size == 0:
+        return OverlapProfile(times, counts, 0, None, None)
+    peak_pos = int(np.argmax(counts))
+    if peak_pos == counts.size - 1:
+        # nothing rises above the 0 level before the first event (ex: negative weights): no bounded peak
+        return OverlapProfile(times, counts, counts[peak_pos].item(), None, None)
+    return OverlapProfile(times, counts, counts[peak_pos].item(), int(times[peak_pos]), int(times[peak_pos + 1]))
+
+
+def _allen_codes(starts1: Any, ends1: Any, starts2: Any, ends2: Any) -> np.ndarray:
+    """Vectorised ts._allen_code(): only integer comparisons, no arithmetic on the timestamps"""
+    cmp_starts = (starts1 > starts2).astype(np.int8) - (starts1 < starts2).astype(np.int8)
+    cmp_ends = (ends1 > ends2).astype(np.int8) - (ends1 < ends2).astype(np.int8)
+    # the intervals share a positive duration: the relation follows from the order of the starts and of the ends
+    sharing = 6 + 3 * cmp_starts + cmp_ends
+    return np.select([ends1 < starts2, ends1 == starts2, starts1 > ends2, starts1 == ends2], [0, 1, 12, 11], sharing).astype(np.int8)
+
+
+def allen_relations(left: Any, right: Any) -> np.ndarray:
+    """
+    Returns the Allen relation of every left interval to the right interval of the same row, as int8 codes:
+    ALLEN_RELATIONS[code] is the name returned by TSInterval.relation() and 12 - code is the code of the inverse relation.
+
+    :param left: a sequence of TSInterval, a (starts, ends) pair of int64 nanosecond arrays, an (n, 2) array,
+                 an IntervalArray or a TSIntervalSet
+    :param right: the same kinds of collections with as many intervals as left, or a single TSInterval/nsInterval
+                  related to every left interval
+    """
+    starts1, ends1 = as_ns_bounds(left)
+    if isinstance(right, nsInterval):
+        return _allen_codes(starts1, ends1, right.start_ns, right.end_ns)
+    if isinstance(right, TSInterval):
+        return _allen_codes(starts1, ends1, int(right.start.as_nsec()), int(right.end.as_nsec()))
+    starts2, ends2 = as_ns_bounds(right)
+    if starts2.size != starts1.size:
+        raise ValueError(f"left and right must have the same number of intervals: {starts1.size} != {starts2.size}")
+    return _allen_codes(starts1, ends1, starts2, ends2)
+
+
+class IntervalCoalescer:
+    """
+    Streaming coalescing of intervals for unbounded input: overlapping and adjacent intervals are merged
+    (like TSInterval.union() / overlaps_inclusive()), and so are the ones separated by at most `gap`.
+    Intervals must arrive ordered by start up to `lateness`: an interval can't start more than `lateness` before
+    the latest start seen so far. A merged interval is finalised as soon as no such interval can extend it anymore;
+    only the open ones are kept in memory.
+    """
+
+    def __init__(self, gap: Union[int, dTS, timedelta] = 0, lateness: Union[int, dTS, timedelta] = 0) -> None:
+        """
+        :param gap: merge intervals separated by at most this duration, as int nanoseconds, dTS or timedelta
+        :param lateness: how much earlier than the latest start seen an interval can start, as int nanoseconds, dTS or timedelta
+        """
+        self._gap_ns = delta_to_ns(gap)
+        self._lateness_ns = delta_to_ns(lateness)
+        if self._gap_ns < 0 or self._lateness_ns < 0:
+            raise ValueError(f"gap and lateness should not be negative: {gap}, {lateness}")
+        self._watermark: Optional[int] = None
+        # the open (disjoint, not mergeable) intervals, sorted: start/end nanoseconds and the original bounds
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._bounds: List[Tuple[BaseTS, BaseTS]] = []
+
+    @property
+    def open_intervals(self) -> int:
+        return len(self._starts)
+
+    def _pop_first(self) -> TSInterval:
+        del self._starts[0], self._ends[0]
+        return TSInterval(*self._bounds.pop(0))
+
+    def expire(self, now: Union[int, BaseTS]) -> List[TSInterval]:
+        """
+        Finalises and returns the intervals that can't be extended anymore once the stream time reaches `now`
+        (nanoseconds), i.e. when no interval starting before `now` - lateness is expected anymore.
+        """
+        now = _as_ns_scalar(now)
+        if self._watermark is None or now > self._watermark:
+            self._watermark = now
+        horizon = self._watermark - self._lateness_ns - self._gap_ns
+        finalised = []
+        while self._starts and self._ends[0] < horizon:
+            finalised.append(self._pop_first())
+        return finalised
+
+    def update(self, interval: TSInterval) -> List[TSInterval]:
+        """Adds an interval and returns the merged intervals finalised by it, in start order."""
+        start, end = interval.start, interval.end
+        start_ns, end_ns = int(start.as_nsec()), int(end.as_nsec())
+        if self._watermark is not None and start_ns < self._watermark - self._lateness_ns:
+            raise ValueError(f"Interval {interval} arrived later than the lateness bound: "
+                             f"it starts {self._watermark - start_ns}ns before the latest start seen")
+        lo = bisect_left(self._starts, start_ns)
+        if lo > 0 and self._ends[lo - 1] + self._gap_ns >= start_ns:
+            lo -= 1
+        hi = lo
+        while hi < len(self._starts) and self._starts[hi] - self._gap_ns <= end_ns:
+            hi += 1
+        if lo < hi:
+            if self._starts[lo] < start_ns:
+                start_ns, start = self._starts[lo], self._bounds[lo][0]
+            if self._ends[hi - 1] > end_ns:
+                end_ns, end = self._ends[hi - 1], self._bounds[hi - 1][1]
+        self._starts[lo:hi] = [start_ns]
+        self._ends[lo:hi] = [end_ns]
+        self._bounds[lo:hi] = [(start, end)]
+        return self.expire(interval.start)
+
+    def flush(self) -> List[TSInterval]:
+        """Finalises and returns all the open intervals, e.g. at the end of the stream."""
+        return [self._pop_first() for _ in range(len(self._starts))]
+
+
+def coalesce(intervals: Iterable[TSInterval], gap: Union[int, dTS, timedelta] = 0,
+             lateness: Union[int, dTS, timedelta] = 0) -> Iterator[TSInterval]:
+    """
+    Lazily merges a stream of intervals ordered by start (up to `lateness`), yielding every merged interval
+    as soon as it's final; see IntervalCoalescer.
+    """
+    coalescer = IntervalCoalescer(gap, lateness)
+    for interval in intervals:
+        yield from coalescer.update(interval)
+    yield from coalescer.flush()
+
+
+async def acoalesce(intervals: AsyncIterable[TSInterval], gap: Union[int, dTS, timedelta] = 0,
+                    lateness: Union[int, dTS, timedelta] = 0) -> AsyncIterator[TSInterval]:
+    """Async iterator version of coalesce(), for intervals coming from an async source (ex: a queue or a socket)"""
+    coalescer = IntervalCoalescer(gap, lateness)
+    async for interval in intervals:
+        for merged in coalescer.update(interval):
+            yield merged
+    for merged in coalescer.flush():
+        yield merged
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose: Fans the chunks of a TSInterval out to a concurrent.futures executor, with a bounded number of pending tasks
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+import os
+from collections import deque
+from concurrent.futures import Executor, Future
+from datetime import timedelta, tzinfo as dt_tzinfo
+from typing import Callable, Deque, Iterator, List, Optional, TypeVar, Union
+
+from .ts import TSInterval, dTS
+
+R = TypeVar("R")
+
+
+def iter_map_intervals(fn: Callable[[TSInterval], R], interval: TSInterval, size: Union[dTS, timedelta, float, int], executor: Executor,
+                       max_in_flight: Optional[int] = None, align: bool = True,
+                       tz: Optional[Union[dt_tzinfo, str]] = None) -> Iterator[R]:
+    """
+    Lazily yields fn(chunk) for every chunk of interval.chunks(size, align, tz), in chunk order.
+    At most `max_in_flight` chunks are submitted and not yet consumed at any time, so huge intervals
+    don't flood the executor queue nor keep all the results in memory.
+    An exception raised by fn is re-raised when its result is reached; the pending tasks are cancelled.
+
+    :param fn: function called with every chunk (must be picklable for a ProcessPoolExecutor)
+    :param max_in_flight: maximum number of pending tasks (defaults to twice the number of CPUs)
+    """
+    if max_in_flight is None:
+        max_in_flight = 2 * (os.cpu_count() or 1)
+    if max_in_flight < 1:
+        raise ValueError(f"max_in_flight should be a positive integer: {max_in_flight}")
+    pending: Deque[Future] = deque()
+    try:
+        for chunk in interval.chunks(size, align=align, tz=tz):
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+            pending.append(executor.submit(fn, chunk))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def map_intervals(fn: Callable[[TSInterval], R], interval: TSInterval, size: Union[dTS, timedelta, float, int], executor: Executor,
+                  max_in_flight: Optional[int] = None, align: bool = True, tz: Optional[Union[dt_tzinfo, str]] = None) -> List[R]:
+    """
+    Splits the interval with interval.chunks(size, align, tz), runs fn on every chunk through the executor and
+    returns the results in chunk order; see iter_map_intervals() for the bounded scheduling.
+
+    :param fn: function called with every chunk (must be picklable for a ProcessPoolExecutor)
+    :param interval: the interval to split, ex: a backfill range
+    :param size: chunk size as dTS, timedelta or number of seconds
+    :param executor: ThreadPoolExecutor, ProcessPoolExecutor or any concurrent.futures.Executor
+    :param max_in_flight: maximum number of pending tasks (defaults to twice the number of CPUs)
+    """
+    return list(iter_map_intervals(fn, interval, size, executor, max_in_flight=max_in_flight, align=align, tz=tz))
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose: Quality report of timestamp columns: monotonicity, gaps, duplicates and sampling jitter
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+from datetime import timedelta
+from typing import Any, List, NamedTuple, Optional, Union
+
+import numpy as np
+
+from ._columns import as_ns, delta_to_ns
+from .ts import TSInterval, dTS, iTSns
+
+
+class TSProfile(NamedTuple):
+    """Statistics of a timestamp column, see profile(); all durations are in nanoseconds"""
+    n_rows: int
+    first: Optional[int]
+    last: Optional[int]
+    is_sorted: bool
+    out_of_order: int
+    duplicates: int
+    period_ns: Optional[int]
+    jitter_ns: Optional[int]
+    gap_threshold_ns: Optional[int]
+    gaps: List[TSInterval]
+
+
+def profile(ts_array: Any, expected_period: Optional[Union[int, dTS, timedelta]] = None,
+            gap_threshold: Optional[Union[int, dTS, timedelta]] = None, prec: str = "ns") -> TSProfile:
+    """
+    Validates a timestamp column in one vectorised pass over its consecutive differences.
+
+    - out_of_order: number of rows with a timestamp lower than the previous row
+    - duplicates: number of rows repeating a timestamp already present in the column
+    - period_ns: nominal sampling period; `expected_period` if given, otherwise the median of the positive differences
+    - jitter_ns: median absolute deviation of the positive differences from the period
+    - gaps: the holes between consecutive (sorted) timestamps larger than `gap_threshold`
+      (defaults to twice the period), as TSInterval(iTSns, iTSns)
+
+    :param ts_array: timestamps (int64 in `prec` units or sequence of BaseTS)
+    :param expected_period: the nominal sampling period (int nanoseconds, dTS or timedelta), if known
+    :param gap_threshold: the minimal hole reported as gap (int nanoseconds, dTS or timedelta)
+    :param prec: units of ts_array if given as plain integers
+    """
+    ts = as_ns(ts_array, prec)
+    n = ts.size
+    if n == 0:
+        return TSProfile(0, None, None, True, 0, 0, None, None, None, [])
+    diffs = np.diff(ts)
+    out_of_order = int(np.count_nonzero(diffs < 0))
+    if out_of_order:
+        ts = np.sort(ts)
+        diffs = np.diff(ts)
+    duplicates = int(np.count_nonzero(diffs == 0))
+    positive = diffs[diffs > 0]
+
+    period: Optional[int]
+    if expected_period is not None:
+        period = delta_to_ns(expected_period)
+        if period <= 0:
+            raise ValueError(f"Expected period should be a positive duration: {expected_period}")
+    else:
+        period = int(np.median(positive)) if positive.size else None
+    jitter = int(np.median(np.abs(positive - period))) if positive.size and period is not None else None
+
+    threshold = delta_to_ns(gap_threshold) if gap_threshold is not None else (2 * period if period is not None else None)
+    gaps: List[TSInterval] = []
+    if threshold is not None:
+        gap_idx = np.flatnonzero(diffs > threshold)
+        gaps = [TSInterval(iTSns(int(ts[i])), iTSns(int(ts[i + 1]))) for i in gap_idx]
+    return TSProfile(
+        n_rows=n,
+        first=int(ts[0]),
+        last=int(ts[-1]),
+        is_sorted=out_of_order == 0,
+        out_of_order=out_of_order,
+        duplicates=duplicates,
+        period_ns=period,
+        jitter_ns=jitter,
+        gap_threshold_ns=threshold,
+        gaps=gaps,
+    )
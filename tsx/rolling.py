@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose: Time based (not row based) rolling window aggregations over sorted timestamp arrays
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+from collections import deque
+from datetime import timedelta
+from typing import Any, Deque, Dict, List, Literal, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ._columns import as_int64, as_values, is_sorted, delta_to_ns
+from .ts import BaseTS, dTS
+
+ROLLING_AGGS = ("count", "sum", "mean", "min", "max")
+Closed = Literal["right", "left", "both", "neither"]
+
+
+def _window_bounds(ts: np.ndarray, window_ns: int, closed: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the [lo, hi) row positions of the window ending at every event.
+    The upper bound is positional for the "right"/"both" closings (rows after the current one are never included,
+    even if they have the same timestamp), while "left"/"neither" exclude every row with the current timestamp.
+    """
+    if closed in ("right", "both"):
+        hi = np.arange(1, ts.size + 1)
+    elif closed in ("left", "neither"):
+        hi = np.searchsorted(ts, ts, side="left")
+    else:
+        raise ValueError(f"Invalid closed={closed!r}. Expected one of 'right', 'left', 'both', 'neither'")
+    lo_side: Literal["left", "right"] = "left" if closed in ("left", "both") else "right"
+    lo = np.searchsorted(ts, ts - window_ns, side=lo_side)
+    return lo, np.maximum(hi, lo)
+
+
+def _range_reduce(ufunc: np.ufunc, values: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """
+    Reduces values[lo:hi] for every pair of bounds with a sparse table, i.e. O(n log w) for a longest window of w rows.
+    Empty ranges produce NaN.
+    """
+    lengths = hi - lo
+    out = np.full(lo.shape, np.nan)
+    non_empty = lengths > 0
+    if not non_empty.any():
+        return out
+    levels = [values]
+    max_len = int(lengths.max())
+    while (1 << len(levels)) <= max_len:
+        prev, half = levels[-1], 1 << (len(levels) - 1)
+        levels.append(ufunc(prev[:-half], prev[half:]))
+    level_idx = np.zeros(lengths.shape, dtype=np.intp)
+    level_idx[non_empty] = np.log2(lengths[non_empty]).astype(np.intp)
+    for level in range(len(levels)):
+        mask = non_empty & (level_idx == level)
+        if mask.any():
+            table = levels[level]
+            out[mask] = ufunc(table[lo[mask]], table[hi[mask] - (1 << level)])
+    return out
+
+
+def _window_sums(values: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """
+    Returns the sums of values[lo:hi] for every pair of bounds in O(n).
+    Integers use one global cumsum, which is exact. A global cumsum of floats would make the rounding error of every window
+    relative to the whole prefix, so floats use prefix and suffix sums restarted on blocks as long as the longest window:
+    a window spanning two blocks is a suffix plus a prefix of its own values, and one inside a block only adds and removes
+    the values of that block on the shorter side.
+    """
+    acc_dtype = np.result_type(values.dtype, np.int64)
+    if acc_dtype.kind not in "fc":
+        cum = np.concatenate((np.zeros(1, dtype=acc_dtype), np.cumsum(values)))
+        return cum[hi] - cum[lo]
+    block = max(int((hi - lo).max(initial=0)), 1)
+    n_blocks = values.size // block + 1
+    # hi == values.size falls in the last block, which is only padding
+    padded = np.zeros((n_blocks, block), dtype=acc_dtype)
+    padded.reshape(-1)[:values.size] = values
+    prefix = np.zeros((n_blocks, block + 1), dtype=acc_dtype)
+    np.cumsum(padded, axis=1, out=prefix[:, 1:])
+    suffix = np.zeros((n_blocks, block + 1), dtype=acc_dtype)
+    np.cumsum(padded[:, ::-1], axis=1, out=suffix[:, -2::-1])
+    lo_block, lo_pos, hi_block, hi_pos = lo // block, lo % block, hi // block, hi % block
+    from_prefix = prefix[hi_block, hi_pos] - prefix[lo_block, lo_pos]
+    from_suffix = suffix[lo_block, lo_pos] - suffix[hi_block, hi_pos]
+    spanning = suffix[lo_block, lo_pos] + prefix[hi_block, hi_pos]
+    return np.where(hi_block != lo_block, spanning, np.where(lo_pos <= block - hi_pos, from_prefix, from_suffix))
+
+
+def rolling(ts_array: Any, values: Any, window: Union[int, dTS, timedelta],
+            aggs: Sequence[str] = ("count", "sum", "mean"), closed: Closed = "right") -> Dict[str, np.ndarray]:
+    """
+    Computes time based rolling aggregations: for every event, the aggregates of the values whose timestamps fall
+    in the trailing window of length `window` ending at the event time.
+
+    :param ts_array: sorted int64 nanosecond timestamps (or sequence of iTSns)
+    :param values: values of the same length as ts_array
+    :param window: window length as int nanoseconds, dTS or timedelta
+    :param aggs: any of "count", "sum", "mean", "min", "max"
+    :param closed: "right" -> (t - window, t], "left" -> [t - window, t), "both" -> [t - window, t], "neither" -> (t - window, t)
+    :return: dict mapping every aggregation to an array with one value per event; empty windows give 0 count and NaN mean/min/max
+    """
+    ts = as_int64(ts_array)
+    vals = as_values(values, ts.size)
+    window_ns = delta_to_ns(window)
+    if window_ns <= 0:
+        raise ValueError(f"Window should be a positive duration: {window}")
+    for agg in aggs:
+        if agg not in ROLLING_AGGS:
+            raise ValueError(f"Unsupported aggregation {agg!r}. Supported: {ROLLING_AGGS}")
+    if not is_sorted(ts):
+        raise ValueError("Timestamps must be sorted in non-decreasing order")
+    lo, hi = _window_bounds(ts, window_ns, closed)
+    res: Dict[str, np.ndarray] = {}
+    counts = hi - lo
+    if "sum" in aggs or "mean" in aggs:
+        sums = _window_sums(vals, lo, hi)
+    for agg in aggs:
+        if agg == "count":
+            res[agg] = counts
+        elif agg == "sum":
+            res[agg] = sums
+        elif agg == "mean":
+            res[agg] = np.divide(sums, counts, out=np.full(counts.shape, np.nan), where=counts > 0)
+        elif agg == "min":
+            res[agg] = _range_reduce(np.minimum, vals, lo, hi)
+        elif agg == "max":
+            res[agg] = _range_reduce(np.maximum, vals, lo, hi)
+    return res
+
+
+class RollingWindow:
+    """
+    Streaming counterpart of `rolling()` for live feeds.
+    Memory is bounded by the number of events inside the window; min/max are maintained with monotonic deques.
+    The running sum is recomputed from the window content once as many events were evicted as the window holds,
+    so the rounding errors of float additions and removals don't accumulate over the stream (amortized O(1) per event).
+    """
+
+    def __init__(self, window: Union[int, dTS, timedelta], closed: Closed = "right") -> None:
+        """
+        :param window: window length as int nanoseconds, dTS or timedelta
+        :param closed: same as for `rolling()`
+        """
+        self._window_ns = delta_to_ns(window)
+        if self._window_ns <= 0:
+            raise ValueError(f"Window should be a positive duration: {window}")
+        if closed not in ("right", "left", "both", "neither"):
+            raise ValueError(f"Invalid closed={closed!r}. Expected one of 'right', 'left', 'both', 'neither'")
+        self._include_current = closed in ("right", "both")
+        self._include_start = closed in ("left", "both")
+        self._events: Deque[Tuple[int, float]] = deque()
+        self._min: Deque[Tuple[int, float]] = deque()
+        self._max: Deque[Tuple[int, float]] = deque()
+        self._sum: float = 0
+        self._evicted = 0
+        # events having the latest timestamp are kept apart, as "left"/"neither" windows exclude them
+        self._pending_ts: Optional[int] = None
+        self._pending: List[float] = []
+        self._pending_sum: float = 0
+        # only meaningful while there are pending events
+        self._pending_min: float = 0
+        self._pending_max: float = 0
+
+    def __len__(self) -> int:
+        return len(self._events) + len(self._pending)
+
+    def _push(self, ts: int, value: float) -> None:
+        self._events.append((ts, value))
+        self._sum += value
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((ts, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((ts, value))
+
+    def _is_expired(self, ts: int, start: int) -> bool:
+        return ts < start or (ts == start and not self._include_start)
+
+    def _evict(self, now: int) -> None:
+        start = now - self._window_ns
+        for events in (self._min, self._max):
+            while events and self._is_expired(events[0][0], start):
+                events.popleft()
+        while self._events and self._is_expired(self._events[0][0], start):
+            self._sum -= self._events.popleft()[1]
+            self._evicted += 1
+        if self._evicted > len(self._events):
+            self._sum = sum(value for _, value in self._events)
+            self._evicted = 0
+
+    def update(self, ts: Union[int, BaseTS], value: float) -> Dict[str, float]:
+        """
+        Adds an event and returns the aggregates ("count", "sum", "mean", "min", "max") of the window ending at it.
+
+        :param ts: event time as BaseTS or int nanoseconds; events must arrive in non-decreasing time order
+        """
+        if isinstance(ts, BaseTS):
+            ts = ts.as_nsec()
+        ts = int(ts)
+        if self._pending_ts is not None and ts != self._pending_ts:
+            if ts < self._pending_ts:
+                raise ValueError(f"Events must arrive in non-decreasing time order: {ts} < {self._pending_ts}")
+            for pending_value in self._pending:
+                self._push(self._pending_ts, pending_value)
+            self._pending.clear()
+            self._pending_sum = 0
+        if not self._pending:
+            self._pending_min = self._pending_max = value
+        self._pending_ts = ts
+        self._pending.append(value)
+        self._pending_sum += value
+        self._pending_min = min(self._pending_min, value)
+        self._pending_max = max(self._pending_max, value)
+        self._evict(ts)
+
+        count, total = len(self._events), self._sum
+        mins = [self._min[0][1]] if self._min else []
+        maxs = [self._max[0][1]] if self._max else []
+        if self._include_current:
+            count += len(self._pending)
+            total += self._pending_sum
+            mins.append(self._pending_min)
+            maxs.append(self._pending_max)
+        return {
+            "count": count,
+            "sum": total,
+            "mean": total / count if count else np.nan,
+            "min": min(mins) if mins else np.nan,
+            "max": max(maxs) if maxs else np.nan,
+        }
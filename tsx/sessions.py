@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose: Event-time sessionization by inactivity gap
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from ._columns import as_ns, delta_to_ns
+from .ts import BaseTS, TSInterval, dTS, iTSns
+
+
+class Sessions(NamedTuple):
+    """
+    Result of sessionize(): `ids` holds the session id of every input row (in input order),
+    the other columns have one entry per session, ordered by (key, start).
+    """
+    ids: np.ndarray
+    key: Optional[np.ndarray]
+    start: np.ndarray
+    end: np.ndarray
+    n_events: np.ndarray
+
+    def to_intervals(self) -> List[TSInterval]:
+        """
+        Returns the sessions as TSInterval(start, last event + 1ns), so single-event sessions are valid intervals too.
+        """
+        return [TSInterval(iTSns(int(start)), iTSns(int(end) + 1)) for start, end in zip(self.start, self.end)]
+
+
+class Session(NamedTuple):
+    """A session closed by the streaming Sessionizer; start/end are the first/last event times in nanoseconds"""
+    id: int
+    key: Hashable
+    start: int
+    end: int
+    n_events: int
+
+
+def _gap_ns(gap: Union[int, dTS, timedelta]) -> int:
+    gap_ns = delta_to_ns(gap)
+    if gap_ns < 0:
+        raise ValueError(f"Gap should not be negative: {gap}")
+    return gap_ns
+
+
+def _key_codes(by: Any, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the keys as an array along with sortable integer codes, ordered like the keys when they are comparable.
+    Keys of mixed types (ex: str and int), which can't be sorted, are numbered by first appearance instead.
+    """
+    if not isinstance(by, np.ndarray) and len({type(key) for key in by}) > 1:
+        # np.asarray() would turn ["a", 1] into strings and merge the keys 1 and "1"
+        keys = np.fromiter(by, dtype=object, count=len(by))
+    else:
+        keys = np.asarray(by)
+    if keys.shape != (n,):
+        raise ValueError(f"by must have one key per event ({n}), got shape {keys.shape}")
+    if keys.dtype != object:
+        return keys, keys
+    try:
+        codes = np.unique(keys, return_inverse=True)[1]
+    except TypeError:
+        first_seen: Dict[Hashable, int] = {}
+        codes = np.fromiter((first_seen.setdefault(key, len(first_seen)) for key in keys), dtype=np.int64, count=n)
+    return keys, codes
+
+
+def sessionize(ts_array: Any, gap: Union[int, dTS, timedelta], by: Optional[Any] = None, prec: str = "ns") -> Sessions:
+    """
+    Splits events into sessions: a new session starts when the time since the previous event (of the same key) is larger than `gap`.
+
+    :param ts_array: event timestamps (any order; int64 in `prec` units or sequence of BaseTS)
+    :param gap: maximum inactivity inside a session, as int nanoseconds, dTS or timedelta
+    :param by: optional keys (ex: user ids), one per event; sessions are computed independently for every key.
+        Keys of mixed types (ex: str and int) are supported; their sessions are ordered by first appearance of the key
+    :param prec: units of ts_array if given as plain integers
+    """
+    gap_ns = _gap_ns(gap)
+    ts = as_ns(ts_array, prec)
+    n = ts.size
+    keys = None
+    if by is not None:
+        keys, codes = _key_codes(by, n)
+        order = np.lexsort((ts, codes))
+    else:
+        order = np.argsort(ts, kind="stable")
+    sorted_ts = ts[order]
+
+    new_session = np.ones(n, dtype=bool)
+    new_session[1:] = np.diff(sorted_ts) > gap_ns
+    if keys is not None:
+        sorted_keys = keys[order]
+        new_session[1:] |= sorted_keys[1:] != sorted_keys[:-1]
+    starts = np.flatnonzero(new_session)
+    last = np.append(starts[1:], n)[:starts.size] - 1
+
+    ids = np.empty(n, dtype=np.int64)
+    ids[order] = np.cumsum(new_session) - 1
+    return Sessions(
+        ids=ids,
+        key=sorted_keys[starts] if keys is not None else None,
+        start=sorted_ts[starts],
+        end=sorted_ts[last],
+        n_events=last - starts + 1,
+    )
+
+
+class Sessionizer:
+    """
+    Streaming sessionization for unbounded input.
+    Events must arrive in non-decreasing time order; only the open sessions are kept in memory,
+    and a session is closed as soon as the stream time moves more than `gap` past its last event.
+    """
+
+    def __init__(self, gap: Union[int, dTS, timedelta]) -> None:
+        """
+        :param gap: maximum inactivity inside a session, as int nanoseconds, dTS or timedelta
+        """
+        self._gap_ns = _gap_ns(gap)
+        self._next_id = 0
+        self._now: Optional[int] = None
+        # key -> [id, start, end, n_events], ordered by the last event time
+        self._open: "OrderedDict[Hashable, list]" = OrderedDict()
+
+    @property
+    def open_sessions(self) -> int:
+        return len(self._open)
+
+    def _close(self, key: Hashable) -> Session:
+        session_id, start, end, n_events = self._open.pop(key)
+        return Session(session_id, key, start, end, n_events)
+
+    def expire(self, now: Union[int, BaseTS]) -> List[Session]:
+        """Closes and returns the sessions that can't be extended anymore at stream time `now` (nanoseconds)."""
+        if isinstance(now, BaseTS):
+            now = now.as_nsec()
+        now = int(now)
+        closed = []
+        while self._open:
+            key, state = next(iter(self._open.items()))
+            if now - state[2] <= self._gap_ns:
+                break
+            closed.append(self._close(key))
+        return closed
+
+    def update(self, ts: Union[int, BaseTS], key: Hashable = None) -> Tuple[int, List[Session]]:
+        """
+        Adds an event and returns its session id, along with the sessions closed since the previous event.
+
+        :param ts: event time as BaseTS or int nanoseconds
+        :param key: optional session key (ex: user id)
+        """
+        if isinstance(ts, BaseTS):
+            ts = ts.as_nsec()
+        ts = int(ts)
+        if self._now is not None and ts < self._now:
+            raise ValueError(f"Events must arrive in non-decreasing time order: {ts} < {self._now}")
+        self._now = ts
+        closed = self.expire(ts)
+        state = self._open.get(key)
+        if state is None:
+            state = self._open[key] = [self._next_id, ts, ts, 0]
+            self._next_id += 1
+        else:
+            self._open.move_to_end(key)
+        state[2] = ts
+        state[3] += 1
+        return state[0], closed
+
+    def flush(self) -> List[Session]:
+        """Closes and returns all the open sessions, e.g. at the end of the stream."""
+        return [self._close(key) for key in list(self._open)]
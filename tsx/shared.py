@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Author: ASU --<andrei.suiu@gmail.com>
+# Purpose: Timestamp columns shared between processes through multiprocessing.shared_memory, without pickling or copying
+# Created: 10/19/2026
+
+__author__ = "ASU"
+
+import struct
+import sys
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import Any, Callable, Optional, Set, Tuple, Type
+
+import numpy as np
+
+from ._columns import as_int64, is_sorted
+from .arrays import UNITS_IN_SEC, Prec, _check_prec
+from .ts import TSInterval, _div_round
+
+# magic, precision, sorted flag, length; the int64 data follows right after the 32 bytes header
+_HEADER = struct.Struct("<8s8sqq")
+_MAGIC = b"TSXCOL01"
+# names of the blocks created by this process (or by the parent it was forked from) and not unlinked yet
+_OWNED_NAMES: Set[str] = set()
+
+
+def _open_shm(name: str) -> SharedMemory:
+    """
+    Attaches to an existing block without registering it with the resource tracker of this process,
+    otherwise the tracker would unlink the block (owned by another process) when this process exits.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    # before 3.13 the registration can't be disabled, so it's undone right after attaching.
+    # Blocks created here are already registered by the owner with the same tracker; unregistering them would drop that entry
+    shm = SharedMemory(name=name)
+    if shm.name not in _OWNED_NAMES:
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return shm
+
+
+def _buf(shm: SharedMemory) -> memoryview:
+    buf = shm.buf
+    if buf is None:
+        raise ValueError(f"Shared memory block {shm.name!r} is closed")
+    return buf
+
+
+class SharedTSColumn:
+    """
+    A read-only int64 timestamp column living in shared memory, created by share_ts_column() or attach_ts_column().
+    Pickling a SharedTSColumn (ex: as an argument of a Pool task) only sends its name; the receiver attaches to the same block.
+
+    Lifecycle: every process calls close() when done with the column (or uses it as a context manager),
+    and the owner (the process that called share_ts_column()) also calls unlink() to free the memory.
+    Views returned by `array` must be released before close().
+    """
+
+    def __init__(self, shm: SharedMemory, owner: bool) -> None:
+        buf = _buf(shm)
+        magic, prec, is_sorted_flag, length = _HEADER.unpack_from(buf)
+        if magic != _MAGIC:
+            shm.close()
+            raise ValueError(f"Shared memory block {shm.name!r} doesn't hold a timestamp column")
+        self._shm = shm
+        self._closed = False
+        self._owner = owner
+        self._prec = prec.rstrip(b"\0").decode()
+        self._is_sorted = bool(is_sorted_flag)
+        self._array = np.ndarray((length,), dtype=np.int64, buffer=buf, offset=_HEADER.size)
+        self._array.flags.writeable = False
+
+    def __reduce__(self) -> Tuple[Callable[[str], "SharedTSColumn"], Tuple[str]]:
+        return attach_ts_column, (self.name,)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name!r}, prec={self._prec!r}, size={len(self)})"
+
+    def __len__(self) -> int:
+        return self._array.size
+
+    def __enter__(self) -> "SharedTSColumn":
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc: Optional[BaseException], tb: Optional[TracebackType]) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory block, to be passed to attach_ts_column()"""
+        return self._shm.name
+
+    @property
+    def prec(self) -> str:
+        """The units of the timestamps: "s", "ms", "us" or "ns" """
+        return self._prec
+
+    @property
+    def is_sorted(self) -> bool:
+        return self._is_sorted
+
+    @property
+    def array(self) -> np.ndarray:
+        """Read-only int64 view on the shared timestamps (no copy)"""
+        if self._closed:
+            raise ValueError("The shared timestamp column is closed")
+        return self._array
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def bounds(self, interval: TSInterval) -> Tuple[int, int]:
+        """
+        Returns the interval bounds in the column units: the first unit >= interval.start and the last unit <= interval.end.
+        """
+        nanos_per_unit = UNITS_IN_SEC["ns"] // UNITS_IN_SEC[self._prec]
+        start_ns, end_ns = int(interval.start.as_nsec()), int(interval.end.as_nsec())
+        return _div_round(start_ns, nanos_per_unit, "ceil"), _div_round(end_ns, nanos_per_unit, "floor")
+
+    def range_indices(self, interval: TSInterval) -> Tuple[int, int]:
+        """
+        Returns the [lo, hi) row positions of the timestamps inside the interval (inclusive on both ends, like TSInterval.contains()),
+        found by binary search on the shared array.
+        """
+        if not self._is_sorted:
+            raise ValueError("Range queries need a sorted timestamp column")
+        start, end = self.bounds(interval)
+        arr = self.array
+        return int(np.searchsorted(arr, start, side="left")), int(np.searchsorted(arr, end, side="right"))
+
+    def slice(self, interval: TSInterval) -> np.ndarray:
+        """Returns a read-only view (no copy) of the timestamps inside the interval, see range_indices()."""
+        lo, hi = self.range_indices(interval)
+        return self.array[lo:hi]
+
+    def close(self) -> None:
+        """Detaches this process from the block; it's safe to call it multiple times."""
+        if self._closed:
+            return
+        self._closed = True
+        self._array = np.empty(0, dtype=np.int64)
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Frees the shared memory block; call it once, from the owner, after the workers are done."""
+        if not self._owner:
+            raise ValueError("Only the process that shared the column can unlink it")
+        self._owner = False
+        _OWNED_NAMES.discard(self._shm.name)
+        self._shm.unlink()
+
+
+def share_ts_column(ts_array: Any, prec: Prec = "ns", name: Optional[str] = None) -> SharedTSColumn:
+    """
+    Copies the timestamps once into a new shared memory block and returns the owning SharedTSColumn.
+    Other processes get read-only, zero-copy access with attach_ts_column(column.name) or by receiving the pickled column.
+
+    :param ts_array: int64 timestamps (or sequence of ints / iBaseTS) in `prec` units
+    :param prec: the units of the timestamps, stored along with the data
+    :param name: optional name of the block; a unique name is generated if not given
+    """
+    _check_prec(prec)
+    arr = as_int64(ts_array)
+    shm = SharedMemory(name=name, create=True, size=_HEADER.size + max(arr.nbytes, 1))
+    _OWNED_NAMES.add(shm.name)
+    buf = _buf(shm)
+    _HEADER.pack_into(buf, 0, _MAGIC, prec.encode(), int(is_sorted(arr)), arr.size)
+    np.ndarray(arr.shape, dtype=np.int64, buffer=buf, offset=_HEADER.size)[:] = arr
+    return SharedTSColumn(shm, owner=True)
+
+
+def attach_ts_column(name: str) -> SharedTSColumn:
+    """
+    Attaches to a column shared by share_ts_column(); the returned column is read-only and doesn't own the block.
+
+    :param name: the name of the shared block (SharedTSColumn.name)
+    """
+    return SharedTSColumn(_open_shm(name), owner=False)
@@ -15,7 +15,7 @@ from datetime import datetime, timezone, timedelta, date, time, tzinfo as dt_tzi
 from functools import total_ordering
 from numbers import Integral, Real, Number
 from time import time_ns
-from typing import Union, Optional, Tuple, Any, Type
+from typing import Union, Optional, Tuple, Any, Type, Iterator, Callable, List
 
 try:
     from typing import Self, Literal, override
@@ -52,6 +52,39 @@ AVG_DAYS_PER_YEAR = 365.25  # Average considering leap years
 EPOCH_DT = datetime(1970, 1, 1)
 EPOCH_DT_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
 SUBSEC_TS_RE = re.compile(r"^(.+\d)\.(\d{1,9})([^0-9].*)?$")
+ROUNDING_MODES = ("half_up", "half_even", "floor", "ceil")
+Rounding = Literal["half_up", "half_even", "floor", "ceil"]
+
+
+def _check_rounding(rounding: str) -> None:
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Invalid rounding mode: {rounding!r}. Expected one of {ROUNDING_MODES}")
+
+
+def _div_round(value: int, divisor: int, rounding: Rounding) -> int:
+    """
+    Integer division with explicit rounding; half_up rounds halves towards +infinity.
+    """
+    if rounding == "floor":
+        return value // divisor
+    if rounding == "ceil":
+        return -(-value // divisor)
+    q, r = divmod(value, divisor)
+    if rounding == "half_up":
+        return q + 1 if 2 * r >= divisor else q
+    _check_rounding(rounding)
+    return q + 1 if 2 * r > divisor or (2 * r == divisor and q % 2 == 1) else q
+
+
+def _float_round(value: float, rounding: Rounding) -> int:
+    if rounding == "floor":
+        return math.floor(value)
+    if rounding == "ceil":
+        return math.ceil(value)
+    if rounding == "half_up":
+        return math.floor(value + 0.5)
+    _check_rounding(rounding)
+    return round(value)
 
 
 class dTS:
@@ -92,7 +125,7 @@ class dTS:
         delta_ns = round(delta * cls.NS_BY_UNIT[unit])
         return delta_ns, 0
 
-    def __init__(self, delta: Union[str, Number, timedelta], unit: Optional[Literal['Y', 'M', 'w', 'd', 'h', 'm', 's', 'ms', 'us', 'ns']] = None) -> None:
+    def __init__(self, delta: Union[str, int, float, Number, timedelta], unit: Optional[Literal['Y', 'M', 'w', 'd', 'h', 'm', 's', 'ms', 'us', 'ns']] = None) -> None:
         """
         :param delta: the delta in the specified unit
         :param unit: (default: sec) the unit of the delta, if it's not specified, it will be parsed from the delta string
@@ -186,7 +219,6 @@ class dTS:
         return self._add(other)
 
 
-@total_ordering
 class BaseTS(ABC, metaclass=ABCMeta):
     @classmethod
     def __get_validators__(cls):
@@ -485,29 +517,47 @@ class BaseTS(ABC, metaclass=ABCMeta):
         zulu_designator = "Z" if use_zulu else ""
         return dt.strftime(f"%Y%m%d{sep}%H%M%S{zulu_designator}")
 
-    def as_sec(self) -> "iTS":
+    def _to_units(self, units_in_sec: int, rounding: Rounding) -> int:
+        """
+        Returns the timestamp as an integer number of units (units_in_sec per second), rounded with the given mode.
+        """
+        return _float_round(float(self.timestamp()) * units_in_sec, rounding)
+
+    def as_sec(self, rounding: Optional[Rounding] = None) -> "iTS":
         """
         Converts to iTS (integer timestamp in seconds)
         Note: it will round the timestamp to seconds
+
+        :param rounding: None (default, round half to even through float seconds) or one of "half_up", "half_even", "floor", "ceil"
         """
-        return iTS(round(self.timestamp()))
+        if rounding is None:
+            return iTS(round(self.timestamp()))
+        return iTS(self._to_units(1, rounding))
 
-    def as_msec(self) -> "iTSms":
+    def as_msec(self, rounding: Optional[Rounding] = None) -> "iTSms":
         """
         Converts to iTSms (integer timestamp in milliseconds).
         Note: it will round the timestamp to milliseconds
+
+        :param rounding: None (default, round half to even through float seconds) or one of "half_up", "half_even", "floor", "ceil"
         """
-        return iTSms(round(self.timestamp() * 1000))
+        if rounding is None:
+            return iTSms(round(self.timestamp() * 1000))
+        return iTSms(self._to_units(1_000, rounding))
 
-    def as_usec(self) -> "iTSus":
+    def as_usec(self, rounding: Optional[Rounding] = None) -> "iTSus":
         """
         Converts to iTSus (integer timestamp in microseconds)
         Note: it will round the timestamp to microseconds
+
+        :param rounding: None (default, round half to even through float seconds) or one of "half_up", "half_even", "floor", "ceil"
         """
-        return iTSus(round(self.timestamp() * 1_000_000))
+        if rounding is None:
+            return iTSus(round(self.timestamp() * 1_000_000))
+        return iTSus(self._to_units(1_000_000, rounding))
 
     @abstractmethod
-    def as_nsec(self) -> "iTSns":
+    def as_nsec(self, rounding: Optional[Rounding] = None) -> "iTSns":
         """
         Converts to iTSns (integer timestamp in nanoseconds)
         Note: it will round the timestamp to nanoseconds
@@ -561,10 +611,17 @@ class BaseTS(ABC, metaclass=ABCMeta):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.isoformat()!r})"
 
+    def _ns(self) -> int:
+        """
+        Returns the timestamp as a plain int of nanoseconds, equal to as_nsec() but without building intermediate objects.
+        Comparisons and hashing use it, so timestamps of different classes compare and hash consistently.
+        """
+        return int.__int__(self.as_nsec())
+
     def __eq__(self, o: object) -> bool:
         if isinstance(o, BaseTS):
             # we assume microsecond precision for TS since the float doesn't have enough precision for more
-            return int.__eq__(self.as_nsec(), o.as_nsec())
+            return self._ns() == o._ns()
         if isinstance(o, Number):
             return abs(float(self) - o) < 1e-6
         return False
@@ -574,16 +631,31 @@ class BaseTS(ABC, metaclass=ABCMeta):
 
     def __lt__(self, o: object) -> bool:
         if isinstance(o, BaseTS):
-            return int.__lt__(self.as_nsec(), o.as_nsec())
+            return self._ns() < o._ns()
         return False
 
+    # with operands that aren't timestamps, <=, > and >= follow from < and == (the functools.total_ordering rules)
+    def __le__(self, o: object) -> bool:
+        if isinstance(o, BaseTS):
+            return self._ns() <= o._ns()
+        return self.__lt__(o) or self == o
+
+    def __gt__(self, o: object) -> bool:
+        if isinstance(o, BaseTS):
+            return self._ns() > o._ns()
+        return not self.__lt__(o) and self != o
+
+    def __ge__(self, o: object) -> bool:
+        if isinstance(o, BaseTS):
+            return self._ns() >= o._ns()
+        return not self.__lt__(o)
+
     def __hash__(self) -> int:
         """
-        We compute the seconds and nanoseconds as separate ints, make their sum and hash over this sum,
-        in this way we avoid the hash collisions for the same timestamp with different precisions
+        The hash of the timestamp in nanoseconds,
+        in this way the same timestamp with different precisions has the same hash (consistent with __eq__)
         """
-        nsec = self.as_nsec()
-        return int.__hash__(nsec)
+        return hash(self._ns())
 
 
 class TS(BaseTS, float):
@@ -700,19 +772,24 @@ class TS(BaseTS, float):
         return iTS(self)
 
     @override
-    def as_nsec(self) -> "iTSns":
+    def as_nsec(self, rounding: Optional[Rounding] = None) -> "iTSns":
         """
         We limit the TS precision to usec, since float doesn't have enough precision for nanoseconds
+
+        :param rounding: the rounding mode used to get the microseconds, see as_usec()
         """
-        return iTSns(self.as_usec() * 1_000)
+        return iTSns(self.as_usec(rounding) * 1_000)
 
-    def to_sec(self) -> "iTS":
+    def to_sec(self, rounding: Optional[Rounding] = None) -> "iTS":
         """
         Represents Unix timestamp in seconds since Epoch
 
-        ToDo: this is a temporary replacement of as_sec
+        ToDo: this is a temporary replacement of as_sec, which is still a property on TS and can't take a rounding mode
+        :param rounding: None (default, same as iTS(ts)) or one of "half_up", "half_even", "floor", "ceil"
         """
-        return iTS(self)
+        if rounding is None:
+            return iTS(self)
+        return iTS(self._to_units(1, rounding))
 
     def floor(self, unit: float) -> "TS":
         """
@@ -791,13 +868,42 @@ class TS(BaseTS, float):
             return TS(x.total_seconds() - float(self))
         return TS(float.__rsub__(self, x))
 
+    def _ns(self) -> int:
+        """Same value as as_nsec() (microseconds precision), computed on the float"""
+        return round(float.__float__(self) * 1_000_000) * 1_000
+
+    # timestamps of the same class are compared on their microseconds, the others through their int nanoseconds
     def __lt__(self, o: object) -> bool:
+        if type(o) is TS:
+            return round(float.__float__(self) * 1_000_000) < round(float.__float__(o) * 1_000_000)
         if isinstance(o, BaseTS):
-            return int.__lt__(self.as_nsec(), o.as_nsec())
+            return self._ns() < o._ns()
         if isinstance(o, Number):
             return float.__lt__(self, float(o))
         return False
 
+    def __le__(self, o: object) -> bool:
+        if type(o) is TS:
+            return round(float.__float__(self) * 1_000_000) <= round(float.__float__(o) * 1_000_000)
+        return BaseTS.__le__(self, o)
+
+    def __gt__(self, o: object) -> bool:
+        if type(o) is TS:
+            return round(float.__float__(self) * 1_000_000) > round(float.__float__(o) * 1_000_000)
+        return BaseTS.__gt__(self, o)
+
+    def __ge__(self, o: object) -> bool:
+        if type(o) is TS:
+            return round(float.__float__(self) * 1_000_000) >= round(float.__float__(o) * 1_000_000)
+        return BaseTS.__ge__(self, o)
+
+    def __eq__(self, o: object) -> bool:
+        if type(o) is TS:
+            return round(float.__float__(self) * 1_000_000) == round(float.__float__(o) * 1_000_000)
+        return BaseTS.__eq__(self, o)
+
+    __hash__ = BaseTS.__hash__
+
 
 class TSMsec(TS):
     def __new__(cls, ts: Union[int, float, str], prec: Literal["s", "ms"] = "ms"):
@@ -811,6 +917,61 @@ class TSMsec(TS):
         return cls(dt)
 
 
+def _ts_from_ns(ts_cls: Type["BaseTS"], ns: int) -> "BaseTS":
+    """Builds a timestamp of the given class from int nanoseconds (exact for the integer classes at their precision)"""
+    if issubclass(ts_cls, iBaseTS):
+        return ts_cls(ns // ts_cls.NANOS_PER_UNIT)
+    return ts_cls(ns, prec="ns")
+
+
+# Allen's interval algebra; relations are listed so that the inverse of the relation with code c has code 12 - c
+AllenRelation = Literal["before", "meets", "overlaps", "finished_by", "contains", "starts", "equals",
+                        "started_by", "during", "finishes", "overlapped_by", "met_by", "after"]
+ALLEN_RELATIONS: Tuple[AllenRelation, ...] = ("before", "meets", "overlaps", "finished_by", "contains", "starts", "equals",
+                                              "started_by", "during", "finishes", "overlapped_by", "met_by", "after")
+
+
+def _allen_code(start1: int, end1: int, start2: int, end2: int) -> int:
+    """Returns the code (index in ALLEN_RELATIONS) of the relation of [start1, end1] to [start2, end2], by integer comparisons"""
+    if end1 < start2:
+        return 0
+    if end1 == start2:
+        return 1
+    if start1 > end2:
+        return 12
+    if start1 == end2:
+        return 11
+    # the intervals share a positive duration: the relation follows from the order of the starts and of the ends
+    return 6 + 3 * ((start1 > start2) - (start1 < start2)) + (end1 > end2) - (end1 < end2)
+
+
+def _ts_from_sec(ts_cls: Type["BaseTS"], sec: int) -> "BaseTS":
+    """
+    Builds a timestamp of the given class from int seconds
+    :raises OverflowError: if the integer classes can't hold the timestamp in int64 units (ex: iTSns outside 1678..2262)
+    """
+    if issubclass(ts_cls, iBaseTS):
+        units = sec * ts_cls.UNITS_IN_SEC
+        if not -2 ** 63 <= units < 2 ** 63:
+            raise OverflowError(f"{sec}s can't be represented as {ts_cls.__name__} (int64 {ts_cls.PREC_STR})")
+        return int.__new__(ts_cls, units)
+    return ts_cls(sec, prec="s")
+
+
+def _ts_maker(ts_cls: Type["BaseTS"]) -> Callable[[int], "BaseTS"]:
+    """
+    Returns a function building timestamps of the given class from int nanoseconds, bypassing the parsing in __new__
+    for the int and float classes (same values as _ts_from_ns()).
+    """
+    if issubclass(ts_cls, iBaseTS):
+        nanos_per_unit, new = ts_cls.NANOS_PER_UNIT, int.__new__
+        return lambda ns: new(ts_cls, ns // nanos_per_unit)
+    if ts_cls is TS:
+        new = float.__new__
+        return lambda ns: new(TS, ns / 1_000_000_000)
+    return lambda ns: ts_cls(ns, prec="ns")
+
+
 @total_ordering
 class TSInterval:
     """
@@ -819,6 +980,8 @@ class TSInterval:
     """
 
     __slots__ = ("_start", "_end")
+    _start: BaseTS
+    _end: BaseTS
 
     def __init__(self, start: BaseTS, end: BaseTS):
         """
@@ -842,16 +1005,81 @@ class TSInterval:
             raise AttributeError("TSInterval instances are immutable")
         object.__setattr__(self, name, value)
 
+    @classmethod
+    def _from_bounds_sec(cls, bounds: Tuple[int, int], dtype: Optional[Type[BaseTS]]) -> "TSInterval":
+        if dtype is None:
+            dtype = iTS
+        return cls(_ts_from_sec(dtype, bounds[0]), _ts_from_sec(dtype, bounds[1]))
+
     @classmethod
     def from_year(cls, year: int, tz: dt_tzinfo | str = timezone.utc, dtype:Optional[Type[BaseTS]]=None) -> "TSInterval":
         """
         Create an interval covering the full calendar year in the requested timezone (defaults to UTC).
         """
+        from ._calendar import calendar_period
+        return cls._from_bounds_sec(calendar_period("year", tz, year), dtype)
+
+    @classmethod
+    def from_quarter(cls, year: int, quarter: int, tz: dt_tzinfo | str = timezone.utc, dtype: Optional[Type[BaseTS]] = None) -> "TSInterval":
+        """
+        Create an interval covering the calendar quarter (1..4) in the requested timezone (defaults to UTC).
+        """
+        from ._calendar import calendar_period
+        return cls._from_bounds_sec(calendar_period("quarter", tz, year, quarter), dtype)
+
+    @classmethod
+    def from_month(cls, year: int, month: int, tz: dt_tzinfo | str = timezone.utc, dtype: Optional[Type[BaseTS]] = None) -> "TSInterval":
+        """
+        Create an interval covering the calendar month in the requested timezone (defaults to UTC).
+        """
+        from ._calendar import calendar_period
+        return cls._from_bounds_sec(calendar_period("month", tz, year, month), dtype)
+
+    @classmethod
+    def from_week(cls, iso_year: int, iso_week: int, tz: dt_tzinfo | str = timezone.utc, dtype: Optional[Type[BaseTS]] = None) -> "TSInterval":
+        """
+        Create an interval covering the ISO week (Monday to Monday) in the requested timezone (defaults to UTC).
+        """
+        from ._calendar import calendar_period
+        return cls._from_bounds_sec(calendar_period("week", tz, iso_year, iso_week), dtype)
+
+    @classmethod
+    def from_day(cls, year: int, month: int, day: int, tz: dt_tzinfo | str = timezone.utc, dtype: Optional[Type[BaseTS]] = None) -> "TSInterval":
+        """
+        Create an interval covering the calendar day in the requested timezone (defaults to UTC); DST days last 23 or 25 hours.
+        """
+        from ._calendar import calendar_period
+        return cls._from_bounds_sec(calendar_period("day", tz, year, month, day), dtype)
+
+    @classmethod
+    def from_hour(cls, year: int, month: int, day: int, hour: int, tz: dt_tzinfo | str = timezone.utc,
+                  dtype: Optional[Type[BaseTS]] = None) -> "TSInterval":
+        """
+        Create an interval covering the local hour in the requested timezone (defaults to UTC).
+        A repeated local hour (DST end) resolves to its first occurrence, a skipped one (DST start) to the hour following the gap.
+        """
+        from ._calendar import calendar_period
+        return cls._from_bounds_sec(calendar_period("hour", tz, year, month, day, hour), dtype)
+
+    @classmethod
+    def periods(cls, span: "TSInterval", unit: str, tz: dt_tzinfo | str = timezone.utc,
+                dtype: Optional[Type[BaseTS]] = None) -> Iterator["TSInterval"]:
+        """
+        Lazily yields the consecutive calendar periods overlapping the span, ex: every local day of a year.
+        Period boundaries are computed in batches from the cached transition tables of the time zone, so they are DST-correct.
+
+        :param span: the interval to cover; the first and last periods may extend beyond it
+        :param unit: one of "year", "quarter", "month", "week" (ISO, starting on Monday), "day", "hour"
+        :param tz: time zone of the calendar (defaults to UTC)
+        :param dtype: timestamp class of the yielded bounds (defaults to the class of span.start)
+        """
+        from ._calendar import iter_periods
         if dtype is None:
-            dtype = iTS
-        start_ts = dtype.from_parts(year, 1, 1, 0, 0, 0, 0, 0, 0, tzinfo=tz)
-        end_ts = dtype.from_parts(year + 1, 1, 1, 0, 0, 0, 0, 0, 0, tzinfo=tz)
-        return cls(start_ts, end_ts)
+            dtype = type(span.start)
+        # period boundaries are whole seconds, so the span can be widened to whole seconds
+        start_s, end_s = int(span.start.as_nsec()) // 1_000_000_000, -(-int(span.end.as_nsec()) // 1_000_000_000)
+        for bounds in iter_periods(start_s, end_s, unit, tz):
+            yield cls._from_bounds_sec(bounds, dtype)
 
     @property
     def start(self) -> BaseTS:
@@ -1045,6 +1273,131 @@ class TSInterval:
             raise ValueError(f"Timestamp {ts} is not within the interval {self}")
         return TSInterval(self._start, ts), TSInterval(ts, self._end)
 
+    @staticmethod
+    def _step_spec(step: Union[dTS, timedelta, float, int]) -> Tuple[int, int]:
+        """Returns a positive step as (nanoseconds, months); numbers are seconds."""
+        if isinstance(step, dTS):
+            step_ns, months = step._delta_ns, step._months
+        elif isinstance(step, timedelta):
+            step_ns, months = (step.days * 86400 + step.seconds) * 1_000_000_000 + step.microseconds * 1_000, 0
+        elif isinstance(step, (float, int)):
+            step_ns, months = round(step * 1_000_000_000), 0
+        else:
+            raise TypeError(f"Expected a step as dTS, timedelta or number of seconds, got {type(step)}")
+        if step_ns < 0 or months < 0 or step_ns + months == 0:
+            raise ValueError(f"Step should be a positive duration: {step}")
+        return step_ns, months
+
+    def _grid_step_spec(self, step: Union[dTS, timedelta, float, int]) -> Tuple[int, int]:
+        """Like _step_spec(), but the step must also be a whole number of units of the start class, or the grid would repeat timestamps."""
+        step_ns, months = self._step_spec(step)
+        start_cls = type(self._start)
+        if issubclass(start_cls, iBaseTS) and step_ns % start_cls.NANOS_PER_UNIT:
+            raise ValueError(f"Step {step} isn't a whole number of {start_cls.__name__} units ({start_cls.PREC_STR})")
+        return step_ns, months
+
+    def range(self, step: Union[dTS, timedelta, float, int], inclusive: bool = False) -> Iterator[BaseTS]:
+        """
+        Lazily yields start, start + step, start + 2 * step, ... while before the end, as timestamps of the same class as start.
+        Month based steps (ex: dTS("1M")) are added to the start, so Jan 31 + 1M, + 2M, ... is Feb 29, Mar 31, ...
+
+        :param step: positive step as dTS, timedelta or number of seconds, a whole number of units of the start class
+        :param inclusive: also yield the end if it falls on the grid
+        """
+        step_ns, months = self._grid_step_spec(step)
+        make = _ts_maker(type(self._start))
+        start_ns, end_ns = int(self._start.as_nsec()), int(self._end.as_nsec())
+        if inclusive:
+            end_ns += 1
+        if months:
+            ts_ns, k = start_ns, 0
+            while ts_ns < end_ns:
+                yield make(ts_ns)
+                k += months
+                ts_ns = dTS._add_raw(start_ns, 0, k)
+            return
+        for ts_ns in range(start_ns, end_ns, step_ns):
+            yield make(ts_ns)
+
+    def arange(self, step: Union[dTS, timedelta, float, int], inclusive: bool = False) -> np.ndarray:
+        """
+        Returns the same timestamps as range() as an int64 array of nanoseconds, computed in one vectorised call.
+
+        :param step: positive step as dTS, timedelta or number of seconds, a whole number of units of the start class
+        :param inclusive: also include the end if it falls on the grid
+        """
+        step_ns, months = self._grid_step_spec(step)
+        start_ns, end_ns = int(self._start.as_nsec()), int(self._end.as_nsec())
+        if inclusive:
+            end_ns += 1
+        if not months:
+            return np.arange(start_ns, end_ns, step_ns, dtype=np.int64)
+        from ._calendar import DAY_NS, add_months_ns
+        # a month lasts at least 28 days, so this count of steps always reaches the end
+        count = (end_ns - start_ns) // (28 * DAY_NS * months) + 1
+        grid = add_months_ns(start_ns, np.arange(count + 1, dtype=np.int64) * months)
+        return grid[grid < end_ns]
+
+    def _make_chunks(self, bounds_ns: Iterator[int]) -> Iterator["TSInterval"]:
+        """Yields the chunks between the inner boundaries, skipping the ones empty at the precision of the start class"""
+        make = _ts_maker(type(self._start))
+        lo = self._start
+        for bound_ns in bounds_ns:
+            hi = make(bound_ns)
+            if lo < hi < self._end:
+                yield TSInterval(lo, hi)
+                lo = hi
+        yield TSInterval(lo, self._end)
+
+    def chunks(self, size: Union[dTS, timedelta, float, int], align: bool = True,
+               tz: Optional[Union[dt_tzinfo, str]] = None) -> Iterator["TSInterval"]:
+        """
+        Lazily splits the interval into consecutive chunks of the given size, ex: the days of a backfill range.
+        With align=True the inner boundaries fall on the same grid as the bars of bucket_aggregate(): sub-day sizes on the
+        UTC epoch, week multiples on Mondays, day and month multiples on the local calendar of `tz`;
+        the first and the last chunks are shorter when the interval bounds are not aligned.
+
+        :param size: positive chunk size as dTS, timedelta or number of seconds
+        :param align: align the boundaries on the grid of `size`, otherwise chunks start at start, start + size, ...
+        :param tz: time zone of the calendar used to align day and month based sizes (defaults to UTC)
+        """
+        step_ns, months = self._step_spec(size)
+        start_ns, end_ns = int(self._start.as_nsec()), int(self._end.as_nsec())
+        if align:
+            from .bucket import _bucket_bounds
+            unit = dTS(months, "M") if months else step_ns
+
+            def bounds() -> Iterator[int]:
+                bound = start_ns
+                while bound < end_ns:
+                    bound = int(_bucket_bounds(np.array([bound], dtype=np.int64), unit, tz)[1][0])
+                    yield bound
+        elif months:
+            def bounds() -> Iterator[int]:
+                k, bound = months, dTS._add_raw(start_ns, 0, months)
+                while bound < end_ns:
+                    yield bound
+                    k += months
+                    bound = dTS._add_raw(start_ns, 0, k)
+        else:
+            return self._make_chunks(iter(range(start_ns + step_ns, end_ns, step_ns)))
+        return self._make_chunks(bounds())
+
+    def split_n(self, n: int) -> List["TSInterval"]:
+        """
+        Splits the interval into n consecutive chunks of (nearly) equal duration; the remainder is spread over the chunks.
+
+        :raises ValueError: if the interval is too short to hold n chunks at the precision of its start class
+        """
+        if not isinstance(n, Integral) or n < 1:
+            raise ValueError(f"The number of chunks should be a positive integer: {n}")
+        start_ns, end_ns = int(self._start.as_nsec()), int(self._end.as_nsec())
+        duration_ns = end_ns - start_ns
+        chunks = list(self._make_chunks(start_ns + duration_ns * k // n for k in range(1, n)))
+        if len(chunks) != n:
+            raise ValueError(f"Interval {self} is too short to be split into {n} chunks")
+        return chunks
+
     def gap_to(self, other: "TSInterval") -> Optional[float]:
         """
         Get the gap (in seconds) between this interval and another.
@@ -1074,6 +1427,14 @@ class TSInterval:
         """Check if intervals are adjacent (touching but not overlapping)"""
         return self._end == other._start or other._end == self._start
 
+    def relation(self, other: "TSInterval") -> AllenRelation:
+        """
+        Returns the Allen relation of this interval to the other one, ex: "meets" when self.end == other.start,
+        "during" when self is strictly inside other; other.relation(self) is the inverse relation.
+        """
+        return ALLEN_RELATIONS[_allen_code(int(self._start.as_nsec()), int(self._end.as_nsec()),
+                                           int(other._start.as_nsec()), int(other._end.as_nsec()))]
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, TSInterval):
             return False
@@ -1096,6 +1457,293 @@ class TSInterval:
         return self.isoformat()
 
 
+@total_ordering
+class nsInterval:
+    """
+    Compact variant of TSInterval storing the bounds as int nanoseconds, along with the timestamp class of the bounds.
+    Comparisons, containment checks and hashing are plain int operations, without creating BaseTS objects;
+    start/end are rebuilt in the original class only when requested (TS bounds are kept at microsecond precision, like TS.as_nsec()).
+    The semantics of the methods are the same as for TSInterval, except that float deltas (seconds) are applied exactly
+    and gap_to() returns seconds whatever the class of the bounds.
+    """
+
+    __slots__ = ("_start_ns", "_end_ns", "_ts_cls")
+    _start_ns: int
+    _end_ns: int
+    _ts_cls: Type["BaseTS"]
+
+    def __init__(self, start: Union["BaseTS", int], end: Union["BaseTS", int], ts_cls: Optional[Type["BaseTS"]] = None):
+        """
+        :param start: Start timestamp (BaseTS or int nanoseconds)
+        :param end: End timestamp (BaseTS or int nanoseconds)
+        :param ts_cls: the class used to rebuild start/end; defaults to the class of `start`, or iTSns for int bounds
+        :raises ValueError: If start >= end
+        """
+        start_ns, end_ns = _to_ns(start), _to_ns(end)
+        if start_ns >= end_ns:
+            raise ValueError(f"Start timestamp ({start_ns}ns) must be before end timestamp ({end_ns}ns)")
+        if ts_cls is None:
+            ts_cls = iTSns if _NS_SCALES[type(start)] == _NOT_A_TS else type(start)  # type: ignore[assignment]
+        _set_start_ns(self, start_ns)
+        _set_end_ns(self, end_ns)
+        _set_ts_cls(self, ts_cls)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("nsInterval instances are immutable")
+
+    @classmethod
+    def _from_ns(cls, start_ns: int, end_ns: int, ts_cls: Type["BaseTS"]) -> "nsInterval":
+        """Builds the interval from already validated bounds"""
+        res = object.__new__(cls)
+        _set_start_ns(res, start_ns)
+        _set_end_ns(res, end_ns)
+        _set_ts_cls(res, ts_cls)
+        return res
+
+    @classmethod
+    def from_interval(cls, interval: TSInterval) -> "nsInterval":
+        return cls(interval.start, interval.end)
+
+    def to_interval(self) -> TSInterval:
+        return TSInterval(self.start, self.end)
+
+    @property
+    def start_ns(self) -> int:
+        return self._start_ns
+
+    @property
+    def end_ns(self) -> int:
+        return self._end_ns
+
+    @property
+    def start(self) -> "BaseTS":
+        """Returns the start timestamp, in the original timestamp class"""
+        return _ts_from_ns(self._ts_cls, self._start_ns)
+
+    @property
+    def end(self) -> "BaseTS":
+        """Returns the end timestamp, in the original timestamp class"""
+        return _ts_from_ns(self._ts_cls, self._end_ns)
+
+    @property
+    def duration(self) -> dTS:
+        """Returns the duration of the interval as dTS (time delta in nanoseconds)"""
+        return dTS(self._end_ns - self._start_ns, unit="ns")
+
+    @property
+    def midpoint(self) -> TS:
+        """Returns the midpoint timestamp of the interval"""
+        return TS((self._start_ns + self._end_ns) / 2e9)
+
+    def isoformat(self, stampsep: str = "/", timesep: str = "T", timespec: str = "auto") -> str:
+        """Returns ISO 8601 interval representation: start/end"""
+        return f"{self.start.isoformat(sep=timesep, timespec=timespec)}{stampsep}{self.end.isoformat(sep=timesep, timespec=timespec)}"
+
+    @property
+    def as_iso(self) -> str:
+        """Returns ISO 8601 interval representation: start/end (deprecated, use isoformat() instead)"""
+        return self.isoformat()
+
+    @property
+    def as_iso_basic(self) -> str:
+        """Returns basic ISO interval representation"""
+        return self.to_interval().as_iso_basic
+
+    @staticmethod
+    def _delta_spec(delta: Union[dTS, timedelta, float]) -> Tuple[int, int]:
+        """Returns a delta as (nanoseconds, months); numbers are seconds"""
+        if isinstance(delta, dTS):
+            return delta._delta_ns, delta._months
+        if isinstance(delta, timedelta):
+            return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000, 0
+        if isinstance(delta, (float, int)):
+            return round(delta * 1_000_000_000), 0
+        raise TypeError(f"Expected a delta as dTS, timedelta or number of seconds, got {type(delta)}")
+
+    @classmethod
+    def _add_delta(cls, ts_ns: int, delta: Union[dTS, timedelta, float], sign: int = 1) -> int:
+        delta_ns, months = cls._delta_spec(delta)
+        return dTS._add_raw(ts_ns, sign * delta_ns, sign * months)
+
+    def shift(self, delta: Union[dTS, timedelta, float]) -> "nsInterval":
+        """
+        Create a new interval shifted by a given delta.
+
+        :param delta: Time delta (dTS, timedelta, or float seconds)
+        """
+        return nsInterval(self._add_delta(self._start_ns, delta), self._add_delta(self._end_ns, delta), self._ts_cls)
+
+    def expand(self, before: Union[dTS, timedelta, float] = 0, after: Union[dTS, timedelta, float] = 0) -> "nsInterval":
+        """
+        Create a new interval expanded by given deltas.
+
+        :param before: Expand before start (dTS, timedelta, or float seconds)
+        :param after: Expand after end (dTS, timedelta, or float seconds)
+        """
+        return nsInterval(self._add_delta(self._start_ns, before, -1), self._add_delta(self._end_ns, after), self._ts_cls)
+
+    def shrink(self, from_start: Union[dTS, timedelta, float] = 0, from_end: Union[dTS, timedelta, float] = 0) -> "nsInterval":
+        """
+        Create a new interval shrunk by given deltas from each end.
+
+        :param from_start: Shrink from start (dTS, timedelta, or float seconds)
+        :param from_end: Shrink from end (dTS, timedelta, or float seconds)
+        :raises ValueError: If resulting interval would be invalid
+        """
+        return nsInterval(self._add_delta(self._start_ns, from_start), self._add_delta(self._end_ns, from_end, -1), self._ts_cls)
+
+    def split(self, ts: Union["BaseTS", int]) -> Tuple["nsInterval", "nsInterval"]:
+        """
+        Split the interval at a given timestamp (BaseTS or int nanoseconds) into two intervals.
+
+        :raises ValueError: If timestamp is not strictly within the interval
+        """
+        ts_ns = _to_ns(ts)
+        if not self._start_ns < ts_ns < self._end_ns:
+            raise ValueError(f"Timestamp {ts} is not within the interval {self}")
+        return self._from_ns(self._start_ns, ts_ns, self._ts_cls), self._from_ns(ts_ns, self._end_ns, self._ts_cls)
+
+    def gap_to(self, other: "nsInterval") -> float:
+        """
+        Get the gap (in seconds) between this interval and another.
+        Returns 0 if intervals touch, negative (the overlap duration) if they overlap.
+        """
+        if self._end_ns <= other._start_ns:
+            return (other._start_ns - self._end_ns) / 1e9
+        if other._end_ns <= self._start_ns:
+            return (self._start_ns - other._end_ns) / 1e9
+        return -(min(self._end_ns, other._end_ns) - max(self._start_ns, other._start_ns)) / 1e9
+
+    def contains(self, ts: Union["BaseTS", int]) -> bool:
+        """
+        Check if a timestamp (BaseTS or int nanoseconds) is within this interval (inclusive on both ends).
+        """
+        return self._start_ns <= _to_ns(ts) <= self._end_ns
+
+    def __contains__(self, ts: Union["BaseTS", int]) -> bool:
+        return self.contains(ts)
+
+    def contains_exclusive(self, ts: Union["BaseTS", int]) -> bool:
+        """Check if a timestamp (BaseTS or int nanoseconds) is strictly within this interval"""
+        return self._start_ns < _to_ns(ts) < self._end_ns
+
+    def overlaps(self, other: "nsInterval") -> bool:
+        """Check if this interval overlaps with another interval"""
+        return self._start_ns < other._end_ns and self._end_ns > other._start_ns
+
+    def overlaps_inclusive(self, other: "nsInterval") -> bool:
+        """Check if intervals overlap or touch (inclusive boundaries)"""
+        return self._start_ns <= other._end_ns and self._end_ns >= other._start_ns
+
+    def intersection(self, other: "nsInterval") -> Optional["nsInterval"]:
+        """Get the intersection of this interval with another interval, or None if they don't overlap"""
+        if not self.overlaps(other):
+            return None
+        return self._from_ns(max(self._start_ns, other._start_ns), min(self._end_ns, other._end_ns), self._ts_cls)
+
+    def union(self, other: "nsInterval") -> Optional["nsInterval"]:
+        """Get the union of this interval with another interval (only if they overlap or touch), otherwise None"""
+        if not self.overlaps_inclusive(other):
+            return None
+        return self._from_ns(min(self._start_ns, other._start_ns), max(self._end_ns, other._end_ns), self._ts_cls)
+
+    def __and__(self, other: object) -> Optional["nsInterval"]:
+        if not isinstance(other, nsInterval):
+            return NotImplemented
+        return self.intersection(other)
+
+    def __or__(self, other: object) -> Optional["nsInterval"]:
+        if not isinstance(other, nsInterval):
+            return NotImplemented
+        return self.union(other)
+
+    def is_before(self, other: "nsInterval") -> bool:
+        """Check if this interval is completely before another interval"""
+        return self._end_ns <= other._start_ns
+
+    def is_after(self, other: "nsInterval") -> bool:
+        """Check if this interval is completely after another interval"""
+        return self._start_ns >= other._end_ns
+
+    def is_adjacent_to(self, other: "nsInterval") -> bool:
+        """Check if intervals are adjacent (touching but not overlapping)"""
+        return self._end_ns == other._start_ns or other._end_ns == self._start_ns
+
+    def relation(self, other: "nsInterval") -> AllenRelation:
+        """Returns the Allen relation of this interval to the other one, see TSInterval.relation()"""
+        return ALLEN_RELATIONS[_allen_code(self._start_ns, self._end_ns, other._start_ns, other._end_ns)]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, nsInterval):
+            return False
+        return self._start_ns == other._start_ns and self._end_ns == other._end_ns
+
+    def __lt__(self, other: "nsInterval") -> bool:
+        if not isinstance(other, nsInterval):
+            return NotImplemented
+        if self._start_ns != other._start_ns:
+            return self._start_ns < other._start_ns
+        return self._end_ns < other._end_ns
+
+    def __hash__(self) -> int:
+        # same hash as the equivalent TSInterval
+        return hash((self._start_ns, self._end_ns))
+
+    def __reduce__(self) -> Tuple[Callable[..., "nsInterval"], Tuple[int, int, Type["BaseTS"]]]:
+        return nsInterval._from_ns, (self._start_ns, self._end_ns, self._ts_cls)
+
+    def __repr__(self) -> str:
+        return f"nsInterval({self.start.isoformat()!r}, {self.end.isoformat()!r})"
+
+    def __str__(self) -> str:
+        return self.isoformat()
+
+
+# nsInterval is immutable: the slots are set through their descriptors, which is cheaper than object.__setattr__()
+_set_start_ns = vars(nsInterval)["_start_ns"].__set__
+_set_end_ns = vars(nsInterval)["_end_ns"].__set__
+_set_ts_cls = vars(nsInterval)["_ts_cls"].__set__
+
+_FLOAT_TS = 0
+_NOT_A_TS = -1
+
+
+class _NsScales(dict):
+    """
+    Nanoseconds per unit of the types of interval bounds, computed once per type so that converting a bound
+    costs a dict lookup instead of isinstance() checks against the BaseTS ABC;
+    _FLOAT_TS for the other BaseTS classes (converted with as_nsec()) and _NOT_A_TS for plain numbers.
+    """
+
+    def __missing__(self, tp: type) -> int:
+        if issubclass(tp, iBaseTS):
+            scale = tp.NANOS_PER_UNIT
+        elif issubclass(tp, BaseTS):
+            scale = _FLOAT_TS
+        else:
+            scale = _NOT_A_TS
+        self[tp] = scale
+        return scale
+
+
+_NS_SCALES = _NsScales()
+
+
+def _to_ns(ts: Any) -> int:
+    """
+    Returns the timestamp (BaseTS or int nanoseconds) as a plain int of nanoseconds,
+    without creating an intermediate iTSns for the integer classes
+    """
+    if type(ts) is int:
+        return ts
+    scale = _NS_SCALES[type(ts)]
+    if scale > 0:
+        return int.__int__(ts) * scale
+    if scale == _FLOAT_TS:
+        return int.__int__(ts.as_nsec())
+    return int(ts)
+
+
 class iBaseTS(BaseTS, int):
     UNITS_IN_SEC: int
     UNITS_IN_MS: int
@@ -1162,8 +1810,22 @@ class iBaseTS(BaseTS, int):
         # ceiled_int = math.ceil(self / unit) * unit
         return type(self)(ceiled_int)
 
+    def _to_units(self, units_in_sec: int, rounding: Rounding) -> int:
+        """Exact integer conversion, without going through float seconds"""
+        value = int.__int__(self)
+        if units_in_sec >= self.UNITS_IN_SEC:
+            # exact, but the rounding mode is validated like for the lossy conversions
+            _check_rounding(rounding)
+            return value * (units_in_sec // self.UNITS_IN_SEC)
+        return _div_round(value, self.UNITS_IN_SEC // units_in_sec, rounding)
+
     @override
-    def as_nsec(self) -> "iTSns":
+    def as_nsec(self, rounding: Optional[Rounding] = None) -> "iTSns":
+        """
+        Converts to iTSns; this is always exact, `rounding` is accepted for symmetry with the other conversions
+        """
+        if rounding is not None:
+            _check_rounding(rounding)
         return iTSns(self * self.NANOS_PER_UNIT)
 
     def __int__(self) -> int:
@@ -1195,16 +1857,39 @@ class iBaseTS(BaseTS, int):
         d = x - int(self)
         return type(self)(d)
 
+    def _ns(self) -> int:
+        return int.__int__(self) * self.NANOS_PER_UNIT
+
+    # timestamps of the same class compare as plain ints, the others through their int nanoseconds
     def __lt__(self, o: object) -> bool:
+        if type(o) is type(self):
+            return int.__lt__(self, o)
         if isinstance(o, BaseTS):
-            return int.__lt__(self.as_nsec(), o.as_nsec())
+            return int.__int__(self) * self.NANOS_PER_UNIT < o._ns()
         if isinstance(o, Real):
             return int(self) < o
         return False
 
+    def __le__(self, o: object) -> bool:
+        if type(o) is type(self):
+            return int.__le__(self, o)
+        return BaseTS.__le__(self, o)
+
+    def __gt__(self, o: object) -> bool:
+        if type(o) is type(self):
+            return int.__gt__(self, o)
+        return BaseTS.__gt__(self, o)
+
+    def __ge__(self, o: object) -> bool:
+        if type(o) is type(self):
+            return int.__ge__(self, o)
+        return BaseTS.__ge__(self, o)
+
     def __eq__(self, o: object) -> bool:
+        if type(o) is type(self):
+            return int.__eq__(self, o)
         if isinstance(o, BaseTS):
-            return int.__eq__(self.as_nsec(), o.as_nsec())
+            return int.__int__(self) * self.NANOS_PER_UNIT == o._ns()
         if isinstance(o, Real):
             return int.__eq__(int(self), o)
         return False
@@ -1213,9 +1898,8 @@ class iBaseTS(BaseTS, int):
         return not self.__eq__(o)
 
     def __hash__(self) -> int:
-        # Keep hash consistent with __eq__ which compares nanoseconds via as_nsec()
-        nsec = self.as_nsec()
-        return int.__hash__(nsec)
+        # Keep hash consistent with __eq__ which compares nanoseconds
+        return int.__hash__(int.__int__(self) * self.NANOS_PER_UNIT)
 
 
 class iTS(iBaseTS):
@@ -1248,7 +1932,9 @@ class iTS(iBaseTS):
         int_val = round(float_val)
         return int.__new__(cls, int_val)
 
-    def as_sec(self) -> "iTS":
+    def as_sec(self, rounding: Optional[Rounding] = None) -> "iTS":
+        if rounding is not None:
+            _check_rounding(rounding)
         return self
 
     def _get_auto_timespec(self) -> str:
@@ -1304,7 +1990,9 @@ class iTSms(iBaseTS):
         int_val = round(float_val * cls.UNITS_IN_SEC)
         return int.__new__(cls, int_val)
 
-    def as_msec(self) -> "iTSms":
+    def as_msec(self, rounding: Optional[Rounding] = None) -> "iTSms":
+        if rounding is not None:
+            _check_rounding(rounding)
         return self
 
     def as_dt(self, tz: dt_tzinfo | str = timezone.utc) -> datetime:
@@ -1372,7 +2060,9 @@ class iTSus(iBaseTS):
             int_val = round(float_val * cls.UNITS_IN_SEC)
         return int.__new__(cls, int_val)
 
-    def as_usec(self) -> "iTSus":
+    def as_usec(self, rounding: Optional[Rounding] = None) -> "iTSus":
+        if rounding is not None:
+            _check_rounding(rounding)
         return self
 
     def _get_auto_timespec(self) -> str:
@@ -1459,7 +2149,9 @@ class iTSns(iBaseTS):
         i = cls.ns_timestamp_from_iso(ts, utc)
         return cls(i)
 
-    def as_nsec(self) -> "iTSns":
+    def as_nsec(self, rounding: Optional[Rounding] = None) -> "iTSns":
+        if rounding is not None:
+            _check_rounding(rounding)
         return self
 
     def isoformat(self, sep='T', timespec="auto") -> str:
@@ -1497,11 +2189,15 @@ class iTSns(iBaseTS):
         # For other timespec values, use the base class implementation
         return super().isoformat(sep=sep, timespec=timespec)
 
-    def as_usec(self) -> "iTSus":
+    def as_usec(self, rounding: Optional[Rounding] = None) -> "iTSus":
         """
         Converts to iTSus (integer timestamp in microseconds)
         Note: it will round the timestamp to microseconds
+
+        :param rounding: None (default, rounds half down) or one of "half_up", "half_even", "floor", "ceil"
         """
+        if rounding is not None:
+            return iTSus(self._to_units(1_000_000, rounding))
         us, ns = divmod(self, 1_000)
         if ns > 500:
             us += 1